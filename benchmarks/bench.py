@@ -0,0 +1,284 @@
+"""
+Offline end-to-end benchmarks
+Runs v1 and v2 against local Google-Forms-style fixtures in headless Chrome with a
+fake Gemini model, reports wall time, LLM calls, WebDriver commands and questions/s,
+and compares them with a baseline recorded by --save-baseline
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from fixture_server import start_fixture_server
+
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+FIXTURES_DIR = os.path.join(BENCH_DIR, 'fixtures')
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baseline.json')
+RESULT_MARKER = "BENCH_RESULT "
+
+# Each scenario runs in its own process (v1 and v2 both have a main.py) with the
+# app's config.json plus these overrides
+SCENARIOS = {
+    "v2-sequential": {"version": "v2", "form": "survey", "config": {"answer_mode": "sequential"}},
+    "v2-batch": {"version": "v2", "form": "survey", "config": {"answer_mode": "batch"}},
+    "v2-concurrent": {"version": "v2", "form": "survey", "config": {"answer_mode": "concurrent"}},
+    "v2-legacy-extraction": {"version": "v2", "form": "survey",
+                             "config": {"extraction_mode": "legacy", "schema_cache": {"enabled": False}}},
+    "v1": {"version": "v1", "form": "survey", "questions": "survey_v1_questions.json", "config": {}},
+}
+
+# Applied to every scenario: nothing carried over between runs, WebDriver commands counted, and the
+# optional features (off in config.json) pinned on, local generators with a fixed seed
+BENCH_CONFIG = {
+    "gemini_api_key": "offline-benchmark",
+    "pacing": "fast",
+    "button_memo_path": "button_memo.json",
+    "answer_cache": {"enabled": False},
+    "rate_limit": {"requests_per_minute": None, "tokens_per_minute": None, "shared_state": None},
+    "schema_cache": {"enabled": True, "directory": "schema_cache"},
+    "local_generators": {"enabled": True, "seed": 0},
+    "checkpoint": {"enabled": True, "directory": "checkpoints"},
+    "tracing": {"enabled": True, "output_dir": "traces"},
+}
+
+# (metric, direction): -1 lower is better, 1 higher is better
+METRICS = [
+    ("wall_seconds", -1),
+    ("llm_calls", -1),
+    ("webdriver_commands", -1),
+    ("questions_per_second", 1),
+]
+
+
+def merge_config(base, overrides):
+    """Copy of base with overrides applied (nested dicts merged one level deep)"""
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = dict(merged[key], **value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def create_headless_driver(chromedriver_path=None):
+    """Headless Chrome (Selenium Manager finds a driver when no path is given)"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--window-size=1280,2000")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    service = Service(executable_path=chromedriver_path) if chromedriver_path else Service()
+    return webdriver.Chrome(service=service, options=options)
+
+
+def run_worker(name, args):
+    """Run one scenario in this process and print its metrics as a RESULT_MARKER line"""
+    scenario = SCENARIOS[name]
+    app_dir = os.path.join(REPO_DIR, scenario['version'])
+    workdir = tempfile.mkdtemp(prefix=f"bench-{name}-")
+    sys.path.insert(0, app_dir)
+    os.chdir(workdir)
+
+    with open(os.path.join(app_dir, 'config.json'), 'r', encoding='utf-8') as f:
+        config = merge_config(merge_config(json.load(f), BENCH_CONFIG), scenario['config'])
+    with open('config.json', 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=2)
+    form_url = f"{args.base_url}/forms/{scenario['form']}/viewform?delay={args.page_delay_ms}"
+
+    import google.generativeai as genai
+    from fake_llm import install
+    fake_model = install(genai, args.latency, args.jitter, args.seed)
+
+    started = time.perf_counter()
+    driver = create_headless_driver(args.chromedriver)
+    startup_seconds = time.perf_counter() - started
+    try:
+        if scenario['version'] == 'v2':
+            from main import SmartGoogleFormAutofill
+            app = SmartGoogleFormAutofill('config.json', driver=driver)
+            started = time.perf_counter()
+            result = app.fill_form_smart(form_url)
+            wall_seconds = time.perf_counter() - started
+            questions = result['answered']
+            status = result['status']
+        else:
+            from main import GoogleFormAutofill
+            with open(os.path.join(FIXTURES_DIR, scenario['questions']), 'r', encoding='utf-8') as f:
+                questions_data = json.load(f)
+            questions_data['form_url'] = form_url
+            with open('questions.json', 'w', encoding='utf-8') as f:
+                json.dump(questions_data, f, ensure_ascii=False, indent=2)
+            app = GoogleFormAutofill('config.json', 'questions.json', driver=driver)
+            started = time.perf_counter()
+            app.fill_form()
+            wall_seconds = time.perf_counter() - started
+            questions = sum(len(section) for section in questions_data['sections'])
+            status = None
+        webdriver_commands = app.tracer.webdriver_commands
+        if status is None:
+            status = "submitted" if "formResponse" in driver.current_url else "incomplete"
+        app.close()
+    finally:
+        driver.quit()
+
+    metrics = {
+        "status": status,
+        "startup_seconds": round(startup_seconds, 3),
+        "wall_seconds": round(wall_seconds, 3),
+        "questions": questions,
+        "questions_per_second": round(questions / wall_seconds, 3) if wall_seconds else 0.0,
+        "webdriver_commands": webdriver_commands,
+    }
+    metrics.update(fake_model.stats())
+    print(RESULT_MARKER + json.dumps(metrics))
+
+
+def run_scenario(name, base_url, args):
+    """Run one scenario in a fresh process; returns its metrics dict"""
+    command = [
+        sys.executable, os.path.abspath(__file__), "--worker", name, "--base-url", base_url,
+        "--latency", str(args.latency), "--jitter", str(args.jitter), "--seed", str(args.seed),
+        "--page-delay-ms", str(args.page_delay_ms),
+    ]
+    if args.chromedriver:
+        command += ["--chromedriver", args.chromedriver]
+    proc = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          universal_newlines=True, encoding='utf-8', timeout=args.timeout)
+    if args.verbose:
+        print(proc.stdout)
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER):])
+    tail = "\n".join(proc.stdout.splitlines()[-15:])
+    raise RuntimeError(f"{name} produced no result (exit code {proc.returncode}):\n{tail}")
+
+
+def summarize(runs):
+    """Median of every numeric metric over repeated runs"""
+    summary = {"runs": len(runs), "status": runs[-1]['status']}
+    for key, value in runs[0].items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            summary[key] = round(statistics.median(run[key] for run in runs), 3)
+    return summary
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare(results, baseline, max_regression):
+    """Print current vs baseline per metric; returns the list of regressions"""
+    regressions = []
+    scenarios = (baseline or {}).get('scenarios', {})
+    print(f"\n{'scenario':<22} {'metric':<22} {'baseline':>10} {'current':>10} {'change':>8}")
+    print("-" * 76)
+    for name, metrics in results.items():
+        base = scenarios.get(name, {})
+        for metric, direction in METRICS:
+            current = metrics.get(metric)
+            previous = base.get(metric)
+            if previous:
+                change = (current - previous) / previous
+                flag = ""
+                if -direction * change > max_regression:
+                    flag = " ⚠"
+                    regressions.append((name, metric, previous, current))
+                print(f"{name:<22} {metric:<22} {previous:>10} {current:>10} {change:>+7.0%}{flag}")
+            else:
+                print(f"{name:<22} {metric:<22} {'-':>10} {current:>10} {'':>8}")
+        if metrics.get('status') != 'submitted':
+            print(f"{name:<22} ⚠ status: {metrics.get('status')}")
+    return regressions
+
+
+def main():
+    """Run scenarios, compare with the baseline, optionally save a new baseline"""
+    parser = argparse.ArgumentParser(description="Offline v1/v2 benchmarks (local fixtures, fake Gemini)")
+    parser.add_argument("scenarios", nargs="*", help=f"Scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario (median is reported)")
+    parser.add_argument("--latency", type=float, default=0.3, help="Fake Gemini latency per call (seconds)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+/- random latency added per call (seconds)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the latency jitter")
+    parser.add_argument("--page-delay-ms", type=int, default=120, help="Simulated section round trip in the fixture")
+    parser.add_argument("--chromedriver", default=os.environ.get("CHROMEDRIVER"),
+                        help="ChromeDriver path (default: $CHROMEDRIVER, else Selenium Manager)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="Write these results as the new baseline")
+    parser.add_argument("--max-regression", type=float, default=0.15,
+                        help="Fail when a metric is worse than the baseline by more than this fraction")
+    parser.add_argument("--ci", action="store_true", help="Fail when there is no baseline to compare with")
+    parser.add_argument("--output", help="Also write results JSON here")
+    parser.add_argument("--timeout", type=int, default=600, help="Seconds before a scenario run is aborted")
+    parser.add_argument("--verbose", action="store_true", help="Show the apps' own output")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args)
+        return 0
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    settings = {"latency": args.latency, "jitter": args.jitter, "page_delay_ms": args.page_delay_ms}
+    server, base_url = start_fixture_server()
+    print(f"🌐 Fixtures at {base_url} | fake Gemini latency {args.latency}s | {args.repeat} run(s) per scenario")
+
+    results = {}
+    try:
+        for name in names:
+            runs = []
+            for attempt in range(1, args.repeat + 1):
+                metrics = run_scenario(name, base_url, args)
+                runs.append(metrics)
+                print(f"   {name} #{attempt}: {metrics['wall_seconds']:.2f}s, {metrics['llm_calls']} LLM calls, "
+                      f"{metrics['webdriver_commands']} WebDriver commands, {metrics['status']}")
+            results[name] = summarize(runs)
+    finally:
+        server.shutdown()
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None and not args.save_baseline:
+        print(f"\n⚠ No baseline at {args.baseline}, nothing to compare with (record one with --save-baseline)")
+    if baseline and baseline.get('settings') != settings:
+        print(f"\n⚠ Baseline was recorded with {baseline.get('settings')}, comparing anyway")
+    regressions = compare(results, baseline, args.max_regression)
+
+    report = {"settings": settings, "scenarios": results}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        if baseline:
+            report["scenarios"] = dict(baseline.get('scenarios', {}), **results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Baseline saved to {args.baseline}")
+        return 0
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} metric(s) regressed more than {args.max_regression:.0%}")
+        return 1
+    if baseline is None:
+        return 1 if args.ci else 0
+    print("\n✅ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""
+Offline stand-in for genai.GenerativeModel
+Answers the prompts built by v1/v2 with deterministic, parseable replies after a
+configurable latency, and counts calls across threads
+"""
+
+import random
+import re
+import threading
+import time
+
+
+# First matching rule wins; checked against the part of the prompt after the context block
+TEXT_ANSWERS = [
+    (("email",), "an.nguyen@example.com"),
+    (("phone", "tel"), "0901234567"),
+    (("name", "tên"), "Nguyen Van An"),
+    (("year", "năm"), "2026"),
+    (("age", "tuổi"), "21"),
+]
+
+
+class FakeResponse:
+    """Minimal GenerateContentResponse: only .text is used by the apps"""
+
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeGenerativeModel:
+    """Drop-in for genai.GenerativeModel with simulated latency"""
+
+    latency = 0.0
+    jitter = 0.0
+    lock = threading.Lock()
+    calls = 0
+    prompt_chars = 0
+    busy_seconds = 0.0
+    _random = random.Random(0)
+
+    def __init__(self, model_name='fake', *args, **kwargs):
+        self.model_name = model_name
+
+    @classmethod
+    def configure(cls, latency=0.0, jitter=0.0, seed=0):
+        """Set latency (seconds) and +/- jitter for every instance, reset counters"""
+        cls.latency = latency
+        cls.jitter = jitter
+        cls._random = random.Random(seed)
+        cls.calls = 0
+        cls.prompt_chars = 0
+        cls.busy_seconds = 0.0
+
+    @classmethod
+    def stats(cls):
+        return {"llm_calls": cls.calls, "llm_prompt_chars": cls.prompt_chars,
+                "llm_seconds": round(cls.busy_seconds, 3)}
+
+    def generate_content(self, prompt, stream=False, **kwargs):
+        """Sleep the simulated latency, then answer like Gemini would
+
+        With stream=True returns an iterator of chunk responses, the latency spread over the chunks.
+        """
+        cls = type(self)
+        with cls.lock:
+            delay = max(0.0, cls.latency + cls._random.uniform(-cls.jitter, cls.jitter))
+            cls.calls += 1
+            cls.prompt_chars += len(prompt)
+            cls.busy_seconds += delay
+        if stream:
+            return _stream(answer_for(prompt), delay)
+        if delay:
+            time.sleep(delay)
+        return FakeResponse(answer_for(prompt))
+
+
+QUESTION_LINE = re.compile(r"^Question\b", re.MULTILINE)
+
+
+def _stream(text, delay, words_per_chunk=4):
+    """Yield text in word groups, sleeping an equal share of delay before each"""
+    words = text.split(" ")
+    chunks = [" ".join(words[i:i + words_per_chunk]) for i in range(0, len(words), words_per_chunk)]
+    for i, chunk in enumerate(chunks):
+        time.sleep(delay / len(chunks))
+        yield FakeResponse(chunk if i == len(chunks) - 1 else chunk + " ")
+
+
+def _question_part(prompt):
+    """Text from the question line on, so instructions and earlier answers do not steer the reply"""
+    matches = list(QUESTION_LINE.finditer(prompt))
+    return prompt[matches[-1].start():] if matches else prompt
+
+
+def _section_answer(prompt):
+    """JSON object for a batch prompt, one valid answer per [n] (type) block"""
+    answers = []
+    blocks = re.split(r"\n(?=\[\d+\] \()", prompt)
+    for block in blocks:
+        head = re.match(r"\[(\d+)\] \((\w+)\) ([^\n]*)", block)
+        if not head:
+            continue
+        index, q_type, question = head.groups()
+        if q_type == "matrix":
+            rows = len(re.findall(r"\n\s+row \d+:", block))
+            value = "[" + ", ".join('"1"' for _ in range(rows)) + "]"
+        elif q_type in ("radio", "dropdown", "checkbox"):
+            value = '"1"'
+        else:
+            value = '"' + _simple_answer(q_type, question) + '"'
+        answers.append(f'"{index}": {value}')
+    return "{" + ", ".join(answers) + "}"
+
+
+def _simple_answer(q_type, question):
+    question = question.lower()
+    if q_type == "date":
+        return "2024-01-15"
+    if q_type == "time":
+        return "09:30"
+    if q_type == "number":
+        return "21"
+    if q_type == "tel":
+        return "0901234567"
+    for words, answer in TEXT_ANSWERS:
+        if any(re.search(r"\b" + word + r"\b", question) for word in words):
+            return answer
+    return "Everything was clear and well organized."
+
+
+def answer_for(prompt):
+    """Deterministic reply in the format the prompt asks for"""
+    if "JSON object mapping each question number" in prompt:
+        return _section_answer(prompt)
+    question = _question_part(prompt)
+    if "JSON array of column numbers" in question:
+        rows = len(re.findall(r"\nRow \d+:", question))
+        return "[" + ", ".join("4" for _ in range(rows)) + "]"
+    if "comma-separated numbers" in question:
+        return "1,2"
+    if "Rating scale" in question:
+        return "4"
+    if "ONLY the number of the best option" in question or "ONLY the option number" in question:
+        return "1"
+    if "YYYY-MM-DD" in question:
+        return "2024-01-15"
+    if "HH:MM" in question:
+        return "09:30"
+    if "Numeric field" in question:
+        return "21"
+    if "Phone number field" in question:
+        return "0901234567"
+    first_line = question.split("\n", 1)[0]
+    return _simple_answer("text", first_line)
+
+
+def install(genai, latency=0.0, jitter=0.0, seed=0):
+    """Replace genai.GenerativeModel (and configure) with the fake"""
+    FakeGenerativeModel.configure(latency, jitter, seed)
+    genai.GenerativeModel = FakeGenerativeModel
+    genai.configure = lambda *args, **kwargs: None
+    return FakeGenerativeModel
@@ -0,0 +1,86 @@
+"""
+Local Google-Forms-style fixture server
+Serves benchmarks/fixtures/<name>.html at /forms/<name>/viewform and a confirmation
+page at /forms/<name>/formResponse, optionally delaying every response
+"""
+
+import argparse
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """GET/POST handler for viewform and formResponse routes"""
+
+    fixtures_dir = FIXTURES_DIR
+    latency = 0.0
+
+    def _send_file(self, path, status=200):
+        with open(path, 'rb') as f:
+            body = f.read()
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self):
+        if self.latency:
+            time.sleep(self.latency)
+        parts = urlparse(self.path).path.strip('/').split('/')
+        if len(parts) == 3 and parts[0] == 'forms':
+            name, page = parts[1], parts[2]
+            form_path = os.path.join(self.fixtures_dir, f"{os.path.basename(name)}.html")
+            if page == 'viewform' and os.path.exists(form_path):
+                return self._send_file(form_path)
+            if page == 'formResponse' and os.path.exists(form_path):
+                return self._send_file(os.path.join(self.fixtures_dir, 'confirmation.html'))
+        self.send_error(404)
+
+    def do_GET(self):
+        self._route()
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        self.rfile.read(length)
+        self._route()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fixture_server(port=0, latency=0.0, fixtures_dir=FIXTURES_DIR):
+    """Serve fixtures on a daemon thread; returns (server, base_url)"""
+    handler = type('BoundFixtureHandler', (FixtureHandler,), {"latency": latency, "fixtures_dir": fixtures_dir})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    """Serve fixtures until interrupted (for opening them in a normal browser)"""
+    parser = argparse.ArgumentParser(description="Serve Google-Forms-style benchmark fixtures")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to delay every response")
+    args = parser.parse_args()
+
+    server, base_url = start_fixture_server(args.port, args.latency)
+    print(f"🌐 Serving fixtures at {base_url}/forms/<name>/viewform (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
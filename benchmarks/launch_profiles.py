@@ -0,0 +1,107 @@
+"""
+Chrome launch profile comparison
+Loads a form repeatedly with each browser launch profile (v2/browser.py) and reports
+page load time, Chrome memory (ChromeDriver plus all Chrome processes) and what the
+performance profile saves
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from fixture_server import start_fixture_server
+
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, os.path.join(REPO_DIR, 'v2'))
+
+from browser import LAUNCH_PROFILES, create_driver, driver_rss_mb
+
+# Same condition as ReadinessWaiter.wait_for_page_ready for a form page
+FORM_READY_SCRIPT = (
+    "return document.readyState !== 'loading' && !!document.querySelector(\"div[role='listitem']\")"
+)
+
+
+def load_seconds(driver, url, timeout):
+    """Seconds from driver.get until the form's questions are in the DOM"""
+    driver.get("about:blank")
+    started = time.perf_counter()
+    driver.get(url)
+    deadline = started + timeout
+    while not driver.execute_script(FORM_READY_SCRIPT):
+        if time.perf_counter() > deadline:
+            raise TimeoutError(f"form not ready after {timeout}s: {url}")
+        time.sleep(0.02)
+    return time.perf_counter() - started
+
+
+def measure(profile, url, args):
+    """Median page load and RSS over args.repeat fresh browsers with this profile"""
+    browser_config = {"profile": profile}
+    if args.headless:
+        browser_config["headless"] = True
+    config = {"chromedriver_path": args.chromedriver, "browser": browser_config}
+    loads, rss = [], []
+    for _ in range(args.repeat):
+        driver = create_driver(config)
+        try:
+            loads.extend(load_seconds(driver, url, args.timeout) for _ in range(args.loads))
+            memory = driver_rss_mb(driver)
+            if memory is not None:
+                rss.append(memory)
+        finally:
+            driver.quit()
+    return {
+        "page_load_seconds": statistics.median(loads),
+        "rss_mb": statistics.median(rss) if rss else None,
+    }
+
+
+def main():
+    """Compare launch profiles on the local fixture form (or --url)"""
+    parser = argparse.ArgumentParser(description="Compare Chrome launch profiles (page load time and memory)")
+    parser.add_argument("--url", help="Form to load (default: the local survey fixture)")
+    parser.add_argument("--profiles", nargs="+", default=list(LAUNCH_PROFILES), choices=list(LAUNCH_PROFILES))
+    parser.add_argument("--repeat", type=int, default=3, help="Browsers launched per profile")
+    parser.add_argument("--loads", type=int, default=3, help="Page loads per browser")
+    parser.add_argument("--headless", action="store_true",
+                        help="Run every profile headless (for hosts without a display)")
+    parser.add_argument("--chromedriver", default=os.environ.get("CHROMEDRIVER"),
+                        help="ChromeDriver path (default: $CHROMEDRIVER, else Selenium Manager)")
+    parser.add_argument("--timeout", type=float, default=30, help="Seconds to wait for one page load")
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if not url:
+        server, base_url = start_fixture_server()
+        url = f"{base_url}/forms/survey/viewform?delay=0"
+    print(f"🌐 Loading {url} | {args.repeat} browser(s) x {args.loads} load(s) per profile")
+
+    results = {}
+    try:
+        for profile in args.profiles:
+            results[profile] = measure(profile, url, args)
+            rss = results[profile]["rss_mb"]
+            print(f"   {profile:<12} page load {results[profile]['page_load_seconds']:.3f}s, "
+                  f"RSS {f'{rss:.0f} MB' if rss is not None else 'unknown'}")
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    if "default" in results and "performance" in results:
+        before, after = results["default"], results["performance"]
+        saved_seconds = before["page_load_seconds"] - after["page_load_seconds"]
+        print(f"\n⚡ performance profile saves {saved_seconds:.3f}s per page load "
+              f"({saved_seconds / before['page_load_seconds']:.0%})")
+        if before["rss_mb"] is not None and after["rss_mb"] is not None:
+            saved_mb = before["rss_mb"] - after["rss_mb"]
+            print(f"🧠 and {saved_mb:.0f} MB per browser ({saved_mb / before['rss_mb']:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
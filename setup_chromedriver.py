@@ -1,208 +1,427 @@
+"""
+ChromeDriver setup
+Finds the installed Chrome (Windows, macOS, Linux), resolves the matching ChromeDriver through
+the per-milestone Chrome for Testing endpoint (ETag-cached) and installs it from a local
+content-addressed cache, so a warm re-run makes no downloads
+"""
+
+import argparse
+import hashlib
+import json
 import os
-import sys
-import zipfile
-import requests
+import platform
+import plistlib
+import re
+import shutil
+import struct
 import subprocess
-import json
-from pathlib import Path
+import sys
+import time
+import urllib.error
+import urllib.request
+import zlib
+
+
+API_BASE_URL = "https://googlechromelabs.github.io/chrome-for-testing"
+DOWNLOAD_BASE_URL = "https://storage.googleapis.com/chrome-for-testing-public"
+MAX_AGE_SECONDS = 3600  # LATEST_RELEASE answers reused without asking the server
+CHUNK_SIZE = 64 * 1024
+
+WINDOWS_CHROME_PATHS = [
+    r"%PROGRAMFILES%\Google\Chrome\Application\chrome.exe",
+    r"%PROGRAMFILES(X86)%\Google\Chrome\Application\chrome.exe",
+    r"%LOCALAPPDATA%\Google\Chrome\Application\chrome.exe",
+]
+MAC_CHROME_APPS = [
+    "/Applications/Google Chrome.app",
+    "~/Applications/Google Chrome.app",
+    "/Applications/Google Chrome for Testing.app",
+    "/Applications/Chromium.app",
+]
+LINUX_CHROME_COMMANDS = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+
+VERSION_PATTERN = re.compile(r"(\d+\.\d+\.\d+\.\d+)")
+
+
+def default_cache_dir():
+    """Per-user cache directory for this platform"""
+    if sys.platform == "win32":
+        root = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        root = os.path.expanduser("~/Library/Caches")
+    else:
+        root = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(root, "autofill-chromedriver")
+
+
+def driver_platform():
+    """Chrome for Testing platform name of this machine"""
+    machine = platform.machine().lower()
+    if sys.platform == "win32":
+        return "win64" if sys.maxsize > 2 ** 32 else "win32"
+    if sys.platform == "darwin":
+        return "mac-arm64" if machine in ("arm64", "aarch64") else "mac-x64"
+    if machine in ("x86_64", "amd64"):
+        return "linux64"
+    raise RuntimeError(f"Chrome for Testing has no ChromeDriver build for Linux {machine}")
+
+
+class DriverCache:
+    """state.json (Chrome version, LATEST_RELEASE answers with ETags, installed drivers) and blobs/<sha256>"""
+
+    def __init__(self, directory):
+        """Create the cache directory if needed and load its state"""
+        self.directory = directory
+        self.blob_dir = os.path.join(directory, "blobs")
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self.path = os.path.join(directory, "state.json")
+        self.state = {"chrome": {}, "releases": {}, "drivers": {}}
+        self.dirty = False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.state.update(json.load(f))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Ignoring unreadable cache state: {e}")
+
+    def update(self, section, key, value):
+        """Set state[section][key], written by save()"""
+        self.state[section][key] = value
+        self.dirty = True
 
+    def save(self):
+        """Write state atomically when it changed"""
+        if not self.dirty:
+            return
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
 
-def get_chrome_version():
-    """Get installed Chrome version"""
+    def blob_path(self, digest):
+        return os.path.join(self.blob_dir, digest)
+
+    def driver_blob(self, version, driver_platform_name):
+        """Cached driver binary of this version/platform, None if not cached (or the blob is gone)"""
+        digest = self.state["drivers"].get(f"{version}/{driver_platform_name}")
+        if digest and os.path.exists(self.blob_path(digest)):
+            return self.blob_path(digest)
+        return None
+
+
+def _version_of(command):
+    result = subprocess.run([command, "--version"], capture_output=True, text=True, timeout=30)
+    match = VERSION_PATTERN.search(result.stdout)
+    return match.group(1) if match else None
+
+
+def _windows_version_dir(path):
+    # chrome.exe --version prints nothing on Windows (and may open a window); the
+    # install keeps one Application\<version> folder per installed version instead
+    versions = [name for name in os.listdir(os.path.dirname(path)) if VERSION_PATTERN.fullmatch(name)]
+    return max(versions, key=lambda v: [int(part) for part in v.split('.')]) if versions else None
+
+
+def find_chrome():
+    """(path, version reader) of the installed Chrome, None when not found"""
+    if sys.platform == "win32":
+        for candidate in WINDOWS_CHROME_PATHS:
+            path = os.path.expandvars(candidate)
+            if os.path.exists(path):
+                return path, _windows_version_dir
+    elif sys.platform == "darwin":
+        for app in MAC_CHROME_APPS:
+            plist_path = os.path.join(os.path.expanduser(app), "Contents", "Info.plist")
+            if os.path.exists(plist_path):
+                # Info.plist holds the version, no need to start the browser
+                def read_plist(path):
+                    with open(path, 'rb') as f:
+                        return plistlib.load(f).get("CFBundleShortVersionString")
+                return plist_path, read_plist
+    else:
+        for command in LINUX_CHROME_COMMANDS:
+            path = shutil.which(command)
+            if path:
+                return os.path.realpath(path), _version_of
+    return None
+
+
+def windows_registry_version():
+    """Chrome version from the BLBeacon registry key (per-user installs)"""
     try:
-        # Thử lệnh Windows
         result = subprocess.run(
             ['reg', 'query', 'HKEY_CURRENT_USER\\Software\\Google\\Chrome\\BLBeacon', '/v', 'version'],
             capture_output=True,
             text=True
         )
         if result.returncode == 0:
-            version = result.stdout.split()[-1]
-            return version
-    except:
+            return result.stdout.split()[-1]
+    except OSError:
         pass
-    
-    try:
-        # Thử đọc từ file
-        chrome_path = r"C:\Program Files\Google\Chrome\Application\chrome.exe"
-        if os.path.exists(chrome_path):
-            result = subprocess.run(
-                [chrome_path, '--version'],
-                capture_output=True,
-                text=True
-            )
-            version = result.stdout.strip().split()[-1]
+    return None
+
+
+def get_chrome_version(cache):
+    """Installed Chrome version; cached per binary (path, size, mtime) so a re-run does not start Chrome"""
+    if sys.platform == "win32":
+        version = windows_registry_version()
+        if version:
             return version
-    except:
-        pass
-    
+
+    found = find_chrome()
+    if found is not None:
+        path, read_version = found
+        stat = os.stat(path)
+        identity = {"path": path, "size": stat.st_size, "mtime": stat.st_mtime}
+        cached = cache.state["chrome"]
+        if cached.get("version") and all(cached.get(k) == v for k, v in identity.items()):
+            return cached["version"]
+        try:
+            version = read_version(path)
+        except Exception as e:
+            print(f"⚠️  Could not read the version of {path}: {e}")
+            version = None
+        if version:
+            cache.state["chrome"] = dict(identity, version=version)
+            cache.dirty = True
+            return version
+
+    if not sys.stdin.isatty():
+        raise RuntimeError("Unable to detect the Chrome version, pass --chrome-version")
     print("⚠️  Unable to auto-detect Chrome version")
-    version = input("Enter your Chrome version (e.g., 119.0.6045.105): ")
-    return version
+    return input("Enter your Chrome version (e.g., 119.0.6045.105): ").strip()
 
 
-def get_chromedriver_download_url(chrome_version):
-    """Get appropriate ChromeDriver download URL"""
-    try:
-        # Get major version (e.g., 119 from 119.0.6045.105)
-        major_version = chrome_version.split('.')[0]
-        
-        # Chrome for Testing API
-        api_url = "https://googlechromelabs.github.io/chrome-for-testing/known-good-versions-with-downloads.json"
-        
-        print(f"🔍 Finding ChromeDriver for Chrome version {chrome_version}...")
-        response = requests.get(api_url, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Tìm version phù hợp
-        for version_info in reversed(data['versions']):
-            if version_info['version'].startswith(major_version):
-                downloads = version_info.get('downloads', {}).get('chromedriver', [])
-                for download in downloads:
-                    if download['platform'] == 'win64':
-                        return download['url'], version_info['version']
-        
-        # If not found, try latest version
-        print(f"⚠️  ChromeDriver not found for version {major_version}, trying latest...")
-        latest = data['versions'][-1]
-        downloads = latest.get('downloads', {}).get('chromedriver', [])
-        for download in downloads:
-            if download['platform'] == 'win64':
-                return download['url'], latest['version']
-        
-        raise Exception("No suitable ChromeDriver found")
-        
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return None, None
+def latest_release(cache, milestone, api_base_url, max_age=MAX_AGE_SECONDS):
+    """Newest ChromeDriver version of a milestone from LATEST_RELEASE_<milestone>
 
+    The answer is reused for max_age seconds, then revalidated with If-None-Match
+    (a 304 costs no download); a cached answer is also used when the server is unreachable.
+    """
+    cached = cache.state["releases"].get(milestone)
+    if cached and time.time() - cached.get("checked", 0) < max_age:
+        return cached["version"]
 
-def download_chromedriver(url, version):
-    """Download ChromeDriver"""
+    request = urllib.request.Request(f"{api_base_url}/LATEST_RELEASE_{milestone}")
+    if cached and cached.get("etag"):
+        request.add_header("If-None-Match", cached["etag"])
     try:
-        print(f"📥 Downloading ChromeDriver {version}...")
-        
-        response = requests.get(url, stream=True, timeout=30)
-        response.raise_for_status()
-        
-        zip_path = "chromedriver_temp.zip"
-        total_size = int(response.headers.get('content-length', 0))
-        
-        with open(zip_path, 'wb') as f:
-            downloaded = 0
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if total_size > 0:
-                        percent = (downloaded / total_size) * 100
-                        print(f"\r⏳ Downloading: {percent:.1f}%", end='')
-        
-        print("\n✅ Download complete!")
-        return zip_path
-        
-    except Exception as e:
-        print(f"\n❌ Download error: {e}")
-        return None
+        with urllib.request.urlopen(request, timeout=10) as response:
+            version = response.read().decode("utf-8").strip()
+            etag = response.headers.get("ETag")
+    except OSError as e:  # urllib raises HTTPError for 304 Not Modified
+        if isinstance(e, urllib.error.HTTPError) and e.code == 304 and cached:
+            cache.update("releases", milestone, dict(cached, checked=time.time()))
+            return cached["version"]
+        if cached:
+            print(f"⚠️  Using cached release {cached['version']} ({e})")
+            return cached["version"]
+        raise
+
+    if not VERSION_PATTERN.fullmatch(version):
+        raise RuntimeError(f"Unexpected LATEST_RELEASE_{milestone} answer: {version[:40]!r}")
+    cache.update("releases", milestone, {
+        "version": version,
+        "etag": etag,
+        "checked": time.time(),
+    })
+    return version
+
+
+class _Reader:
+    """Exact-size reads over a chunk iterator (an HTTP response body)"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.buffer = b""
+        self.total = 0
+
+    def read(self, size):
+        """Up to size bytes; fewer only at end of stream"""
+        while len(self.buffer) < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            self.buffer += chunk
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        self.total += len(data)
+        return data
+
+    def read_some(self):
+        """Buffered bytes or the next chunk (b"" at end of stream)"""
+        data, self.buffer = self.buffer, b""
+        if not data:
+            data = next(self.chunks, b"")
+        self.total += len(data)
+        return data
+
+    def unread(self, data):
+        self.buffer = data + self.buffer
+        self.total -= len(data)
+
+
+def _copy_member(reader, method, compressed_size, sized, sink):
+    """Pass one member's uncompressed bytes to sink as they arrive; returns the CRC-32"""
+    crc = 0
+    if method == 0 and sized:
+        remaining = compressed_size
+        while remaining:
+            data = reader.read(min(remaining, CHUNK_SIZE))
+            if not data:
+                raise RuntimeError("Zip stream ended inside a member")
+            remaining -= len(data)
+            crc = zlib.crc32(data, crc)
+            sink(data)
+        return crc
+    if method != 8:
+        raise RuntimeError(f"Unsupported zip compression method {method}")
+    # Raw deflate ends by itself, so members with a trailing data descriptor work too
+    inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+    while not inflater.eof:
+        data = reader.read_some()
+        if not data:
+            raise RuntimeError("Zip stream ended inside a member")
+        output = inflater.decompress(data)
+        crc = zlib.crc32(output, crc)
+        sink(output)
+    reader.unread(inflater.unused_data)
+    return crc
+
 
+def stream_zip_member(chunks, wanted, sink):
+    """Find the member whose basename is `wanted` in a zip byte stream and pass its content to sink
 
-def extract_chromedriver(zip_path):
-    """Extract ChromeDriver"""
+    Reads local file headers in order, so extraction finishes while the download is still
+    running and nothing but the member's bytes is kept. Returns the member name.
+    """
+    reader = _Reader(chunks)
+    while True:
+        header = reader.read(30)
+        if len(header) < 30 or header[:4] != b"PK\x03\x04":
+            raise RuntimeError(f"{wanted} not found in zip file")
+        (flags, method, crc, compressed_size, _, name_length, extra_length) = struct.unpack("<2xHH4xIIIHH", header[4:])
+        name = reader.read(name_length).decode("utf-8", "replace")
+        reader.read(extra_length)
+        has_descriptor = bool(flags & 0x08)
+        target = name.rsplit("/", 1)[-1] == wanted
+        actual_crc = _copy_member(reader, method, compressed_size, not has_descriptor, sink if target else lambda data: None)
+        if has_descriptor:
+            descriptor = reader.read(16)
+            if descriptor[:4] != b"PK\x07\x08":
+                # The signature is optional
+                reader.unread(descriptor[12:])
+                descriptor = b"PK\x07\x08" + descriptor[:12]
+            crc = struct.unpack("<I", descriptor[4:8])[0]
+        if actual_crc != crc:
+            raise RuntimeError(f"CRC mismatch in {name}")
+        if target:
+            return name
+
+
+def download_chromedriver(cache, version, driver_platform_name, download_base_url):
+    """Stream the driver zip, extracting the binary into the cache while it downloads; returns its blob path"""
+    url = f"{download_base_url}/{version}/{driver_platform_name}/chromedriver-{driver_platform_name}.zip"
+    binary = "chromedriver.exe" if driver_platform_name.startswith("win") else "chromedriver"
+    print(f"📥 Downloading ChromeDriver {version} ({driver_platform_name})...")
+    started = time.perf_counter()
+    digest = hashlib.sha256()
+    tmp_path = os.path.join(cache.blob_dir, f"download.{os.getpid()}.tmp")
     try:
-        print("📦 Extracting...")
-        
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            # Find chromedriver.exe in zip
-            for file in zip_ref.namelist():
-                if file.endswith('chromedriver.exe'):
-                    # Extract directly to current directory
-                    with zip_ref.open(file) as source:
-                        with open('chromedriver.exe', 'wb') as target:
-                            target.write(source.read())
-                    print("✅ Extraction complete!")
-                    return True
-        
-        print("❌ chromedriver.exe not found in zip file")
-        return False
-        
-    except Exception as e:
-        print(f"❌ Extraction error: {e}")
-        return False
+        with urllib.request.urlopen(url, timeout=30) as response, open(tmp_path, 'wb') as f:
+            def sink(data):
+                digest.update(data)
+                f.write(data)
+            stream_zip_member(iter(lambda: response.read(CHUNK_SIZE), b""), binary, sink)
+        os.chmod(tmp_path, 0o755)
+        blob = cache.blob_path(digest.hexdigest())
+        os.replace(tmp_path, blob)
     finally:
-        # Delete temporary zip file
-        if os.path.exists(zip_path):
-            os.remove(zip_path)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    cache.update("drivers", f"{version}/{driver_platform_name}", digest.hexdigest())
+    print(f"✅ Extracted {binary} in {time.perf_counter() - started:.1f}s (sha256 {digest.hexdigest()[:12]})")
+    return blob
 
 
-def update_config():
-    """Update config.json file"""
+def install(blob, output):
+    """Put the cached binary at output (hard link, else copy); returns False when it is already there"""
+    if os.path.exists(output) and os.path.samefile(blob, output):
+        return False
+    tmp_path = f"{output}.{os.getpid()}.tmp"
     try:
-        config_path = "config.json"
-        
-        if os.path.exists(config_path):
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            
-            config['chromedriver_path'] = 'chromedriver.exe'
-            
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
-            
-            print("✅ config.json updated")
-        else:
-            print("⚠️  config.json not found")
-            
-    except Exception as e:
+        os.link(blob, tmp_path)
+    except OSError:
+        shutil.copy2(blob, tmp_path)
+    os.replace(tmp_path, output)
+    return True
+
+
+def update_config(config_path, driver_path):
+    """Point chromedriver_path in config.json at the installed driver (no write if it already does)"""
+    try:
+        if not os.path.exists(config_path):
+            print(f"⚠️  {config_path} not found")
+            return
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        if config.get('chromedriver_path') == driver_path:
+            return
+        config['chromedriver_path'] = driver_path
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump(config, f, indent=2, ensure_ascii=False)
+        print(f"✅ {config_path} updated")
+    except (OSError, ValueError) as e:
         print(f"⚠️  Error updating config: {e}")
 
 
 def main():
-    print("=" * 60)
-    print("🚀 AUTOMATED CHROMEDRIVER DOWNLOAD SCRIPT")
-    print("=" * 60)
-    print()
-    
-    # Check Chrome version
-    chrome_version = get_chrome_version()
-    print(f"✓ Chrome version: {chrome_version}")
-    print()
-    
-    # Get download URL
-    url, driver_version = get_chromedriver_download_url(chrome_version)
-    
-    if not url:
-        print("❌ Unable to find download URL. Please download manually from:")
-        print("   https://googlechromelabs.github.io/chrome-for-testing/")
-        return
-    
-    print(f"✓ Found ChromeDriver version: {driver_version}")
-    print()
-    
-    # Download ChromeDriver
-    zip_path = download_chromedriver(url, driver_version)
-    
-    if not zip_path:
-        return
-    
-    # Extract
-    if extract_chromedriver(zip_path):
-        # Update config
-        update_config()
-        
-        print()
-        print("=" * 60)
-        print("🎉 COMPLETE!")
-        print("=" * 60)
-        print("✅ ChromeDriver installed at: chromedriver.exe")
-        print("✅ config.json updated")
-        print()
-        print("You can now run the main program:")
-        print("   python main.py")
-    else:
-        print("❌ Installation failed")
+    """Install the ChromeDriver matching the local Chrome; exit code 1 on failure"""
+    parser = argparse.ArgumentParser(description="Install the ChromeDriver that matches the installed Chrome")
+    parser.add_argument("--chrome-version", help="Skip detection and use this Chrome version (or milestone)")
+    parser.add_argument("--platform", help="Chrome for Testing platform (default: this machine's)")
+    parser.add_argument("--output", help="Where to put the driver (default: chromedriver[.exe] here)")
+    parser.add_argument("--config", default="config.json", help="config.json to update (default: %(default)s)")
+    parser.add_argument("--cache-dir", default=os.environ.get("CHROMEDRIVER_CACHE_DIR") or default_cache_dir())
+    parser.add_argument("--base-url", default=os.environ.get("CHROMEDRIVER_API_URL", API_BASE_URL),
+                        help="Chrome for Testing endpoint base (LATEST_RELEASE_<milestone>)")
+    parser.add_argument("--download-url", default=os.environ.get("CHROMEDRIVER_DOWNLOAD_URL"),
+                        help="Driver zip base URL (default: the public bucket, or --base-url when that is set)")
+    parser.add_argument("--max-age", type=float, default=MAX_AGE_SECONDS,
+                        help="Seconds a cached LATEST_RELEASE answer is used without revalidating")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    download_base_url = args.download_url or (args.base_url if args.base_url != API_BASE_URL else DOWNLOAD_BASE_URL)
+    try:
+        cache = DriverCache(args.cache_dir)
+        driver_platform_name = args.platform or driver_platform()
+        output = args.output or ("chromedriver.exe" if driver_platform_name.startswith("win") else "chromedriver")
+
+        chrome_version = args.chrome_version or get_chrome_version(cache)
+        milestone = chrome_version.split('.')[0]
+        driver_version = latest_release(cache, milestone, args.base_url.rstrip('/'), args.max_age)
+
+        blob = cache.driver_blob(driver_version, driver_platform_name)
+        downloaded = blob is None
+        if downloaded:
+            blob = download_chromedriver(cache, driver_version, driver_platform_name, download_base_url.rstrip('/'))
+        installed = install(blob, output)
+        cache.save()
+        # Absolute: on POSIX Selenium starts a bare name through PATH, not the working directory
+        update_config(args.config, os.path.abspath(output))
+    except Exception as e:
+        print(f"❌ {e}")
+        print("   Download manually from: https://googlechromelabs.github.io/chrome-for-testing/")
+        return 1
+
+    source = "downloaded" if downloaded else "from cache"
+    action = "installed" if installed else "already installed"
+    print(f"✅ Chrome {chrome_version} → ChromeDriver {driver_version} ({driver_platform_name}) "
+          f"{action} at {output}, {source} in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""
+Chrome driver creation
+Launch profiles (resource blocking, headless) and Chrome memory measurement
+"""
+
+import os
+
+
+# Chrome launch profiles, selected with config browser.profile (its other keys override single settings)
+LAUNCH_PROFILES = {
+    "default": {
+        "headless": False,
+        "page_load_strategy": "normal",
+        "arguments": [],
+        "block_resources": False,
+    },
+    "performance": {
+        "headless": True,
+        "page_load_strategy": "eager",
+        "arguments": [
+            "--window-size=1280,2000",
+            "--disable-extensions",
+            "--disable-gpu",
+            "--disable-dev-shm-usage",
+            "--disable-background-networking",
+            "--disable-component-update",
+            "--disable-sync",
+            "--no-first-run",
+            "--mute-audio",
+        ],
+        "block_resources": True,
+    },
+}
+
+# Network.setBlockedURLs patterns: images, web fonts and telemetry a form never needs to be filled
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.bmp", "*.ico", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.gstatic.com*", "*fonts.googleapis.com*",
+    "*googleusercontent.com*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*play.google.com/log*", "*/gen_204*", "*/jserror*", "*/csi?*",
+]
+
+
+def launch_settings(config):
+    """Effective launch settings: the configured profile plus browser.* overrides"""
+    browser_config = config.get('browser', {})
+    profile = browser_config.get('profile', 'default')
+    settings = dict(LAUNCH_PROFILES[profile], profile=profile)
+    for key in ("headless", "page_load_strategy", "block_resources"):
+        if key in browser_config:
+            settings[key] = browser_config[key]
+    settings["arguments"] = settings["arguments"] + browser_config.get('arguments', [])
+    settings["blocked_urls"] = browser_config.get('blocked_urls', BLOCKED_URLS)
+    return settings
+
+
+def block_resources(driver, patterns):
+    """Block matching requests for this browser tab through the DevTools protocol"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        return True
+    except Exception as e:
+        print(f"⚠ Resource blocking unavailable ({type(e).__name__}), loading everything")
+        return False
+
+
+def create_driver(config):
+    """Start a new Chrome WebDriver from config (launch profile from config browser.profile)"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    settings = launch_settings(config)
+    options = webdriver.ChromeOptions()
+    if settings["headless"]:
+        options.add_argument("--headless=new")
+    for argument in settings["arguments"]:
+        options.add_argument(argument)
+    options.page_load_strategy = settings["page_load_strategy"]
+    service = Service(executable_path=config['chromedriver_path'])
+    driver = webdriver.Chrome(service=service, options=options)
+    if settings["block_resources"] and settings["blocked_urls"]:
+        block_resources(driver, settings["blocked_urls"])
+    return driver
+
+
+def _children_by_parent():
+    """Map ppid -> [pid] from /proc (Linux fallback when psutil is missing)"""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                stat = f.read()
+            ppid = int(stat[stat.rindex(')') + 2:].split()[1])
+            children.setdefault(ppid, []).append(int(entry))
+        except (OSError, ValueError):
+            continue
+    return children
+
+
+def process_tree_rss_mb(pid):
+    """Resident memory of a process and all its descendants in MB (None if unknown)"""
+    if not pid:
+        return None
+    try:
+        import psutil
+        root = psutil.Process(pid)
+        processes = [root] + root.children(recursive=True)
+        total = 0
+        for proc in processes:
+            try:
+                total += proc.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+    except ImportError:
+        pass
+    except Exception:
+        return None
+
+    if not os.path.isdir('/proc'):
+        return None
+    children = _children_by_parent()
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    total = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            with open(f'/proc/{current}/statm', 'r') as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, ValueError, IndexError):
+            pass
+        stack.extend(children.get(current, []))
+    return total / (1024 * 1024)
+
+
+def driver_rss_mb(driver):
+    """Resident memory of a driver's ChromeDriver and Chrome processes in MB (None if unknown)"""
+    try:
+        return process_tree_rss_mb(driver.service.process.pid)
+    except AttributeError:
+        return None
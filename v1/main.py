@@ -1,91 +1,197 @@
+from startup import Startup  # first: its import time marks process start
+import argparse
 import json
 import time
-import google.generativeai as genai
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from readiness import create_waiter
+from browser import create_driver, driver_rss_mb, launch_settings
+from text_input import create_text_input
+from navigation import create_navigator
+from question_model import Question
+from tracing import create_tracer
+from rate_limit import create_rate_limited_model
+
+
+# Evaluates every XPath of a section in one call: [{element} | {invalid: true} | {}]
+RESOLVE_XPATHS_SCRIPT = """
+return arguments[0].map(function (xpath) {
+    try {
+        var node = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        return node ? {element: node} : {};
+    } catch (e) {
+        return {invalid: true};
+    }
+});
+"""
 
 
 class GoogleFormAutofill:
-    def __init__(self, config_file='config.json', questions_file='questions_example_multisection.json'):
-        """Initialize with config and questions files"""
-        # Load config
-        with open(config_file, 'r', encoding='utf-8') as f:
-            self.config = json.load(f)
+    def __init__(self, config_file='config.json', questions_file='questions_example_multisection.json', driver=None):
+        """Initialize with config and questions files (pass a pooled driver to skip Chrome startup)
+
+        Chrome and the Gemini client start on background threads while the
+        questions file is loaded; ready() waits for them.
+        """
+        self.startup = Startup()
         
-        # Load questions
-        with open(questions_file, 'r', encoding='utf-8') as f:
-            self.questions_data = json.load(f)
+        # Load config
+        with self.startup.phase("config"):
+            with open(config_file, 'r', encoding='utf-8') as f:
+                self.config = json.load(f)
         
-        # Configure Gemini API
-        genai.configure(api_key=self.config['gemini_api_key'])
-        self.model = genai.GenerativeModel('gemini-pro')
+        # Start Chrome (unless a driver was given) and Gemini in the background
+        self.tracer = create_tracer(self.config, 'v1')
+        self.owns_driver = driver is None
+        self.driver = driver
+        if driver is None:
+            self.startup.background("chrome", self.start_driver)
+        self.startup.background("gemini", self.start_model)
+        self.model = None
+        self.waiter = None
         
-        # Initialize Chrome WebDriver
-        from selenium.webdriver.chrome.service import Service
-        service = Service(executable_path=self.config['chromedriver_path'])
-        self.driver = webdriver.Chrome(service=service)
+        # Load questions as compact records (elements are looked up per section)
+        with self.startup.phase("questions"):
+            with open(questions_file, 'r', encoding='utf-8') as f:
+                self.questions_data = json.load(f)
+            sections = self.questions_data.get('sections', [self.questions_data.get('questions', [])])
+            # If old format (no sections), convert to new format
+            if 'questions' in self.questions_data and 'sections' not in self.questions_data:
+                sections = [self.questions_data['questions']]
+            self.sections = [
+                [Question.from_dict(q, index=idx) for idx, q in enumerate(section, 1)] for section in sections
+            ]
+    
+    def start_driver(self):
+        """Launch Chrome (background startup phase)"""
+        with self.tracer.span("driver.start"):
+            return create_driver(self.config)
+    
+    def start_model(self):
+        """Import and configure Gemini, build the rate-limited model (background startup phase)"""
+        with self.tracer.span("model.start"):
+            import google.generativeai as genai
+            genai.configure(api_key=self.config['gemini_api_key'])
+            return create_rate_limited_model(genai.GenerativeModel('gemini-pro'), self.config)
+    
+    def ready(self):
+        """Wait for background startup (once) and attach the driver helpers"""
+        if self.waiter is not None:
+            return
+        from selenium.webdriver.support.ui import WebDriverWait
+        self.model = self.startup.result("gemini")
+        if self.driver is None:
+            self.driver = self.startup.result("chrome")
+        self.tracer.instrument_driver(self.driver)
         self.wait = WebDriverWait(self.driver, 10)
+        self.waiter = create_waiter(self.driver, self.config, self.tracer)
+        self.text_input = create_text_input(self.driver, self.config)
+        self.navigator = create_navigator(self.driver, self.config)
     
     def get_gemini_response(self, prompt):
         """Call Gemini API to get answer"""
         try:
-            response = self.model.generate_content(prompt)
+            with self.tracer.span("llm.generate_content", "llm", prompt_chars=len(prompt)):
+                response = self.model.generate_content(prompt)
             return response.text.strip()
         except Exception as e:
             print(f"Error calling Gemini API: {e}")
             return ""
     
-    def fill_text_field(self, xpath, prompt):
+    def fill_text_field(self, xpath, prompt, element=None):
         """Fill text field with data from Gemini"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException, NoSuchElementException
         try:
-            element = self.wait.until(
-                EC.presence_of_element_located((By.XPATH, xpath))
-            )
+            if element is None:
+                element = self.wait.until(
+                    EC.presence_of_element_located((By.XPATH, xpath))
+                )
             answer = self.get_gemini_response(prompt)
-            element.clear()
-            element.send_keys(answer)
+            if not self.text_input.enter(element, answer, 'text'):
+                print("✗ Value was not stored")
+                return False
             print(f"✓ Filled: {answer}")
-            time.sleep(0.5)
+            self.waiter.pace('after_fill')
             return True
         except (TimeoutException, NoSuchElementException) as e:
             print(f"✗ Field not found with xpath: {xpath}")
             return False
     
-    def fill_textarea(self, xpath, prompt):
+    def fill_textarea(self, xpath, prompt, element=None):
         """Fill textarea with data from Gemini"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException, NoSuchElementException
         try:
-            element = self.wait.until(
-                EC.presence_of_element_located((By.XPATH, xpath))
-            )
+            if element is None:
+                element = self.wait.until(
+                    EC.presence_of_element_located((By.XPATH, xpath))
+                )
             answer = self.get_gemini_response(prompt)
-            element.clear()
-            element.send_keys(answer)
+            if not self.text_input.enter(element, answer, 'textarea'):
+                print("✗ Value was not stored")
+                return False
             print(f"✓ Filled textarea: {answer[:50]}...")
-            time.sleep(0.5)
+            self.waiter.pace('after_fill')
             return True
         except (TimeoutException, NoSuchElementException) as e:
             print(f"✗ Textarea not found with xpath: {xpath}")
             return False
     
-    def click_radio_or_checkbox(self, xpath):
+    def click_radio_or_checkbox(self, xpath, element=None):
         """Click radio button or checkbox"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException, NoSuchElementException
         try:
-            element = self.wait.until(
-                EC.element_to_be_clickable((By.XPATH, xpath))
-            )
+            if element is None:
+                element = self.wait.until(
+                    EC.element_to_be_clickable((By.XPATH, xpath))
+                )
             element.click()
             print(f"✓ Clicked element")
-            time.sleep(0.5)
+            self.waiter.pace('after_fill')
             return True
         except (TimeoutException, NoSuchElementException) as e:
             print(f"✗ Element not found with xpath: {xpath}")
             return False
     
+    def resolve_section(self, section_questions):
+        """Resolve all XPaths of a section in one in-page batch, waiting once per section
+
+        Binds the element of each question found and returns the list of elements
+        (None for locators that never matched)."""
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
+        xpaths = [q.xpath for q in section_questions]
+        results = []
+        
+        def evaluate(driver):
+            results[:] = driver.execute_script(RESOLVE_XPATHS_SCRIPT, xpaths)
+            return all(r.get('element') is not None or r.get('invalid') for r in results)
+        
+        try:
+            WebDriverWait(self.driver, self.config.get('wait_timeout', 10), poll_frequency=0.2).until(evaluate)
+        except TimeoutException:
+            pass
+        
+        missing = [(idx, xpaths[idx - 1], r) for idx, r in enumerate(results, 1) if r.get('element') is None]
+        if missing:
+            print(f"⚠ {len(missing)}/{len(xpaths)} locators not found in this section:")
+            for idx, xpath, r in missing:
+                reason = "invalid XPath" if r.get('invalid') else "no match"
+                print(f"   ✗ Q{idx} ({reason}): {xpath}")
+        else:
+            print(f"✓ Resolved {len(xpaths)} locators")
+        for question, r in zip(section_questions, results):
+            if r.get('element') is not None:
+                question.bind(r['element'])
+        return [r.get('element') for r in results]
+    
     def click_next_button(self):
         """Click Next button to go to next section"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
         try:
             next_selectors = [
                 "//span[contains(text(), 'Next')]/..",
@@ -94,6 +200,18 @@ class GoogleFormAutofill:
                 "//div[@role='button' and contains(., 'Tiếp')]"
             ]
             
+            signature = self.waiter.section_signature()
+            try:
+                with self.tracer.span("navigate"):
+                    action = self.navigator.click(("next",))
+                if action == "next":
+                    print("✓ Clicked Next button")
+                    self.waiter.wait_for_section_change(signature)
+                    return True
+                print("⚠ Button script found no Next button, trying XPath selectors")
+            except Exception as e:
+                print(f"⚠ Button script failed ({type(e).__name__}), trying XPath selectors")
+            
             for selector in next_selectors:
                 try:
                     next_btn = self.wait.until(
@@ -101,7 +219,7 @@ class GoogleFormAutofill:
                     )
                     next_btn.click()
                     print("✓ Clicked Next button")
-                    time.sleep(1.5)
+                    self.waiter.wait_for_section_change(signature)
                     return True
                 except:
                     continue
@@ -115,40 +233,53 @@ class GoogleFormAutofill:
     
     def fill_form(self):
         """Fill entire form with multi-section support"""
+        from selenium.webdriver.common.by import By
+        self.ready()
         try:
             # Open Google Form
             print(f"Opening form: {self.questions_data['form_url']}")
-            self.driver.get(self.questions_data['form_url'])
-            time.sleep(self.config['wait_time'])
+            load_started = time.perf_counter()
+            with self.tracer.span("driver.get"):
+                self.driver.get(self.questions_data['form_url'])
+            self.waiter.wait_for_page_ready()
+            print(f"   Page ready in {time.perf_counter() - load_started:.2f}s")
             
             current_section = 1
-            sections = self.questions_data.get('sections', [self.questions_data.get('questions', [])])
-            
-            # If old format (no sections), convert to new format
-            if 'questions' in self.questions_data and 'sections' not in self.questions_data:
-                sections = [self.questions_data['questions']]
+            sections = self.sections
             
             for section_idx, section_questions in enumerate(sections, 1):
                 print(f"\n{'='*60}")
                 print(f"📄 SECTION {section_idx}/{len(sections)}")
                 print(f"{'='*60}")
                 
+                # Resolve every locator of the section up front
+                if self.config.get('preresolve_xpaths', True):
+                    with self.tracer.span("resolve_section", section=section_idx):
+                        self.resolve_section(section_questions)
+                
                 # Process each question in section
                 for idx, question in enumerate(section_questions, 1):
-                    print(f"\n[Q{idx}/{len(section_questions)}] Processing: {question['type']}")
-                    
-                    if question['type'] == 'text':
-                        self.fill_text_field(question['xpath'], question['prompt'])
+                    print(f"\n[Q{idx}/{len(section_questions)}] Processing: {question.type}")
+                    element = question.handles.element if question.handles is not None else None
                     
-                    elif question['type'] == 'textarea':
-                        self.fill_textarea(question['xpath'], question['prompt'])
+                    if element is None and self.config.get('preresolve_xpaths', True):
+                        print(f"✗ Skipped, locator not found: {question.xpath}")
+                        continue
                     
-                    elif question['type'] in ['radio', 'checkbox']:
-                        self.click_radio_or_checkbox(question['xpath'])
-                    
-                    elif question['type'] == 'scale':
-                        # Handle matrix/scale questions
-                        self.click_radio_or_checkbox(question['xpath'])
+                    with self.tracer.span("fill_question", index=idx, type=question.type):
+                        if question.type == 'text':
+                            self.fill_text_field(question.xpath, question.prompt, element)
+                        
+                        elif question.type == 'textarea':
+                            self.fill_textarea(question.xpath, question.prompt, element)
+                        
+                        elif question.type in ['radio', 'checkbox']:
+                            self.click_radio_or_checkbox(question.xpath, element)
+                        
+                        elif question.type == 'scale':
+                            # Handle matrix/scale questions
+                            self.click_radio_or_checkbox(question.xpath, element)
+                    self.startup.mark("first question filled")
                 
                 # After finishing section, click Next or Submit
                 if section_idx < len(sections):
@@ -168,7 +299,17 @@ class GoogleFormAutofill:
                         ]
                         
                         submit_clicked = False
-                        for selector in submit_selectors:
+                        script_failed = False
+                        try:
+                            with self.tracer.span("navigate"):
+                                submit_clicked = self.navigator.click(("submit",)) == "submit"
+                            if submit_clicked:
+                                print("✓ Form submitted!")
+                        except Exception as e:
+                            print(f"⚠ Button script failed ({type(e).__name__}), trying XPath selectors")
+                            script_failed = True
+                        
+                        for selector in (submit_selectors if script_failed else []):
                             try:
                                 submit_btn = self.driver.find_element(By.XPATH, selector)
                                 submit_btn.click()
@@ -180,8 +321,8 @@ class GoogleFormAutofill:
                         
                         if not submit_clicked:
                             print("⚠ Submit button not found, please submit manually")
-                        
-                        time.sleep(3)
+                        else:
+                            self.waiter.wait_for_confirmation()
                         
                     except Exception as e:
                         print(f"⚠ Error submitting: {e}")
@@ -193,22 +334,41 @@ class GoogleFormAutofill:
             print(f"\n❌ Error: {e}")
         
         finally:
-            # Wait a bit before closing
-            time.sleep(5)
+            # Optional pause before closing (pacing profile)
+            self.waiter.pace('before_close')
+            self.waiter.report()
     
     def close(self):
-        """Close browser"""
-        self.driver.quit()
-        print("Browser closed")
-
+        """Close browser (pooled drivers are left to the pool)"""
+        self.startup.report()
+        # Without ready() (e.g. startup failed), release whatever the background startup produced
+        self.model = self.model or self.startup.settle("gemini")
+        if self.model is not None:
+            self.model.report()
+            self.model.close()
+        self.tracer.report()
+        if self.owns_driver:
+            self.driver = self.driver or self.startup.settle("chrome")
+            if self.driver is not None:
+                rss = driver_rss_mb(self.driver)
+                if rss is not None:
+                    print(f"🧠 Chrome memory: {rss:.0f} MB ({launch_settings(self.config)['profile']} launch profile)")
+                self.driver.quit()
+                print("Browser closed")
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Google Form Autofill with Gemini AI")
+    parser.add_argument("--config", default="config.json", help="Path to config.json")
+    parser.add_argument("--questions", default="questions_example_multisection.json",
+                        help="Questions file (form_url + sections/questions)")
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("🤖 GOOGLE FORM AUTOFILL WITH GEMINI AI")
     print("=" * 60)
     
-    autofill = GoogleFormAutofill()
+    autofill = GoogleFormAutofill(config_file=args.config, questions_file=args.questions)
     
     try:
         autofill.fill_form()
@@ -0,0 +1,57 @@
+"""
+Compact question model
+Slotted, picklable records for questions-file entries; the element found by the
+entry's XPath is bound when its section is resolved
+"""
+
+import sys
+
+
+class Handles:
+    """Live WebElement of one question (never serialized)"""
+
+    __slots__ = ("element",)
+
+    def __init__(self, element):
+        self.element = element
+
+
+class Question:
+    """One questions-file entry ({type, xpath, prompt}) without live elements"""
+
+    __slots__ = ("index", "type", "xpath", "prompt", "handles")
+
+    def __init__(self, index, question_type, xpath, prompt=None):
+        self.index = index
+        self.type = sys.intern(question_type)
+        self.xpath = xpath
+        self.prompt = prompt
+        self.handles = None
+
+    @classmethod
+    def from_dict(cls, data, index=None):
+        """Question from a questions-file entry (index: position in its section)"""
+        return cls(data.get('index', index), data['type'], data['xpath'], data.get('prompt'))
+
+    def to_dict(self):
+        """JSON-ready dict (no handles)"""
+        data = {"index": self.index, "type": self.type, "xpath": self.xpath}
+        if self.prompt is not None:
+            data["prompt"] = self.prompt
+        return data
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        restored = Question.from_dict(state)
+        for name in self.__slots__:
+            setattr(self, name, getattr(restored, name))
+
+    def bind(self, element):
+        """Attach the live element found in the page"""
+        self.handles = Handles(element)
+        return self.handles
+
+    def __repr__(self):
+        return f"Question({self.index}, {self.type}, {self.xpath[:40]!r})"
@@ -0,0 +1,191 @@
+"""
+Event-driven readiness waits
+Replaces fixed time.sleep pacing with DOM conditions and records time spent waiting
+"""
+
+import time
+from collections import defaultdict
+from tracing import Tracer
+
+
+# Deliberate delays per step (seconds). "fast" relies purely on readiness waits,
+# "human" reproduces the original fixed sleeps for anyone who wants them.
+PACING_PROFILES = {
+    "fast": {
+        "after_load": 0,
+        "after_fill": 0,
+        "after_option": 0,
+        "after_next": 0,
+        "after_submit": 0,
+        "before_close": 0,
+    },
+    "human": {
+        "after_load": None,  # config wait_time
+        "after_fill": 0.5,
+        "after_option": 0.3,
+        "after_next": 3.5,
+        "after_submit": 3,
+        "before_close": 5,
+    },
+}
+
+# Resolves with elapsed ms once no mutation was seen for `quiet` ms (or `timeout` ms passed)
+DOM_SETTLED_SCRIPT = """
+var quiet = arguments[0], timeout = arguments[1], done = arguments[arguments.length - 1];
+var start = Date.now(), last = start;
+var observer = new MutationObserver(function () { last = Date.now(); });
+observer.observe(document.documentElement, {subtree: true, childList: true, attributes: true, characterData: true});
+(function check() {
+    var now = Date.now();
+    if (now - last >= quiet || now - start >= timeout) {
+        observer.disconnect();
+        done(now - start);
+    } else {
+        setTimeout(check, 25);
+    }
+})();
+"""
+
+SECTION_SIGNATURE_SCRIPT = """
+var titles = Array.prototype.map.call(
+    document.querySelectorAll("div[role='listitem'] .M7eMe"),
+    function (el) { return el.textContent; }
+);
+var history = document.querySelector("input[name='pageHistory']");
+return (history ? history.value : "") + "|" + titles.length + "|" + titles.join("\\u241e");
+"""
+
+CONFIRMATION_SCRIPT = """
+if (location.href.indexOf("formResponse") !== -1) return true;
+if (document.querySelector(".vHW8K")) return true;
+if (document.querySelectorAll("div[role='listitem']").length) return false;
+var text = document.body ? document.body.innerText : "";
+return /response has been recorded|câu trả lời của bạn đã được ghi lại/i.test(text);
+"""
+
+
+class ReadinessWaiter:
+    """Condition-based waits with a configurable pacing profile and wait accounting"""
+
+    def __init__(self, driver, pacing="fast", wait_time=2, timeout=10, quiet_ms=150, tracer=None):
+        """Resolve pacing profile (name or dict of step -> seconds)"""
+        self.driver = driver
+        self.tracer = tracer or Tracer(enabled=False)
+        self.timeout = timeout
+        self.quiet_ms = quiet_ms
+        if isinstance(pacing, dict):
+            self.pacing = dict(PACING_PROFILES["fast"], **pacing)
+        else:
+            self.pacing = dict(PACING_PROFILES.get(pacing, PACING_PROFILES["fast"]))
+        if self.pacing.get("after_load") is None:
+            self.pacing["after_load"] = wait_time
+        self.waited = defaultdict(float)
+
+    def _until(self, condition):
+        """Poll condition(driver) every 100ms until truthy or timeout"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        return WebDriverWait(self.driver, self.timeout, poll_frequency=0.1).until(condition)
+
+    def _record(self, category, started):
+        self.waited[category] += time.perf_counter() - started
+
+    def pace(self, step):
+        """Sleep the deliberate delay configured for this step (0 in the fast profile)"""
+        delay = self.pacing.get(step, 0)
+        if delay:
+            with self.tracer.span("wait.pacing", "wait", step=step):
+                started = time.perf_counter()
+                time.sleep(delay)
+                self._record("pacing", started)
+
+    def wait_for_dom_settled(self, category="dom_settle"):
+        """Wait until the page stops mutating for quiet_ms"""
+        started = time.perf_counter()
+        try:
+            with self.tracer.span("wait.dom_settled", "wait"):
+                self.driver.set_script_timeout(self.timeout + 5)
+                self.driver.execute_async_script(DOM_SETTLED_SCRIPT, self.quiet_ms, self.timeout * 1000)
+        except Exception as e:
+            print(f"   ⚠ DOM settle wait failed: {type(e).__name__}")
+        finally:
+            self._record(category, started)
+
+    def wait_for_page_ready(self):
+        """Wait for document ready and the first questions (or any body) to render"""
+        started = time.perf_counter()
+        try:
+            with self.tracer.span("wait.page_ready", "wait"):
+                # With the eager page-load strategy the form is usable before 'complete'
+                self._until(
+                    lambda d: d.execute_script(
+                        "return (document.readyState === 'complete' && "
+                        "!!document.querySelector(\"div[role='listitem'], form, body\")) || "
+                        "(document.readyState === 'interactive' && !!document.querySelector(\"div[role='listitem']\"))"
+                    )
+                )
+        except Exception:
+            print("   ⚠ Page did not report ready in time")
+        finally:
+            self._record("page_load", started)
+        self.wait_for_dom_settled("page_load")
+        self.pace("after_load")
+
+    def section_signature(self):
+        """Cheap fingerprint of the visible section (page history + question titles)"""
+        try:
+            return self.driver.execute_script(SECTION_SIGNATURE_SCRIPT)
+        except Exception:
+            return None
+
+    def wait_for_section_change(self, previous_signature):
+        """Wait until the section's listitems differ from previous_signature"""
+        started = time.perf_counter()
+        try:
+            with self.tracer.span("wait.section_change", "wait"):
+                self._until(
+                    lambda d: self.section_signature() != previous_signature
+                )
+        except Exception:
+            print("   ⚠ Section did not change in time")
+        finally:
+            self._record("navigation", started)
+        self.wait_for_dom_settled("navigation")
+        self.pace("after_next")
+
+    def wait_for_confirmation(self):
+        """Wait for the 'response recorded' confirmation page"""
+        started = time.perf_counter()
+        confirmed = False
+        try:
+            with self.tracer.span("wait.confirmation", "wait"):
+                self._until(
+                    lambda d: d.execute_script(CONFIRMATION_SCRIPT)
+                )
+                confirmed = True
+        except Exception:
+            print("   ⚠ Confirmation page not detected")
+        finally:
+            self._record("confirmation", started)
+        self.pace("after_submit")
+        return confirmed
+
+    def total_waited(self):
+        return sum(self.waited.values())
+
+    def report(self):
+        """Print time spent waiting per category"""
+        if not self.waited:
+            return
+        parts = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in sorted(self.waited.items()))
+        print(f"\n⏱  Waiting: {self.total_waited():.2f}s total ({parts})")
+
+
+def create_waiter(driver, config, tracer=None):
+    """Create ReadinessWaiter from config"""
+    return ReadinessWaiter(
+        driver,
+        pacing=config.get('pacing', 'fast'),
+        wait_time=config.get('wait_time', 2),
+        timeout=config.get('wait_timeout', 10),
+        tracer=tracer,
+    )
@@ -0,0 +1,82 @@
+"""
+Bulk text entry
+Sets a field's value in one operation instead of typing it key by key
+"""
+
+from collections import Counter
+
+
+# Native value setter + input/change events, so Google Forms' listeners register the value
+SET_VALUE_SCRIPT = """
+var el = arguments[0], value = arguments[1];
+var proto = el.tagName === "TEXTAREA" ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+el.focus();
+Object.getOwnPropertyDescriptor(proto, "value").set.call(el, value);
+el.dispatchEvent(new Event("input", {bubbles: true}));
+el.dispatchEvent(new Event("change", {bubbles: true}));
+el.blur();
+return el.value;
+"""
+
+FOCUS_AND_SELECT_SCRIPT = """
+var el = arguments[0];
+el.focus();
+if (el.select) { el.select(); }
+"""
+
+# Entry mode per field type: "js" (value setter), "cdp" (Input.insertText) or "keys" (send_keys)
+DEFAULT_MODES = {
+    "text": "js",
+    "email": "js",
+    "textarea": "js",
+    "number": "js",
+    "tel": "js",
+    "date": "keys",
+    "time": "keys",
+}
+
+
+def _same_value(stored, expected):
+    return (stored or "").replace("\r\n", "\n") == expected.replace("\r\n", "\n")
+
+
+class TextInput:
+    """Enters text with the configured mode, verifying the stored value"""
+
+    def __init__(self, driver, modes=None):
+        """modes overrides DEFAULT_MODES per field type"""
+        self.driver = driver
+        self.modes = dict(DEFAULT_MODES, **(modes or {}))
+        self.counters = Counter()
+
+    def _insert_js(self, element, value):
+        return self.driver.execute_script(SET_VALUE_SCRIPT, element, value)
+
+    def _insert_cdp(self, element, value):
+        self.driver.execute_script(FOCUS_AND_SELECT_SCRIPT, element)
+        self.driver.execute_cdp_cmd("Input.insertText", {"text": value})
+        return element.get_property("value")
+
+    def enter(self, element, value, field_type="text"):
+        """Put value into element; falls back to send_keys if the fast path did not stick"""
+        mode = self.modes.get(field_type, "keys")
+        if mode in ("js", "cdp"):
+            try:
+                insert = self._insert_js if mode == "js" else self._insert_cdp
+                if _same_value(insert(element, value), value):
+                    self.counters[mode] += 1
+                    return True
+                print(f"   ⚠ {mode} entry not stored, typing instead")
+            except Exception as e:
+                print(f"   ⚠ {mode} entry failed ({type(e).__name__}), typing instead")
+            self.counters["fallback"] += 1
+
+        element.clear()
+        element.send_keys(value)
+        self.counters["keys"] += 1
+        return _same_value(element.get_property("value"), value)
+
+
+def create_text_input(driver, config):
+    """Create TextInput from config"""
+    return TextInput(driver, config.get('text_input_modes'))
@@ -0,0 +1,135 @@
+"""
+Per-phase timing traces
+Span-based tracer exporting Chrome trace_event JSON (Perfetto / chrome://tracing) and JSONL,
+with a count of WebDriver commands issued inside each span
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+class _NullSpan:
+    """Shared no-op context manager used when tracing is off"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Records spans; span() costs one attribute check when disabled"""
+
+    def __init__(self, enabled=False, output_dir='traces', name='autofill'):
+        self.enabled = enabled
+        self.output_dir = output_dir
+        self.name = name
+        self.events = []
+        self.webdriver_commands = 0
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        # Command counters of the spans open in this context (inherited by tasks and executor calls)
+        self._active = contextvars.ContextVar(f"active_spans_{id(self)}", default=())
+
+    def instrument_driver(self, driver):
+        """Count every WebDriver command (all commands go through driver.execute)"""
+        if not self.enabled or getattr(driver, '_traced_by', None) is self:
+            return driver
+        original_execute = driver.execute
+
+        def counting_execute(driver_command, params=None):
+            with self._lock:
+                self.webdriver_commands += 1
+                for counter in self._active.get():
+                    counter[0] += 1
+            return original_execute(driver_command, params)
+
+        driver.execute = counting_execute
+        driver._traced_by = self
+        return driver
+
+    def span(self, name, category='phase', **args):
+        """Context manager timing a phase"""
+        if not self.enabled:
+            return NULL_SPAN
+        return self._span(name, category, args)
+
+    @contextmanager
+    def _span(self, name, category, args):
+        started = time.perf_counter()
+        commands = [0]
+        token = self._active.set(self._active.get() + (commands,))
+        try:
+            yield
+        finally:
+            ended = time.perf_counter()
+            self._active.reset(token)
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round((started - self._origin) * 1e6, 1),
+                "dur": round((ended - started) * 1e6, 1),
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+            with self._lock:
+                event["args"] = dict(args, webdriver_commands=commands[0])
+                self.events.append(event)
+
+    def summary(self):
+        """Total seconds and WebDriver commands per span name"""
+        totals = {}
+        for event in self.events:
+            entry = totals.setdefault(event['name'], {"count": 0, "seconds": 0.0, "webdriver_commands": 0})
+            entry["count"] += 1
+            entry["seconds"] += event['dur'] / 1e6
+            entry["webdriver_commands"] += event['args']['webdriver_commands']
+        return totals
+
+    def export(self):
+        """Write <name>-<time>-<pid>.trace.json and .jsonl; returns the paths"""
+        if not self.enabled or not self.events:
+            return []
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, f"{self.name}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}")
+        with self._lock:
+            events = list(self.events)
+
+        trace_path = f"{base}.trace.json"
+        with open(trace_path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+        jsonl_path = f"{base}.jsonl"
+        with open(jsonl_path, 'w', encoding='utf-8') as f:
+            for event in events:
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        return [trace_path, jsonl_path]
+
+    def report(self):
+        """Print per-phase totals and export trace files"""
+        if not self.enabled or not self.events:
+            return
+        print("\n🧭 Trace summary:")
+        for name, entry in sorted(self.summary().items(), key=lambda item: -item[1]["seconds"]):
+            print(f"   {name:<28} {entry['seconds']:8.3f}s  x{entry['count']:<4} "
+                  f"{entry['webdriver_commands']} WebDriver commands")
+        for path in self.export():
+            print(f"   📄 {path}")
+
+
+def create_tracer(config, name='autofill'):
+    """Create Tracer from config"""
+    tracing_config = config.get('tracing', {})
+    return Tracer(
+        enabled=tracing_config.get('enabled', False),
+        output_dir=tracing_config.get('output_dir', 'traces'),
+        name=name,
+    )
@@ -0,0 +1,181 @@
+"""
+Answer cache for Gemini responses
+In-memory LRU tier in front of an on-disk SQLite tier shared between processes
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+def normalize_text(text):
+    """Lowercase and collapse whitespace so cosmetic differences share a key"""
+    return " ".join((text or "").lower().split())
+
+
+def make_cache_key(question_text, question_type, options, context):
+    """Build cache key from question text, type, option list hash and context digest"""
+    option_texts = [str(getattr(opt, 'text', opt)) for opt in (options or [])]
+    options_hash = hashlib.sha1("\x1f".join(normalize_text(t) for t in option_texts).encode('utf-8')).hexdigest()
+    context_digest = hashlib.sha1((context or "").encode('utf-8')).hexdigest()
+    raw = "\x1e".join([normalize_text(question_text), question_type or "", options_hash, context_digest])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class NullAnswerCache:
+    """Cache that never stores anything (used when caching is disabled)"""
+
+    def get(self, key):
+        return None
+
+    def set(self, key, answer):
+        pass
+
+    def stats(self):
+        return {}
+
+    def close(self):
+        pass
+
+
+class AnswerCache:
+    """Two-tier answer cache: memory LRU + SQLite with TTL and size eviction"""
+
+    def __init__(self, db_path='answer_cache.sqlite3', memory_entries=512,
+                 disk_entries=20000, ttl_seconds=7 * 24 * 3600):
+        """Open (or create) the SQLite store"""
+        self.db_path = db_path
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes_since_evict = 0
+        self.counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+        }
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        # WAL + busy timeout lets several worker processes share one file
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS answers ("
+            " key TEXT PRIMARY KEY,"
+            " answer TEXT NOT NULL,"
+            " created REAL NOT NULL,"
+            " accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS answers_accessed ON answers(accessed)")
+        self._conn.commit()
+
+    def _remember(self, key, answer, created):
+        """Put entry into memory tier, evicting least recently used"""
+        self._memory[key] = (answer, created)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Return cached answer or None"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                answer, created = entry
+                if now - created <= self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    self.counters["memory_hits"] += 1
+                    return answer
+                del self._memory[key]
+
+            try:
+                row = self._conn.execute(
+                    "SELECT answer, created FROM answers WHERE key = ?", (key,)
+                ).fetchone()
+                if row and now - row[1] <= self.ttl_seconds:
+                    self._conn.execute("UPDATE answers SET accessed = ? WHERE key = ?", (now, key))
+                    self._conn.commit()
+                    self._remember(key, row[0], row[1])
+                    self.counters["disk_hits"] += 1
+                    return row[0]
+            except sqlite3.Error as e:
+                print(f"   ⚠ Answer cache read error: {e}")
+
+            self.counters["misses"] += 1
+            return None
+
+    def set(self, key, answer):
+        """Store answer in both tiers"""
+        if not answer:
+            return
+        now = time.time()
+        with self._lock:
+            self._remember(key, answer, now)
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO answers (key, answer, created, accessed) VALUES (?, ?, ?, ?)",
+                    (key, answer, now, now)
+                )
+                self._conn.commit()
+                self.counters["writes"] += 1
+                self._writes_since_evict += 1
+                if self._writes_since_evict >= 50:
+                    self._evict(now)
+            except sqlite3.Error as e:
+                print(f"   ⚠ Answer cache write error: {e}")
+
+    def _evict(self, now):
+        """Drop expired rows, then least recently accessed rows above size limit"""
+        self._writes_since_evict = 0
+        cur = self._conn.execute("DELETE FROM answers WHERE created < ?", (now - self.ttl_seconds,))
+        evicted = cur.rowcount
+        cur = self._conn.execute(
+            "DELETE FROM answers WHERE key IN ("
+            " SELECT key FROM answers ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+            (self.disk_entries,)
+        )
+        evicted += cur.rowcount
+        self._conn.commit()
+        self.counters["evictions"] += max(evicted, 0)
+
+    def stats(self):
+        """Return hit/miss counters"""
+        with self._lock:
+            stats = dict(self.counters)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        hits = stats["memory_hits"] + stats["disk_hits"]
+        stats["hit_rate"] = round(hits / lookups, 3) if lookups else 0.0
+        return stats
+
+    def close(self):
+        """Run a final eviction pass and close the database"""
+        with self._lock:
+            try:
+                self._evict(time.time())
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+
+
+def create_answer_cache(config):
+    """Create answer cache from config (returns NullAnswerCache when disabled)"""
+    cache_config = config.get('answer_cache', {})
+    if not cache_config.get('enabled', False):
+        return NullAnswerCache()
+    return AnswerCache(
+        db_path=cache_config.get('path', 'answer_cache.sqlite3'),
+        memory_entries=cache_config.get('memory_entries', 512),
+        disk_entries=cache_config.get('disk_entries', 20000),
+        ttl_seconds=cache_config.get('ttl_seconds', 7 * 24 * 3600),
+    )
@@ -0,0 +1,135 @@
+"""
+Batch runner for Smart Google Form Autofill V2
+Streams jobs from a JSONL manifest, one at a time, through one long-lived model and a
+single SessionPool driver (reset between jobs, recycled by job count or memory), writing
+one result line per job as it finishes
+
+Manifest line format:
+{"id": "job-1", "form_url": "https://...", "answers": {"Question text": "Answer"}, "options": {"answer_mode": "batch"}}
+
+- answers: optional fixed answers keyed by question text (option text, list of
+  option texts for checkboxes, list or {row: column} for grids); other questions use Gemini
+- options: optional config overrides for this job
+"""
+
+import argparse
+import json
+import os
+import time
+from browser import create_session_pool
+from main import SmartGoogleFormAutofill
+
+
+def iter_jobs(manifest_path):
+    """Yield (job_id, job) from the manifest one line at a time"""
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                job = json.loads(line)
+            except ValueError as e:
+                yield str(line_no), {"_error": f"invalid JSON: {e}"}
+                continue
+            yield str(job.get('id', line_no)), job
+
+
+def load_finished_ids(results_path):
+    """Job ids that already have a final result line (for --resume; incomplete jobs run again)"""
+    finished = set()
+    if not os.path.exists(results_path):
+        return finished
+    with open(results_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+                if result.get('status') != 'incomplete':
+                    finished.add(str(result['id']))
+            except (ValueError, KeyError, TypeError):
+                continue
+    return finished
+
+
+def run_job(autofill, pool, job_id, job):
+    """Fill one job with a pooled driver; the pool resets it afterwards (or recycles it)"""
+    try:
+        session = pool.acquire()
+    except Exception as e:
+        return {"status": "error", "error": f"no browser: {str(e)[:180]}"}
+    broken = False
+    try:
+        autofill.use_driver(session.driver)
+        autofill.start_job(job.get('answers'), job.get('options'), job_id)
+        return autofill.fill_form_smart(job['form_url'])
+    except Exception as e:
+        broken = True
+        return {"status": "error", "error": str(e)[:200]}
+    finally:
+        pool.release(session, broken=broken)
+
+
+def run_batch(manifest_path, results_path, config_file='config.json', resume=False):
+    """Run every job of the manifest, appending results to results_path"""
+    finished = load_finished_ids(results_path) if resume else set()
+    if finished:
+        print(f"⏭  Resuming: {len(finished)} jobs already done")
+
+    autofill = SmartGoogleFormAutofill(config_file=config_file)
+    # Jobs run serially (one form state, one model), so more than one driver would sit idle
+    pool = create_session_pool(autofill.config, size=1)
+    counts = {"submitted": 0, "incomplete": 0, "error": 0, "skipped": 0}
+    started = time.perf_counter()
+
+    try:
+        # The driver started in the background becomes the pool's first session
+        autofill.ready()
+        pool.adopt(autofill.driver)
+        autofill.owns_driver = False
+        with open(results_path, 'a', encoding='utf-8') as results:
+            for job_id, job in iter_jobs(manifest_path):
+                if job_id in finished:
+                    counts["skipped"] += 1
+                    continue
+
+                print(f"\n{'#'*60}\n🧾 JOB {job_id}\n{'#'*60}")
+                job_started = time.perf_counter()
+                if job.get('_error') or not job.get('form_url'):
+                    result = {"status": "error", "error": job.get('_error', "missing form_url")}
+                else:
+                    result = run_job(autofill, pool, job_id, job)
+
+                result = dict({"id": job_id, "form_url": job.get('form_url')}, **result)
+                result["seconds"] = round(time.perf_counter() - job_started, 3)
+                results.write(json.dumps(result, ensure_ascii=False) + "\n")
+                results.flush()
+                counts[result["status"]] = counts.get(result["status"], 0) + 1
+    finally:
+        autofill.close()
+        pool.close()
+        print(f"🏊 Session pool: {pool.stats['created']} drivers started, "
+              f"{pool.stats['recycled']} recycled")
+
+    elapsed = time.perf_counter() - started
+    done = counts["submitted"] + counts["incomplete"] + counts["error"]
+    print(f"\n📈 {done} jobs in {elapsed:.1f}s "
+          f"({done / elapsed * 60 if elapsed else 0:.1f} jobs/min): "
+          f"{counts['submitted']} submitted, {counts['incomplete']} incomplete, "
+          f"{counts['error']} errors, {counts['skipped']} skipped")
+    return counts
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Fill Google Forms listed in a JSONL manifest")
+    parser.add_argument("manifest", help="JSONL file, one job per line")
+    parser.add_argument("--results", default="results.jsonl", help="JSONL file to append results to")
+    parser.add_argument("--config", default="config.json", help="Path to config.json")
+    parser.add_argument("--resume", action="store_true", help="Skip jobs that already have a result line")
+    args = parser.parse_args()
+
+    run_batch(args.manifest, args.results, config_file=args.config, resume=args.resume)
+
+
+if __name__ == "__main__":
+    main()
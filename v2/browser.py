@@ -0,0 +1,344 @@
+"""
+Chrome driver creation and reusable session pool
+Keeps warm drivers between jobs so batch runs skip Chrome cold start
+"""
+
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Chrome launch profiles, selected with config browser.profile (its other keys override single settings)
+LAUNCH_PROFILES = {
+    "default": {
+        "headless": False,
+        "page_load_strategy": "normal",
+        "arguments": [],
+        "block_resources": False,
+    },
+    "performance": {
+        "headless": True,
+        "page_load_strategy": "eager",
+        "arguments": [
+            "--window-size=1280,2000",
+            "--disable-extensions",
+            "--disable-gpu",
+            "--disable-dev-shm-usage",
+            "--disable-background-networking",
+            "--disable-component-update",
+            "--disable-sync",
+            "--no-first-run",
+            "--mute-audio",
+        ],
+        "block_resources": True,
+    },
+}
+
+# Network.setBlockedURLs patterns: images, web fonts and telemetry a form never needs to be filled
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.bmp", "*.ico", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.gstatic.com*", "*fonts.googleapis.com*",
+    "*googleusercontent.com*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*play.google.com/log*", "*/gen_204*", "*/jserror*", "*/csi?*",
+]
+
+
+def launch_settings(config):
+    """Effective launch settings: the configured profile plus browser.* overrides"""
+    browser_config = config.get('browser', {})
+    profile = browser_config.get('profile', 'default')
+    settings = dict(LAUNCH_PROFILES[profile], profile=profile)
+    for key in ("headless", "page_load_strategy", "block_resources"):
+        if key in browser_config:
+            settings[key] = browser_config[key]
+    settings["arguments"] = settings["arguments"] + browser_config.get('arguments', [])
+    settings["blocked_urls"] = browser_config.get('blocked_urls', BLOCKED_URLS)
+    return settings
+
+
+def block_resources(driver, patterns):
+    """Block matching requests for this browser tab through the DevTools protocol"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        return True
+    except Exception as e:
+        print(f"⚠ Resource blocking unavailable ({type(e).__name__}), loading everything")
+        return False
+
+
+def create_driver(config):
+    """Start a new Chrome WebDriver from config (launch profile from config browser.profile)"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    settings = launch_settings(config)
+    options = webdriver.ChromeOptions()
+    if settings["headless"]:
+        options.add_argument("--headless=new")
+    for argument in settings["arguments"]:
+        options.add_argument(argument)
+    options.page_load_strategy = settings["page_load_strategy"]
+    service = Service(executable_path=config['chromedriver_path'])
+    driver = webdriver.Chrome(service=service, options=options)
+    if settings["block_resources"] and settings["blocked_urls"]:
+        block_resources(driver, settings["blocked_urls"])
+    return driver
+
+
+def reset_driver(driver):
+    """Clear cookies, storage and extra windows, then park on about:blank"""
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+    try:
+        driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+    except Exception:
+        pass
+    try:
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    except Exception:
+        driver.delete_all_cookies()
+    driver.get("about:blank")
+
+
+def _children_by_parent():
+    """Map ppid -> [pid] from /proc (Linux fallback when psutil is missing)"""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                stat = f.read()
+            ppid = int(stat[stat.rindex(')') + 2:].split()[1])
+            children.setdefault(ppid, []).append(int(entry))
+        except (OSError, ValueError):
+            continue
+    return children
+
+
+def process_tree_rss_mb(pid):
+    """Resident memory of a process and all its descendants in MB (None if unknown)"""
+    if not pid:
+        return None
+    try:
+        import psutil
+        root = psutil.Process(pid)
+        processes = [root] + root.children(recursive=True)
+        total = 0
+        for proc in processes:
+            try:
+                total += proc.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+    except ImportError:
+        pass
+    except Exception:
+        return None
+
+    if not os.path.isdir('/proc'):
+        return None
+    children = _children_by_parent()
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    total = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            with open(f'/proc/{current}/statm', 'r') as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, ValueError, IndexError):
+            pass
+        stack.extend(children.get(current, []))
+    return total / (1024 * 1024)
+
+
+def driver_rss_mb(driver):
+    """Resident memory of a driver's ChromeDriver and Chrome processes in MB (None if unknown)"""
+    try:
+        return process_tree_rss_mb(driver.service.process.pid)
+    except AttributeError:
+        return None
+
+
+class PooledSession:
+    """A warm driver plus bookkeeping for recycling"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.jobs = 0
+
+    @property
+    def pid(self):
+        try:
+            return self.driver.service.process.pid
+        except AttributeError:
+            return None
+
+    def rss_mb(self):
+        return process_tree_rss_mb(self.pid)
+
+
+class SessionPool:
+    """Thread-safe pool of N warm Chrome drivers"""
+
+    def __init__(self, config, size=2, max_jobs_per_driver=50, max_rss_mb=1500, driver_factory=None):
+        """Drivers are started lazily up to `size`"""
+        self.config = config
+        self.size = max(1, size)
+        self.max_jobs_per_driver = max_jobs_per_driver
+        self.max_rss_mb = max_rss_mb
+        self.driver_factory = driver_factory or create_driver
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+        self.stats = {"created": 0, "reused": 0, "recycled": 0}
+
+    def _new_session(self):
+        session = PooledSession(self.driver_factory(self.config))
+        with self._lock:
+            self.stats["created"] += 1
+        return session
+
+    def adopt(self, driver):
+        """Add an already started driver (e.g. from background startup) as an idle session"""
+        with self._lock:
+            self._created += 1
+            self.stats["created"] += 1
+        self._idle.put(PooledSession(driver))
+
+    def warm_up(self):
+        """Start drivers up front so the first N jobs do not pay Chrome startup"""
+        while True:
+            with self._lock:
+                if self._created >= self.size:
+                    return
+                self._created += 1
+            try:
+                self._idle.put(self._new_session())
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+    def acquire(self, timeout=None):
+        """Get a warm session (blocks while all N drivers are busy)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if self._closed:
+                raise RuntimeError("Session pool is closed")
+            try:
+                session = self._idle.get_nowait()
+                with self._lock:
+                    self.stats["reused"] += 1
+                return session
+            except queue.Empty:
+                pass
+
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                try:
+                    return self._new_session()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+
+            # Poll so a slot freed by recycling is noticed, not only returned sessions
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise queue.Empty
+            try:
+                session = self._idle.get(timeout=0.5 if remaining is None else min(0.5, remaining))
+                with self._lock:
+                    self.stats["reused"] += 1
+                return session
+            except queue.Empty:
+                continue
+
+    def reset(self, session):
+        """Clear cookies, storage and extra windows, then park on about:blank"""
+        reset_driver(session.driver)
+
+    def _should_recycle(self, session):
+        if self.max_jobs_per_driver and session.jobs >= self.max_jobs_per_driver:
+            return f"{session.jobs} jobs"
+        if self.max_rss_mb:
+            rss = session.rss_mb()
+            if rss is not None and rss >= self.max_rss_mb:
+                return f"RSS {rss:.0f} MB"
+        return None
+
+    def _discard(self, session):
+        try:
+            session.driver.quit()
+        except Exception:
+            pass
+        with self._lock:
+            self._created -= 1
+
+    def release(self, session, broken=False):
+        """Return a session after a job; broken or worn-out drivers are recycled"""
+        session.jobs += 1
+        if self._closed:
+            self._discard(session)
+            return
+
+        reason = "driver error" if broken else self._should_recycle(session)
+        if reason is None:
+            try:
+                self.reset(session)
+            except Exception as e:
+                reason = f"reset failed ({type(e).__name__})"
+
+        if reason:
+            print(f"♻️  Recycling Chrome session: {reason}")
+            with self._lock:
+                self.stats["recycled"] += 1
+            self._discard(session)
+            return
+        self._idle.put(session)
+
+    @contextmanager
+    def session(self, timeout=None):
+        """Context manager yielding a PooledSession"""
+        session = self.acquire(timeout=timeout)
+        broken = False
+        try:
+            yield session
+        except Exception:
+            broken = True
+            raise
+        finally:
+            self.release(session, broken=broken)
+
+    def close(self):
+        """Quit all idle drivers (busy ones are quit when released)"""
+        self._closed = True
+        while True:
+            try:
+                session = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(session)
+
+
+def create_session_pool(config, size=None):
+    """Create SessionPool from config (size overrides session_pool.size)"""
+    pool_config = config.get('session_pool', {})
+    return SessionPool(
+        config,
+        size=size or pool_config.get('size', 2),
+        max_jobs_per_driver=pool_config.get('max_jobs_per_driver', 50),
+        max_rss_mb=pool_config.get('max_rss_mb', 1500),
+    )
@@ -0,0 +1,210 @@
+"""
+Bulk section fill
+Applies a section's known answers (text values, choices, checkbox sets, grid rows,
+dropdown indices) with one execute_async_script call and reports which fields stuck
+"""
+
+from text_input import DEFAULT_MODES
+
+
+# Applies every field, then checks them after one task tick (Google Forms updates aria-checked
+# from its click handlers); returns {index: true|false}. A checkbox field that did not fully
+# stick is unchecked again, so the one-by-one retry starts from a clean field.
+BULK_APPLY_SCRIPT = r"""
+var fields = arguments[0], done = arguments[arguments.length - 1];
+
+function sameText(a, b) {
+    return (a || "").replace(/\r\n/g, "\n") === (b || "").replace(/\r\n/g, "\n");
+}
+
+function setValue(field, value) {
+    var proto = field.tagName === "TEXTAREA" ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    field.focus();
+    Object.getOwnPropertyDescriptor(proto, "value").set.call(field, value);
+    field.dispatchEvent(new Event("input", {bubbles: true}));
+    field.dispatchEvent(new Event("change", {bubbles: true}));
+    field.blur();
+}
+
+function checked(option) {
+    return !!option && option.getAttribute("aria-checked") === "true";
+}
+
+var applied = fields.map(function (spec) {
+    var state = {spec: spec, target: null, clicked: [], error: false};
+    try {
+        if (spec.kind === "value") {
+            state.target = spec.element.querySelector(spec.selector);
+            if (state.target) setValue(state.target, spec.value);
+        } else if (spec.kind === "choice") {
+            spec.options.forEach(function (option) {
+                if (option && !checked(option)) {
+                    option.click();
+                    state.clicked.push(option);
+                }
+            });
+        } else if (spec.kind === "select") {
+            state.target = spec.element.querySelector("select");
+            if (state.target) {
+                state.target.selectedIndex = spec.position;
+                state.target.dispatchEvent(new Event("input", {bubbles: true}));
+                state.target.dispatchEvent(new Event("change", {bubbles: true}));
+            }
+        }
+    } catch (e) {
+        state.error = true;
+    }
+    return state;
+});
+
+setTimeout(function () {
+    var results = {};
+    applied.forEach(function (state) {
+        var spec = state.spec, ok = !state.error;
+        if (ok && spec.kind === "value") {
+            ok = !!state.target && sameText(state.target.value, spec.value);
+        } else if (ok && spec.kind === "choice") {
+            ok = spec.options.length > 0 && spec.options.every(checked);
+        } else if (ok && spec.kind === "select") {
+            ok = !!state.target && state.target.selectedIndex === spec.position;
+        }
+        if (!ok && spec.toggles) {
+            state.clicked.forEach(function (option) {
+                if (checked(option)) option.click();
+            });
+        }
+        results[spec.index] = ok;
+    });
+    done(results);
+}, 0);
+"""
+
+# Field inside the question's listitem that holds a typed answer
+VALUE_SELECTORS = {
+    "text": "input",
+    "email": "input",
+    "textarea": "textarea",
+    "date": "input[type='date']",
+    "time": "input[type='time']",
+    "number": "input[type='number']",
+    "tel": "input[type='tel']",
+}
+
+
+def _option_index(choice, count):
+    choice = str(choice).strip()
+    if choice.isdigit() and 0 < int(choice) <= count:
+        return int(choice) - 1
+    return None
+
+
+class BulkFiller:
+    """Turns (question, preset) pairs into one script call; questions need bound handles"""
+
+    def __init__(self, driver, text_modes=None, timeout=10):
+        """Typed fields are only applied in bulk when their text_input mode is js"""
+        self.driver = driver
+        self.modes = dict(DEFAULT_MODES, **(text_modes or {}))
+        self.timeout = timeout
+        self.counters = {"calls": 0, "applied": 0, "failed": 0, "skipped": 0}
+
+    def plan(self, question, preset):
+        """(script field spec, history entry) for a preset in fill_question's format, None if not bulk-able"""
+        handles = question.handles
+        if handles is None or preset is None:
+            return None
+        spec = {"index": question.index, "element": handles.element}
+        entry = {"question": question.question, "type": question.type}
+
+        if question.type in VALUE_SELECTORS:
+            value = str(preset)
+            if not value or self.modes.get(question.type) != "js":
+                return None
+            spec.update(kind="value", selector=VALUE_SELECTORS[question.type], value=value)
+            entry.update(answer=value, preset=value)
+
+        elif question.type in ('radio', 'dropdown'):
+            idx = _option_index(preset, len(question.options))
+            if idx is None:
+                return None
+            option = question.options[idx]
+            if question.type == 'radio':
+                if idx >= len(handles.options) or handles.options[idx] is None:
+                    return None
+                spec.update(kind="choice", options=[handles.options[idx]])
+            else:
+                if option.position is None:
+                    return None
+                spec.update(kind="select", position=option.position)
+            entry.update(answer=option.text, preset=str(preset).strip())
+
+        elif question.type == 'checkbox':
+            picked = []
+            for choice in str(preset).split(','):
+                idx = _option_index(choice, len(question.options))
+                if idx is not None and idx not in picked:
+                    picked.append(idx)
+            if not picked or any(idx >= len(handles.options) or handles.options[idx] is None for idx in picked):
+                return None
+            spec.update(kind="choice", toggles=True, options=[handles.options[idx] for idx in picked])
+            entry.update(answer=", ".join(question.options[idx].text for idx in picked),
+                         preset=",".join(str(idx + 1) for idx in picked))
+
+        elif question.type == 'matrix':
+            if not isinstance(preset, (list, tuple)) or len(preset) != len(question.rows):
+                return None
+            options, ratings, presets = [], [], []
+            for row, cells, rating in zip(question.rows, handles.rows, preset):
+                idx = _option_index(rating, len(cells)) if rating is not None else None
+                presets.append(str(rating).strip() if idx is not None else None)
+                if idx is not None:
+                    options.append(cells[idx])
+                    ratings.append(f"{row.label}: {row.columns[idx]}")
+            if not options:
+                return None
+            spec.update(kind="choice", options=options)
+            entry.update(answer="; ".join(ratings), preset=presets)
+
+        else:
+            return None
+        return spec, entry
+
+    def apply(self, questions, presets):
+        """Apply presets ({index: preset}) of questions in one call
+
+        Returns {index: history entry} for the fields that stuck; everything else
+        (not bulk-able or not stored) is left for fill_question.
+        """
+        plans = {}
+        for question in questions:
+            planned = self.plan(question, presets.get(question.index))
+            if planned is None:
+                self.counters["skipped"] += 1
+            else:
+                plans[question.index] = planned
+        if not plans:
+            return {}
+
+        self.counters["calls"] += 1
+        try:
+            self.driver.set_script_timeout(self.timeout)
+            results = self.driver.execute_async_script(BULK_APPLY_SCRIPT, [spec for spec, _ in plans.values()])
+        except Exception as e:
+            print(f"   ⚠ Bulk fill failed ({type(e).__name__}), filling one by one")
+            self.counters["failed"] += len(plans)
+            return {}
+
+        stored = {int(index) for index, ok in (results or {}).items() if ok}
+        self.counters["applied"] += len(stored)
+        self.counters["failed"] += len(plans) - len(stored)
+        return {index: entry for index, (_, entry) in plans.items() if index in stored}
+
+    def stats(self):
+        return dict(self.counters)
+
+
+def create_bulk_filler(driver, config):
+    """Create BulkFiller from config (None when bulk_fill is off)"""
+    if not config.get('bulk_fill', True):
+        return None
+    return BulkFiller(driver, config.get('text_input_modes'), config.get('wait_timeout', 10) + 5)
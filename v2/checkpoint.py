@@ -0,0 +1,103 @@
+"""
+Run checkpoints
+Saves every answered question and section transition of a form run, so an
+interrupted run can replay its answers into a fresh page without asking Gemini again
+"""
+
+import hashlib
+import json
+import os
+import time
+from answer_cache import normalize_text
+
+
+class Checkpoint:
+    """One JSON checkpoint per form URL (and batch job id), rewritten atomically"""
+
+    def __init__(self, directory='checkpoints'):
+        """Create checkpoint directory if needed"""
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.path = None
+        self.state = None
+        self.counters = {"replayed": 0, "recorded": 0}
+
+    def _path(self, form_url, job_id):
+        key = hashlib.sha1(f"{form_url}|{job_id or ''}".encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _write(self):
+        self.state["updated"] = time.time()
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def begin(self, form_url, job_id=None, resume=True):
+        """Load the checkpoint of this form/job (or start empty); returns number of saved answers"""
+        self.path = self._path(form_url, job_id)
+        self.state = None
+        if resume and os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.state = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠ Ignoring unreadable checkpoint: {e}")
+        if self.state is None:
+            self.state = {"form_url": form_url, "job_id": job_id, "section": 1, "answers": {}}
+        return sum(len(answers) for answers in self.state["answers"].values())
+
+    def saved_answers(self, section, form_data):
+        """{index: preset} for questions of this section answered in an earlier run (same text and type)"""
+        saved = self.state["answers"].get(str(section), {})
+        presets = {}
+        for question_info in form_data:
+            entry = saved.get(str(question_info.index))
+            if (entry and entry.get('preset') is not None and entry['type'] == question_info.type
+                    and normalize_text(entry['question']) == normalize_text(question_info.question)):
+                presets[question_info.index] = entry['preset']
+        return presets
+
+    def replayed(self, count):
+        """Count saved answers that were applied to the page again"""
+        self.counters["replayed"] += count
+
+    def record(self, section, question_info, history_entry):
+        """Save the answer just filled in (preset format) and flush to disk"""
+        if 'preset' not in history_entry:
+            return
+        self.state["answers"].setdefault(str(section), {})[str(question_info.index)] = {
+            "question": question_info.question,
+            "type": question_info.type,
+            "preset": history_entry['preset'],
+            "answer": history_entry['answer'],
+        }
+        self.counters["recorded"] += 1
+        try:
+            self._write()
+        except OSError as e:
+            print(f"   ⚠ Could not write checkpoint: {e}")
+
+    def advance(self, section):
+        """Record that the run moved on to `section`"""
+        self.state["section"] = section
+        try:
+            self._write()
+        except OSError as e:
+            print(f"   ⚠ Could not write checkpoint: {e}")
+
+    def finish(self):
+        """Form submitted, the checkpoint is no longer needed"""
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def stats(self):
+        return dict(self.counters)
+
+
+def create_checkpoint(config):
+    """Create Checkpoint from config (None when disabled)"""
+    checkpoint_config = config.get('checkpoint', {})
+    if not checkpoint_config.get('enabled', False):
+        return None
+    return Checkpoint(checkpoint_config.get('directory', 'checkpoints'))
@@ -0,0 +1,123 @@
+"""
+Relevance-ranked prompt context
+Scores previous answers against the current question (BM25 over accent-folded terms)
+and packs the best ones into a token budget
+"""
+
+import math
+import re
+from collections import Counter
+from generators import fold_accents
+from prompts import estimate_tokens
+
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# Accent-folded English and Vietnamese function words that say nothing about relevance
+STOPWORDS = frozenset("""
+a an and are as at be by can do does did for from has have how i in is it of on or
+please that the this to was what when where which who why will with you your
+ban bao cac cho co cua da duoc gi hay khong la lam mot nao nay nhung nhu thi trong va ve voi
+""".split())
+
+CONTEXT_HEADER = "\n📋 Form Context (Previous Answers):\n"
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+
+def terms(text):
+    """Accent-folded, lowercased word list without stopwords and 1-char tokens"""
+    return [t for t in TOKEN_PATTERN.findall(fold_accents(text)) if len(t) > 1 and t not in STOPWORDS]
+
+
+class _Entry:
+    """One history item with its rendered line and precomputed term vector"""
+
+    __slots__ = ("source", "text", "tokens", "vector", "length")
+
+    def __init__(self, source, text, vector):
+        self.source = source
+        self.text = text
+        self.tokens = estimate_tokens(text)
+        self.vector = vector
+        self.length = sum(vector.values())
+
+
+class ContextSelector:
+    """Picks the most relevant previous answers for a question within a token budget"""
+
+    def __init__(self, token_budget=400, max_answer_chars=200, recent=2):
+        """recent: the last N answers are always kept (if they fit), for consistency"""
+        self.token_budget = token_budget
+        self.max_answer_chars = max_answer_chars
+        self.recent = recent
+        self.entries = []
+        self.doc_freq = Counter()
+        self.total_length = 0
+
+    def _index(self, history):
+        """Add vectors for entries appended since the last call (rebuild if history was reset)"""
+        if len(history) < len(self.entries) or (self.entries and history[0] is not self.entries[0].source):
+            self.entries = []
+            self.doc_freq = Counter()
+            self.total_length = 0
+        for qa in history[len(self.entries):]:
+            answer = str(qa['answer'])
+            if len(answer) > self.max_answer_chars:
+                answer = answer[:self.max_answer_chars].rstrip() + "…"
+            text = f"Q: {qa['question'][:80]}...\nA: {answer}\n\n"
+            entry = _Entry(qa, text, Counter(terms(f"{qa['question']} {qa['answer']}")))
+            self.entries.append(entry)
+            self.doc_freq.update(entry.vector.keys())
+            self.total_length += entry.length
+
+    def _score(self, entry, query_terms, average_length):
+        count = len(self.entries)
+        score = 0.0
+        for term in query_terms:
+            tf = entry.vector.get(term)
+            if not tf:
+                continue
+            idf = math.log(1 + (count - self.doc_freq[term] + 0.5) / (self.doc_freq[term] + 0.5))
+            score += idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * entry.length / average_length))
+        return score
+
+    def select(self, history, query=""):
+        """Context string of the best-scoring entries, in original order ("" when history is empty)"""
+        if not history:
+            return ""
+        self._index(history)
+
+        query_terms = set(terms(query))
+        average_length = max(self.total_length / len(self.entries), 1)
+        newest = len(self.entries) - 1
+        # Pinned recent answers first, then by relevance, newest first on ties
+        ranked = sorted(
+            range(len(self.entries)),
+            key=lambda i: (i > newest - self.recent,
+                           self._score(self.entries[i], query_terms, average_length) if query_terms else 0.0,
+                           i),
+            reverse=True,
+        )
+
+        budget = self.token_budget - estimate_tokens(CONTEXT_HEADER)
+        chosen = []
+        for i in ranked:
+            if self.entries[i].tokens <= budget:
+                chosen.append(i)
+                budget -= self.entries[i].tokens
+        if not chosen:
+            return ""
+        return CONTEXT_HEADER + "".join(self.entries[i].text for i in sorted(chosen))
+
+
+def create_context_selector(config):
+    """Create ContextSelector from config"""
+    context_config = config.get('context', {})
+    return ContextSelector(
+        token_budget=context_config.get('token_budget', 400),
+        max_answer_chars=context_config.get('max_answer_chars', 200),
+        recent=context_config.get('recent', 2),
+    )
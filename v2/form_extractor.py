@@ -0,0 +1,146 @@
+"""
+Single round-trip form extraction
+Serializes the whole form schema with one execute_script call into the same
+Question records as the element-by-element path in main.py (locators, no elements)
+"""
+
+from question_model import Option, Question, matrix_rows
+
+# Mirrors SmartGoogleFormAutofill.extract_form_structure_legacy step by step.
+# visibleText approximates WebElement.text (rendered text, whitespace collapsed, "" when hidden).
+EXTRACT_FORM_SCRIPT = r"""
+function visibleText(el) {
+    if (!el) return "";
+    // <option> has no layout box inside a closed <select>, WebDriver still reports its text
+    var raw = el.tagName === "OPTION" ? el.textContent : (el.getClientRects().length ? el.innerText : "");
+    return (raw || "")
+        .replace(/\u00a0/g, " ")
+        .split("\n")
+        .map(function (line) { return line.replace(/[ \t\r\f\v]+/g, " ").trim(); })
+        .join("\n")
+        .trim();
+}
+
+function attr(el, name) {
+    var value = el.getAttribute(name);
+    return value === null ? "" : value;
+}
+
+function optionText(option, attrName) {
+    var text = attr(option, attrName);
+    if (text) return text;
+    var label = option.querySelector(".aDTYNe");
+    return label ? visibleText(label) : visibleText(option);
+}
+
+var items = document.querySelectorAll("div[role='listitem']");
+var result = [];
+
+for (var i = 0; i < items.length; i++) {
+    var item = items[i];
+    var entry = {index: i + 1};
+    result.push(entry);
+    try {
+        var title = item.querySelector(".M7eMe");
+        if (!title) { entry.missingTitle = true; continue; }
+        entry.question = visibleText(title);
+        if (!entry.question) continue;
+
+        var groups = item.querySelectorAll("div[role='radiogroup']");
+        if (groups.length > 1) {
+            entry.type = "matrix";
+            entry.rows = [];
+            for (var g = 0; g < groups.length; g++) {
+                var rowLabel = attr(groups[g], "aria-label");
+                var rowOptions = Array.prototype.slice.call(groups[g].querySelectorAll("div[role='radio']"));
+                if (rowLabel && rowOptions.length) {
+                    entry.rows.push({
+                        group: g,
+                        label: rowLabel,
+                        columns: rowOptions.map(function (opt, k) {
+                            return attr(opt, "data-value") || attr(opt, "aria-label") || String(k + 1);
+                        })
+                    });
+                }
+            }
+            continue;
+        }
+
+        var choiceTypes = [["radio", "data-value"], ["checkbox", "aria-label"]];
+        var matched = false;
+        for (var c = 0; c < choiceTypes.length && !matched; c++) {
+            var choices = item.querySelectorAll("div[role='" + choiceTypes[c][0] + "']");
+            if (!choices.length) continue;
+            matched = true;
+            entry.type = choiceTypes[c][0];
+            entry.options = [];
+            for (var k = 0; k < choices.length; k++) {
+                var text = optionText(choices[k], choiceTypes[c][1]);
+                if (text) entry.options.push({text: text, pos: k});
+            }
+        }
+        if (matched) continue;
+
+        var simpleTypes = [
+            ["input[type='text']", "text"],
+            ["input[type='email']", "email"],
+            ["textarea", "textarea"],
+            ["select", "dropdown"],
+            ["input[type='date']", "date"],
+            ["input[type='time']", "time"],
+            ["input[type='number']", "number"],
+            ["input[type='tel']", "tel"]
+        ];
+        for (var s = 0; s < simpleTypes.length; s++) {
+            var field = item.querySelector(simpleTypes[s][0]);
+            if (!field) continue;
+            entry.type = simpleTypes[s][1];
+            if (entry.type === "dropdown") {
+                entry.options = [];
+                var opts = field.getElementsByTagName("option");
+                for (var o = 0; o < opts.length; o++) {
+                    var optText = visibleText(opts[o]).trim();
+                    if (optText && optText.toLowerCase() !== "choose") {
+                        entry.options.push({text: optText, value: opts[o].value, pos: o});
+                    }
+                }
+            }
+            break;
+        }
+    } catch (e) {
+        entry.error = e.name || "Error";
+    }
+}
+return result;
+"""
+
+
+def extract_form_structure_script(driver):
+    """Extract form with one execute_script call (same output as the legacy path, without handles)"""
+    raw_items = driver.execute_script(EXTRACT_FORM_SCRIPT)
+    form_data = []
+
+    for item in raw_items:
+        idx = item['index']
+        if item.get('missingTitle'):
+            print(f"⚠ Q{idx}: Cannot find question - NoSuchElementException")
+            continue
+        if item.get('error'):
+            print(f"⚠ Error parsing Q{idx}: {item['error']}")
+            continue
+        if not item.get('question') or not item.get('type'):
+            continue
+
+        rows = matrix_rows((row['label'], row['group'], row['columns']) for row in item.get('rows', []))
+        if item['type'] == 'matrix' and not rows:
+            continue
+
+        form_data.append(Question(
+            idx,
+            item['question'],
+            item['type'],
+            options=[Option(opt['text'], opt.get('value'), opt['pos']) for opt in item.get('options', [])],
+            rows=rows,
+        ))
+
+    return form_data
@@ -0,0 +1,141 @@
+"""
+Local deterministic answer generators
+Answers email/tel/date/time/number fields without calling Gemini
+"""
+
+import datetime
+import random
+import re
+import unicodedata
+from collections import Counter
+
+
+GENERATED_TYPES = ["email", "tel", "date", "time", "number"]
+
+VI_FAMILY_NAMES = ["Nguyễn", "Trần", "Lê", "Phạm", "Hoàng", "Huỳnh", "Phan", "Vũ", "Võ", "Đặng", "Bùi", "Đỗ"]
+VI_MIDDLE_NAMES = ["Văn", "Thị", "Minh", "Ngọc", "Thanh", "Đức", "Hoài", "Gia", "Quốc", "Bảo"]
+VI_GIVEN_NAMES = ["An", "Bình", "Chi", "Dũng", "Hà", "Hùng", "Lan", "Linh", "Nam", "Phúc", "Quân", "Trang", "Tuấn", "Vy"]
+EN_GIVEN_NAMES = ["James", "Emma", "Liam", "Olivia", "Noah", "Ava", "Lucas", "Mia", "Ethan", "Sophia"]
+EN_FAMILY_NAMES = ["Smith", "Johnson", "Brown", "Taylor", "Miller", "Davis", "Wilson", "Clark", "Lewis", "Walker"]
+
+VI_MOBILE_PREFIXES = ["032", "033", "034", "035", "036", "037", "038", "039", "070", "076", "077", "078",
+                      "079", "081", "082", "083", "084", "085", "086", "088", "089", "090", "091", "093",
+                      "094", "096", "097", "098"]
+EMAIL_DOMAINS = ["gmail.com", "yahoo.com", "outlook.com"]
+
+VI_CHARS = re.compile(r"[ăâđêôơưáàảãạấầẩẫậắằẳẵặéèẻẽẹếềểễệíìỉĩịóòỏõọốồổỗộớờởỡợúùủũụứừửữựýỳỷỹỵ]", re.IGNORECASE)
+NAME_QUESTION = re.compile(r"\b(name|full name|họ tên|họ và tên|tên)\b", re.IGNORECASE)
+
+# (patterns that must all match the accent-folded question, low, high) for number fields;
+# unmatched questions are left to Gemini
+THIS_YEAR = datetime.date.today().year
+NUMBER_RULES = [
+    ((r"\b(age|tuoi|how old)\b",), 18, 30),
+    ((r"\b(how many|number of|bao nhieu|so luong)\b",), 1, 5),
+    ((r"(%|\bpercent|\bphan tram\b)",), 50, 95),
+    ((r"\b(score|diem|gpa)\b",), 6, 9),
+    ((r"\b(hours?|gio)\b",), 1, 8),
+    ((r"\b(year|nam)\b", r"(birth|\bsinh\b)"), THIS_YEAR - 30, THIS_YEAR - 18),
+    ((r"\b(year|nam)\b", r"(graduat|tot nghiep|du kien|expect|plan)"), THIS_YEAR, THIS_YEAR + 3),
+    ((r"\b(year|nam)\b",), THIS_YEAR - 5, THIS_YEAR),
+]
+
+
+def fold_accents(text):
+    """Strip Vietnamese diacritics (đ -> d) and lowercase"""
+    text = (text or "").replace("đ", "d").replace("Đ", "D")
+    return "".join(c for c in unicodedata.normalize("NFD", text) if unicodedata.category(c) != "Mn").lower()
+
+
+class LocalAnswerGenerator:
+    """Seeded, locale-aware generator for typed form fields"""
+
+    def __init__(self, seed=None, locale="auto", types=None):
+        """locale is 'vi', 'en' or 'auto' (detected from question text); seed None picks one per run"""
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.locale = locale
+        self.types = set(types or GENERATED_TYPES)
+        self.hits = Counter()
+        self.deferred = Counter()
+
+    def _rng(self, question_text):
+        # String seeds are hashed deterministically, so runs are reproducible
+        return random.Random(f"{self.seed}:{fold_accents(question_text)}")
+
+    def _locale_for(self, question_text):
+        if self.locale != "auto":
+            return self.locale
+        return "vi" if VI_CHARS.search(question_text or "") else "en"
+
+    def _known_name(self, history):
+        for qa in history:
+            if qa.get('type') == 'text' and NAME_QUESTION.search(qa['question']):
+                return qa['answer']
+        return None
+
+    def full_name(self, rng, locale):
+        if locale == "vi":
+            return f"{rng.choice(VI_FAMILY_NAMES)} {rng.choice(VI_MIDDLE_NAMES)} {rng.choice(VI_GIVEN_NAMES)}"
+        return f"{rng.choice(EN_GIVEN_NAMES)} {rng.choice(EN_FAMILY_NAMES)}"
+
+    def email(self, question_text, history):
+        rng = self._rng(question_text)
+        name = self._known_name(history) or self.full_name(rng, self._locale_for(question_text))
+        local = re.sub(r"[^a-z0-9]", "", fold_accents(name))
+        return f"{local}{rng.randint(10, 9999)}@{rng.choice(EMAIL_DOMAINS)}"
+
+    def tel(self, question_text, history):
+        rng = self._rng(question_text)
+        if self._locale_for(question_text) == "vi":
+            return rng.choice(VI_MOBILE_PREFIXES) + "".join(str(rng.randint(0, 9)) for _ in range(7))
+        return f"+1-{rng.randint(201, 989)}-{rng.randint(200, 999)}-{rng.randint(0, 9999):04d}"
+
+    def date(self, question_text, history):
+        rng = self._rng(question_text)
+        today = datetime.date.today()
+        folded = fold_accents(question_text)
+        if any(k in folded for k in ("birth", "sinh", "dob")):
+            value = today - datetime.timedelta(days=rng.randint(18 * 365, 30 * 365))
+        else:
+            value = today - datetime.timedelta(days=rng.randint(0, 365))
+        return value.strftime("%Y-%m-%d")
+
+    def time(self, question_text, history):
+        rng = self._rng(question_text)
+        return f"{rng.randint(8, 17):02d}:{rng.choice([0, 15, 30, 45]):02d}"
+
+    def number(self, question_text, history):
+        folded = fold_accents(question_text)
+        for patterns, low, high in NUMBER_RULES:
+            if all(re.search(pattern, folded) for pattern in patterns):
+                return str(self._rng(question_text).randint(low, high))
+        return None
+
+    def generate(self, question_info, history=(), count=True):
+        """Return a formatted answer, or None when the question needs Gemini"""
+        question_type = question_info.type
+        if question_type not in self.types:
+            return None
+        answer = getattr(self, question_type)(question_info.question, history)
+        if not count:
+            return answer
+        if answer is None:
+            self.deferred[question_type] += 1
+        else:
+            self.hits[question_type] += 1
+        return answer
+
+    def stats(self):
+        return {"hits": dict(self.hits), "deferred": dict(self.deferred)}
+
+
+def create_generator(config):
+    """Create LocalAnswerGenerator from config (None when disabled)"""
+    generator_config = config.get('local_generators', {})
+    if not generator_config.get('enabled', False):
+        return None
+    return LocalAnswerGenerator(
+        seed=generator_config.get('seed'),
+        locale=generator_config.get('locale', 'auto'),
+        types=generator_config.get('types', GENERATED_TYPES),
+    )
@@ -3,38 +3,133 @@ Smart Google Form Autofill with Gemini AI - Version 2
 Auto-detects form structure and fills with AI-generated answers
 """
 
+from startup import Startup  # first: its import time marks process start
+import argparse
 import json
 import time
-import google.generativeai as genai
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from answer_cache import create_answer_cache, make_cache_key, normalize_text
+from checkpoint import create_checkpoint
+from context_selector import create_context_selector
+from browser import create_driver, driver_rss_mb, launch_settings
+from bulk_fill import create_bulk_filler
+from form_extractor import extract_form_structure_script
+from generators import create_generator
+from readiness import create_waiter
+from navigation import create_navigator
+from prompts import CHOICE_TEMPLATES, create_model, format_options
+from question_model import Option, Question, matrix_rows, resolve_handles
+from rate_limit import RetriesExhausted, create_rate_limited_model
+from schema_cache import create_schema_cache
+from scheduler import create_scheduler
+from text_input import create_text_input
+from tracing import create_tracer
 
 
 class SmartGoogleFormAutofill:
     """Smart form autofill using Gemini AI"""
     
-    def __init__(self, config_file='config.json'):
-        """Initialize with config file"""
-        with open(config_file, 'r', encoding='utf-8') as f:
-            self.config = json.load(f)
+    def __init__(self, config_file='config.json', driver=None):
+        """Initialize with config file (pass a pooled driver to skip Chrome startup)
+
+        Chrome and the Gemini client start on background threads (selenium and
+        google.generativeai are imported there too); ready() waits for them.
+        """
+        self.startup = Startup()
+        with self.startup.phase("config"):
+            with open(config_file, 'r', encoding='utf-8') as f:
+                self.config = json.load(f)
+        self.base_config = dict(self.config)
+        self.job_answers = {}
         
-        genai.configure(api_key=self.config['gemini_api_key'])
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
+        self.tracer = create_tracer(self.config, 'v2')
+        self.owns_driver = driver is None
+        self.driver = driver
+        if driver is None:
+            self.startup.background("chrome", self.start_driver)
+        self.startup.background("gemini", self.start_model)
+        self.model = self.prompts = None
+        self.waiter = None
+        self.bulk_filler = None
         
-        from selenium.webdriver.chrome.service import Service
-        service = Service(executable_path=self.config['chromedriver_path'])
-        self.driver = webdriver.Chrome(service=service)
-        self.wait = WebDriverWait(self.driver, 10)
-        self.form_structure = []
-        self.answer_history = []  # Store Q&A pairs for context
+        with self.startup.phase("helpers"):
+            self.form_structure = []
+            self.answer_history = []  # Store Q&A pairs for context
+            self.answer_cache = create_answer_cache(self.config)
+            self.local_generator = create_generator(self.config)
+            self.schema_cache = create_schema_cache(self.config)
+            self.checkpoint = create_checkpoint(self.config)
+        self.job_id = None
+        self.section = 0
+        self.filled = set()  # Indices answered in the current section
+    
+    def start_driver(self):
+        """Launch Chrome (background startup phase)"""
+        with self.tracer.span("driver.start"):
+            return create_driver(self.config)
+    
+    def start_model(self):
+        """Import and configure Gemini, build the rate-limited model (background startup phase)"""
+        with self.tracer.span("model.start"):
+            import google.generativeai as genai
+            genai.configure(api_key=self.config['gemini_api_key'])
+            model, prompts = create_model(genai, 'gemini-2.5-flash')
+            return create_rate_limited_model(model, self.config), prompts
+    
+    def ready(self):
+        """Wait for background startup (once) and attach the driver helpers"""
+        if self.waiter is not None:
+            return
+        self.model, self.prompts = self.startup.result("gemini")
+        if self.driver is None:
+            self.driver = self.startup.result("chrome")
+        self.tracer.instrument_driver(self.driver)
+        self.attach_helpers()
+    
+    def use_driver(self, driver):
+        """Fill the next forms with `driver` (e.g. a SessionPool session); its owner quits it"""
+        self.ready()
+        self.owns_driver = False
+        if driver is not self.driver:
+            self.driver = driver
+            self.tracer.instrument_driver(driver)
+            self.attach_helpers()
+    
+    def attach_helpers(self):
+        """(Re)build the helpers that read per-job config keys (pacing, text entry, context, ...)"""
+        self.waiter = create_waiter(self.driver, self.config, self.tracer)
+        self.text_input = create_text_input(self.driver, self.config)
+        self.navigator = create_navigator(self.driver, self.config)
+        self.bulk_filler = create_bulk_filler(self.driver, self.config)
+        self.context_selector = create_context_selector(self.config)
+        self.scheduler = create_scheduler(self, self.config)
     
     def extract_form_structure(self):
         """Extract all questions and options from form"""
         print("\n🔍 Analyzing form structure...")
         
+        if self.config.get('extraction_mode', 'script') == 'script':
+            try:
+                return extract_form_structure_script(self.driver)
+            except Exception as e:
+                print(f"⚠ Script extraction failed ({type(e).__name__}), using element-by-element path")
+        
+        return self.extract_form_structure_legacy()
+    
+    def load_section_structure(self, form_url, section):
+        """Section questions from the schema cache when the form is unchanged, else extracted"""
+        if self.schema_cache is not None and self.config.get('extraction_mode', 'script') == 'script':
+            print("\n🔍 Analyzing form structure...")
+            try:
+                with self.tracer.span("extract_form_structure", section=section, cached=True):
+                    return self.schema_cache.load_section(self.driver, form_url, section)
+            except Exception as e:
+                print(f"⚠ Schema cache failed ({type(e).__name__}), extracting directly")
+        with self.tracer.span("extract_form_structure", section=section, cached=False):
+            return self.extract_form_structure()
+    
+    def extract_form_structure_legacy(self):
+        """Extract all questions and options element by element (one WebDriver call per probe)"""
+        from selenium.webdriver.common.by import By
         try:
             questions = self.driver.find_elements(By.CSS_SELECTOR, "div[role='listitem']")
             form_data = []
@@ -50,42 +145,44 @@ class SmartGoogleFormAutofill:
                     if not question_text:
                         continue
                     
-                    question_info = {
-                        "index": idx,
-                        "question": question_text,
-                        "type": None,
-                        "options": [],
-                        "element": question_elem
-                    }
+                    def add(question_type, options=(), option_elements=(), rows=(), row_elements=()):
+                        question_info = Question(idx, question_text, question_type, options=options,
+                                                 rows=matrix_rows(rows))
+                        question_info.bind(question_elem, option_elements, row_elements)
+                        form_data.append(question_info)
+                    
+                    options = []
+                    option_elements = []
                     
                     # Detect matrix/grid questions (multiple radiogroups)
                     radiogroups = question_elem.find_elements(By.CSS_SELECTOR, "div[role='radiogroup']")
                     if len(radiogroups) > 1:
-                        question_info["type"] = "matrix"
-                        question_info["rows"] = []
+                        rows = []
+                        row_elements = []
                         
-                        for row in radiogroups:
+                        for group, row in enumerate(radiogroups):
                             try:
                                 row_label = row.get_attribute("aria-label")
                                 row_options = row.find_elements(By.CSS_SELECTOR, "div[role='radio']")
                                 
                                 if row_label and row_options:
-                                    question_info["rows"].append({
-                                        "label": row_label,
-                                        "options": row_options
-                                    })
+                                    columns = [
+                                        opt.get_attribute("data-value") or opt.get_attribute("aria-label") or str(i + 1)
+                                        for i, opt in enumerate(row_options)
+                                    ]
+                                    rows.append((row_label, group, columns))
+                                    row_elements.append(row_options)
                             except Exception as e:
                                 print(f"   ⚠ Matrix row error: {str(e)[:50]}")
                         
-                        if question_info["rows"]:
-                            form_data.append(question_info)
+                        if rows:
+                            add("matrix", rows=rows, row_elements=row_elements)
                         continue
                     
                     # Detect radio buttons
                     radio_options = question_elem.find_elements(By.CSS_SELECTOR, "div[role='radio']")
                     if radio_options:
-                        question_info["type"] = "radio"
-                        for option in radio_options:
+                        for position, option in enumerate(radio_options):
                             option_text = option.get_attribute("data-value")
                             if not option_text:
                                 try:
@@ -93,18 +190,15 @@ class SmartGoogleFormAutofill:
                                 except:
                                     option_text = option.text
                             if option_text:
-                                question_info["options"].append({
-                                    "text": option_text,
-                                    "element": option
-                                })
-                        form_data.append(question_info)
+                                options.append(Option(option_text, position=position))
+                                option_elements.append(option)
+                        add("radio", options, option_elements)
                         continue
                     
                     # Detect checkboxes
                     checkbox_options = question_elem.find_elements(By.CSS_SELECTOR, "div[role='checkbox']")
                     if checkbox_options:
-                        question_info["type"] = "checkbox"
-                        for option in checkbox_options:
+                        for position, option in enumerate(checkbox_options):
                             option_text = option.get_attribute("aria-label")
                             if not option_text:
                                 try:
@@ -112,77 +206,64 @@ class SmartGoogleFormAutofill:
                                 except:
                                     option_text = option.text
                             if option_text:
-                                question_info["options"].append({
-                                    "text": option_text,
-                                    "element": option
-                                })
-                        form_data.append(question_info)
+                                options.append(Option(option_text, position=position))
+                                option_elements.append(option)
+                        add("checkbox", options, option_elements)
                         continue
                     
                     # Detect text input
                     text_inputs = question_elem.find_elements(By.CSS_SELECTOR, "input[type='text']")
                     if text_inputs:
-                        question_info["type"] = "text"
-                        form_data.append(question_info)
+                        add("text")
                         continue
                     
                     # Detect email input
                     email_inputs = question_elem.find_elements(By.CSS_SELECTOR, "input[type='email']")
                     if email_inputs:
-                        question_info["type"] = "email"
-                        form_data.append(question_info)
+                        add("email")
                         continue
                     
                     # Detect textarea
                     textareas = question_elem.find_elements(By.CSS_SELECTOR, "textarea")
                     if textareas:
-                        question_info["type"] = "textarea"
-                        form_data.append(question_info)
+                        add("textarea")
                         continue
                     
                     # Detect dropdown/select
                     selects = question_elem.find_elements(By.CSS_SELECTOR, "select")
                     if selects:
-                        question_info["type"] = "dropdown"
                         select_elem = selects[0]
                         options_elem = select_elem.find_elements(By.TAG_NAME, "option")
-                        for opt in options_elem:
+                        for position, opt in enumerate(options_elem):
                             opt_text = opt.text.strip()
                             if opt_text and opt_text.lower() != "choose":
-                                question_info["options"].append({
-                                    "text": opt_text,
-                                    "value": opt.get_attribute("value"),
-                                    "element": opt
-                                })
-                        form_data.append(question_info)
+                                options.append(Option(opt_text, opt.get_attribute("value"), position))
+                                option_elements.append(opt)
+                        add("dropdown", options, option_elements)
                         continue
                     
                     # Detect date input
                     date_inputs = question_elem.find_elements(By.CSS_SELECTOR, "input[type='date']")
                     if date_inputs:
-                        question_info["type"] = "date"
-                        form_data.append(question_info)
+                        add("date")
                         continue
                     
                     # Detect time input
                     time_inputs = question_elem.find_elements(By.CSS_SELECTOR, "input[type='time']")
                     if time_inputs:
-                        question_info["type"] = "time"
-                        form_data.append(question_info)
+                        add("time")
                         continue
                     
                     # Detect number input
                     number_inputs = question_elem.find_elements(By.CSS_SELECTOR, "input[type='number']")
                     if number_inputs:
-                        question_info["type"] = "number"
-                        form_data.append(question_info)
+                        add("number")
                         continue
                     
                     # Detect telephone input
                     tel_inputs = question_elem.find_elements(By.CSS_SELECTOR, "input[type='tel']")
                     if tel_inputs:
-                        question_info["type"] = "tel"
-                        form_data.append(question_info)
+                        add("tel")
                         continue
                     
                 except Exception as e:
@@ -195,363 +276,587 @@ class SmartGoogleFormAutofill:
             print(f"❌ Error extracting form: {e}")
             return []
     
-    def build_context_string(self):
-        """Build context string from answer history"""
-        if not self.answer_history:
-            return ""
-        
-        context = "\n📋 Form Context (Previous Answers):\n"
-        for qa in self.answer_history[-10:]:  # Keep last 10 Q&A for context
-            context += f"Q: {qa['question'][:80]}...\nA: {qa['answer']}\n\n"
-        return context
+    def generate(self, prompt, template):
+        """Single Gemini call, traced as an llm span and counted per template"""
+        with self.tracer.span("llm.generate_content", "llm", template=template, prompt_chars=len(prompt)):
+            response = self.model.generate_content(prompt)
+        self.prompts.record(template, prompt, response)
+        return response
     
-    def ask_gemini_for_choice(self, question_text, options, question_type):
+    def build_context_string(self, query=""):
+        """Previous answers most relevant to query, packed into the context token budget"""
+        return self.context_selector.select(self.answer_history, query)
+    
+    def ask_gemini_for_choice(self, question_text, options, question_type, use_context=True):
         """Ask Gemini for answer or choice with context"""
-        context = self.build_context_string()
-        
-        if question_type in ["text", "email", "textarea"]:
-            prompt = f"""You are filling out a Google Form intelligently.
-{context}
-Current Question: {question_text}
-
-Provide a realistic, concise answer in Vietnamese if the form is in Vietnamese, else in English.
-For dates, use YYYY format.
-Make answer consistent with previous context if applicable.
-Answer only, no explanation."""
-            
-        elif question_type == "radio":
-            options_text = "\n".join([f"{i+1}. {opt['text']}" for i, opt in enumerate(options)])
-            prompt = f"""You are filling out a Google Form intelligently.
-{context}
-Current Question: {question_text}
-
-Options:
-{options_text}
-
-Choose the MOST APPROPRIATE option considering previous answers for consistency.
-Respond with ONLY the number (1, 2, 3, etc.)."""
-            
-        elif question_type == "checkbox":
-            options_text = "\n".join([f"{i+1}. {opt['text']}" for i, opt in enumerate(options)])
-            prompt = f"""You are filling out a Google Form intelligently.
-{context}
-Current Question: {question_text}
-
-Options:
-{options_text}
-
-Choose appropriate options for consistency with previous answers.
-Respond with comma-separated numbers (e.g., "1,3,4").
-Only numbers, no explanation."""
-            
-        elif question_type in ["scale", "matrix"]:
-            prompt = f"""You are filling out a Google Form intelligently.
-{context}
-Current Question: {question_text}
-
-This is a rating scale (1-5: 1=lowest, 5=highest).
-Choose an appropriate rating consistent with previous answers.
-Respond with ONLY the number.
-Generally prefer positive ratings (4-5) unless context suggests otherwise."""
-        
-        elif question_type == "dropdown":
-            options_text = "\n".join([f"{i+1}. {opt['text']}" for i, opt in enumerate(options)])
-            prompt = f"""You are filling out a Google Form intelligently.
-{context}
-Current Question: {question_text}
-
-Dropdown Options:
-{options_text}
-
-Choose the MOST APPROPRIATE option from the dropdown.
-Respond with ONLY the option number (1, 2, 3, etc.)."""
-        
-        elif question_type == "date":
-            prompt = f"""You are filling out a Google Form intelligently.
-{context}
-Current Question: {question_text}
-
-This is a date field. Provide a realistic date.
-Respond with ONLY the date in YYYY-MM-DD format (e.g., 2024-01-15).
-Choose a reasonable date relevant to the context if possible."""
-        
-        elif question_type == "time":
-            prompt = f"""You are filling out a Google Form intelligently.
-{context}
-Current Question: {question_text}
-
-This is a time field. Provide a realistic time.
-Respond with ONLY the time in HH:MM format using 24-hour time (e.g., 14:30).
-Choose a reasonable time relevant to the context if possible."""
-        
-        elif question_type == "number":
-            prompt = f"""You are filling out a Google Form intelligently.
-{context}
-Current Question: {question_text}
-
-This is a numeric field. Provide a realistic number.
-Respond with ONLY the number, no text.
-Choose a reasonable value relevant to the context if possible."""
+        template = CHOICE_TEMPLATES.get(question_type)
+        if template is None:
+            return None
         
-        elif question_type == "tel":
-            prompt = f"""You are filling out a Google Form intelligently.
-{context}
-Current Question: {question_text}
-
-This is a telephone/phone number field. Provide a realistic phone number.
-Respond with ONLY the phone number in a standard format (e.g., +1-XXX-XXX-XXXX or XXXXXXXXXX).
-Choose a reasonable number relevant to the context if possible."""
+        query = " ".join([question_text] + [opt.text for opt in options or []])
+        context = self.build_context_string(query) if use_context else ""
         
-        elif question_type in ["scale", "matrix"]:
-            prompt = f"""You are filling out a Google Form intelligently.
-{context}
-Current Question: {question_text}
-
-This is a rating scale (1-5: 1=lowest, 5=highest).
-Choose an appropriate rating consistent with previous answers.
-Respond with ONLY the number.
-Generally prefer positive ratings (4-5) unless context suggests otherwise."""
-        
-        else:
-            return None
+        cache_key = make_cache_key(question_text, question_type, options, context)
+        cached = self.answer_cache.get(cache_key)
+        if cached is not None:
+            print(f"   💾 Cached: {cached}")
+            return cached
         
+        prompt = self.prompts.render(template, context=context, question=question_text,
+                                     options=format_options(options))
         try:
-            response = self.model.generate_content(prompt)
+            response = self.generate(prompt, template)
             answer = response.text.strip()
             print(f"   🤖 Gemini: {answer}")
+            self.answer_cache.set(cache_key, answer)
             return answer
+        except RetriesExhausted:
+            raise
         except Exception as e:
             print(f"   ⚠ Gemini error: {e}")
             return None
     
-    def fill_question(self, question_info):
-        """Fill a single question"""
-        print(f"\n📝 Q{question_info['index']}: {question_info['question'][:60]}...")
-        print(f"   Type: {question_info['type']}")
+    def stream_textarea_answer(self, question_text, element):
+        """Ask Gemini with stream=True, appending chunks to element as they arrive (None: use the normal path)"""
+        context = self.build_context_string(question_text)
+        cache_key = make_cache_key(question_text, 'textarea', [], context)
+        cached = self.answer_cache.get(cache_key)
+        if cached is not None:
+            print(f"   💾 Cached: {cached}")
+            return cached
+        
+        prompt = self.prompts.render("text", context=context, question=question_text, options="")
+        chunks = []
+        try:
+            with self.tracer.span("llm.generate_content", "llm", template="text", prompt_chars=len(prompt), stream=True):
+                response = self.model.generate_content(prompt, stream=True)
+                for chunk in response:
+                    text = chunk.text
+                    if text:
+                        self.text_input.append(element, text, reset=not chunks)
+                        chunks.append(text)
+        except RetriesExhausted:
+            raise
+        except Exception as e:
+            print(f"   ⚠ Streaming failed ({type(e).__name__}), asking without streaming")
+            return None
+        self.prompts.record("text", prompt, response)
+        
+        answer = "".join(chunks).strip()
+        if not answer:
+            return None
+        print(f"   🤖 Gemini (streamed in {len(chunks)} chunks): {answer}")
+        self.answer_cache.set(cache_key, answer)
+        return answer
+    
+    def ask_gemini_for_matrix(self, question_text, rows):
+        """Ask Gemini for every row of a matrix/grid question in one call"""
+        context = self.build_context_string(" ".join([question_text] + [row.label for row in rows]))
+        columns = rows[0].columns
+        same_columns = all(row.columns == columns for row in rows)
+
+        if same_columns:
+            columns_text = "\n".join(f"{i+1}. {label}" for i, label in enumerate(columns))
+            rows_text = "\n".join(f"Row {i+1}: {row.label}" for i, row in enumerate(rows))
+        else:
+            columns_text = "(listed per row)"
+            rows_text = "\n".join(
+                f"Row {i+1}: {row.label} | " + ", ".join(f"{j+1}. {label}" for j, label in enumerate(row.columns))
+                for i, row in enumerate(rows)
+            )
+
+        prompt = self.prompts.render("matrix", context=context, question=question_text,
+                                     columns=columns_text, rows=rows_text)
+
+        cache_key = make_cache_key(
+            question_text,
+            "matrix",
+            [f"{row.label}|{'|'.join(row.columns)}" for row in rows],
+            context
+        )
+        answer = self.answer_cache.get(cache_key)
+        if answer is not None:
+            print(f"   💾 Cached: {answer}")
+        else:
+            try:
+                response = self.generate(prompt, "matrix")
+                answer = response.text.strip()
+                print(f"   🤖 Gemini: {answer}")
+            except RetriesExhausted:
+                raise
+            except Exception as e:
+                print(f"   ⚠ Gemini error: {e}")
+                return None
+
+        choices = self.parse_matrix_answer(answer, rows)
+        if choices is not None:
+            self.answer_cache.set(cache_key, answer)
+        return choices
+
+    def parse_matrix_answer(self, answer, rows):
+        """Parse a JSON array (or comma list) of 1-based column numbers into row choices"""
+        text = answer.strip().strip("`")
+        if "[" in text and "]" in text:
+            text = text[text.index("[") + 1:text.rindex("]")]
+        parts = [p.strip().strip('"\'') for p in text.replace("\n", ",").split(",") if p.strip()]
+        if len(parts) != len(rows) or not all(p.isdigit() for p in parts):
+            return None
+        return [str(int(p)) for p in parts]
+
+    def build_section_prompt(self, form_data):
+        """Build one prompt describing every question of the current section"""
+        context = self.build_context_string(" ".join(q.question for q in form_data))
+        formats = {
+            "radio": 'option number as a string, e.g. "2"',
+            "dropdown": 'option number as a string, e.g. "2"',
+            "checkbox": 'comma-separated option numbers, e.g. "1,3"',
+            "matrix": 'JSON array with one column number per row, e.g. ["4", "5"]',
+            "date": 'date as "YYYY-MM-DD"',
+            "time": 'time as "HH:MM" (24-hour)',
+            "number": "number only, as a string",
+            "tel": "phone number only, as a string",
+        }
+
+        blocks = []
+        for question_info in form_data:
+            lines = [f"[{question_info.index}] ({question_info.type}) {question_info.question}"]
+            if question_info.options:
+                lines.extend(f"   {i+1}. {opt.text}" for i, opt in enumerate(question_info.options))
+            if question_info.type == 'matrix':
+                lines.extend(
+                    f"   row {i+1}: {row.label} | " + ", ".join(f"{j+1}. {c}" for j, c in enumerate(row.columns))
+                    for i, row in enumerate(question_info.rows)
+                )
+            lines.append(f"   Answer format: {formats.get(question_info.type, 'short realistic text')}")
+            blocks.append("\n".join(lines))
+        return self.prompts.render("section", context=context, questions="\n\n".join(blocks))
+
+    def parse_section_answers(self, response_text, form_data):
+        """Parse batch JSON response, keeping only answers valid for their question"""
+        text = response_text.strip()
+        if text.startswith("```"):
+            text = text.strip("`")
+            if text.lower().startswith("json"):
+                text = text[4:]
+        try:
+            start = text.index("{")
+            end = text.rindex("}") + 1
+            data = json.loads(text[start:end])
+        except ValueError:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+
+        answers = {}
+        for question_info in form_data:
+            answer = data.get(str(question_info.index))
+            q_type = question_info.type
+
+            if q_type == 'matrix':
+                if isinstance(answer, list) and len(answer) == len(question_info.rows):
+                    answer = [str(a).strip() for a in answer]
+                    if all(a.isdigit() for a in answer):
+                        answers[question_info.index] = answer
+                continue
+
+            if answer is None or isinstance(answer, (list, dict)):
+                continue
+            answer = str(answer).strip()
+            if not answer:
+                continue
+
+            if q_type in ['radio', 'dropdown']:
+                if not answer.isdigit() or not 1 <= int(answer) <= len(question_info.options):
+                    continue
+            elif q_type == 'checkbox':
+                if not all(c.strip().isdigit() for c in answer.split(',')):
+                    continue
+            answers[question_info.index] = answer
+
+        return answers
+
+    def ask_gemini_for_section(self, form_data):
+        """Ask Gemini for all answers of a section in one call"""
+        prompt = self.build_section_prompt(form_data)
+        print(f"\n📦 Requesting {len(form_data)} answers in one batch...")
+
+        cache_key = make_cache_key(prompt, "section", [], "")
+        response_text = self.answer_cache.get(cache_key)
+        if response_text is None:
+            try:
+                response = self.generate(prompt, "section")
+                response_text = response.text
+            except RetriesExhausted:
+                raise
+            except Exception as e:
+                print(f"   ⚠ Gemini batch error: {e}")
+                return {}
+
+        answers = self.parse_section_answers(response_text, form_data)
+        if answers:
+            self.answer_cache.set(cache_key, response_text)
+        print(f"   ✓ Batch answered {len(answers)}/{len(form_data)} questions")
+        return answers
+
+    def fill_section_batch(self, form_data):
+        """Fill a section from one batch call, falling back per question for failures"""
+        presets = {}
+        remote = []
+        for question in form_data:
+            job_answer = self.job_answer_for(question)
+            if job_answer is not None:
+                presets[question.index] = job_answer
+            elif self.local_answer_for(question, count=False) is None:
+                remote.append(question)
+        presets.update(self.ask_gemini_for_section(remote) if remote else {})
+        failed = {q.index for q in self.fill_presets(form_data, presets)}
+        for question in form_data:
+            if question.index in presets and question.index not in failed:
+                continue
+            if question.index in failed:
+                print("   ↩ Batch answer not applied, asking individually")
+            self.fill_question(question)
+
+    def fill_presets(self, questions, presets):
+        """Fill questions that have a preset ({index: preset}); returns those still not filled
+
+        Presets go into the page with one bulk script call first, fields that did
+        not stick are retried one by one through fill_question.
+        """
+        pending = [q for q in questions if presets.get(q.index) is not None]
+        if pending and self.bulk_filler is not None and self.config.get('bulk_fill', True):
+            pending = self.fill_bulk(pending, presets)
+        return [q for q in pending if not self.fill_question(q, presets[q.index])]
+
+    def fill_bulk(self, questions, presets):
+        """Apply presets with one script call, recording the filled answers; returns the questions left over"""
+        with self.tracer.span("fill_bulk", fields=len(questions)):
+            filled = self.bulk_filler.apply(questions, presets)
+        if not filled:
+            return questions
+        print(f"\n⚡ Bulk filled {len(filled)}/{len(questions)} answers in one call")
+        for question in questions:
+            entry = filled.get(question.index)
+            if entry is None:
+                continue
+            print(f"   ✓ Q{question.index}: {entry['answer'][:60]}")
+            self.answer_history.append(entry)
+            self.filled.add(question.index)
+            if self.checkpoint is not None:
+                self.checkpoint.record(self.section, question, entry)
+        self.startup.mark("first question filled")
+        self.waiter.pace('after_fill')
+        return [q for q in questions if q.index not in filled]
+
+    def local_answer_for(self, question_info, count=True):
+        """Answer typed fields (email, tel, date, time, number) locally when enabled"""
+        if self.local_generator is None:
+            return None
+        answer = self.local_generator.generate(question_info, self.answer_history, count=count)
+        if answer is not None and count:
+            print(f"   ⚙️  Local: {answer}")
+        return answer
+    
+    def handles_for(self, question_info):
+        """Live elements of a question, located in the page on first use"""
+        if question_info.handles is None and resolve_handles(self.driver, [question_info]):
+            raise LookupError(f"Q{question_info.index} is no longer in the page")
+        return question_info.handles
+    
+    def fill_question(self, question_info, preset_answer=None):
+        """Fill a single question (preset_answer skips the Gemini call, e.g. from batch/concurrent mode)"""
+        answered = len(self.answer_history)
+        with self.tracer.span("fill_question", index=question_info.index, type=question_info.type):
+            filled = self._fill_question(question_info, preset_answer)
+        self.startup.mark("first question filled")
+        if self.checkpoint is not None and len(self.answer_history) > answered:
+            self.checkpoint.record(self.section, question_info, self.answer_history[-1])
+        if filled:
+            self.filled.add(question_info.index)
+        return filled
+    
+    def _fill_question(self, question_info, preset_answer=None):
+        from selenium.webdriver.common.by import By
+        print(f"\n📝 Q{question_info.index}: {question_info.question[:60]}...")
+        print(f"   Type: {question_info.type}")
+        
+        if preset_answer is None:
+            preset_answer = self.job_answer_for(question_info)
+        if preset_answer is None:
+            preset_answer = self.local_answer_for(question_info)
+        
+        def ask(question_text, options, question_type):
+            if preset_answer is not None:
+                print(f"   📦 Preset: {preset_answer}")
+                return preset_answer
+            return self.ask_gemini_for_choice(question_text, options, question_type)
         
         try:
-            if question_info['type'] in ['text', 'email']:
-                answer = self.ask_gemini_for_choice(
-                    question_info['question'],
+            handles = self.handles_for(question_info)
+            if question_info.type in ['text', 'email']:
+                answer = ask(
+                    question_info.question,
                     [],
-                    question_info['type']
+                    question_info.type
                 )
                 if answer:
-                    input_elem = question_info['element'].find_element(By.CSS_SELECTOR, "input")
-                    input_elem.clear()
-                    input_elem.send_keys(answer)
+                    input_elem = handles.element.find_element(By.CSS_SELECTOR, "input")
+                    if not self.text_input.enter(input_elem, answer, question_info.type):
+                        print("   ✗ Value was not stored")
+                        return False
                     print(f"   ✓ Filled: {answer}")
                     # Store in history
                     self.answer_history.append({
-                        "question": question_info['question'],
+                        "question": question_info.question,
                         "answer": answer,
-                        "type": question_info['type']
+                        "type": question_info.type,
+                        "preset": answer
                     })
-                    time.sleep(0.5)
+                    self.waiter.pace('after_fill')
                     return True
             
-            elif question_info['type'] == 'textarea':
-                answer = self.ask_gemini_for_choice(
-                    question_info['question'],
-                    [],
-                    'textarea'
-                )
+            elif question_info.type == 'textarea':
+                textarea_elem = handles.element.find_element(By.CSS_SELECTOR, "textarea")
+                answer = None
+                if preset_answer is None and self.config.get('stream_textarea', True):
+                    answer = self.stream_textarea_answer(question_info.question, textarea_elem)
+                if answer is None:
+                    answer = ask(
+                        question_info.question,
+                        [],
+                        'textarea'
+                    )
                 if answer:
-                    textarea_elem = question_info['element'].find_element(By.CSS_SELECTOR, "textarea")
-                    textarea_elem.clear()
-                    textarea_elem.send_keys(answer)
+                    # Also reconciles a streamed answer: sets the full value once and verifies it
+                    if not self.text_input.enter(textarea_elem, answer, 'textarea'):
+                        print("   ✗ Value was not stored")
+                        return False
                     print(f"   ✓ Filled: {answer[:50]}...")
                     # Store in history
                     self.answer_history.append({
-                        "question": question_info['question'],
+                        "question": question_info.question,
                         "answer": answer,
-                        "type": "textarea"
+                        "type": "textarea",
+                        "preset": answer
                     })
-                    time.sleep(0.5)
+                    self.waiter.pace('after_fill')
                     return True
             
-            elif question_info['type'] == 'radio':
-                choice = self.ask_gemini_for_choice(
-                    question_info['question'],
-                    question_info['options'],
+            elif question_info.type == 'radio':
+                choice = ask(
+                    question_info.question,
+                    question_info.options,
                     'radio'
                 )
                 if choice and choice.isdigit():
                     idx = int(choice) - 1
-                    if 0 <= idx < len(question_info['options']):
-                        selected_option = question_info['options'][idx]
-                        selected_option['element'].click()
-                        print(f"   ✓ Selected: {selected_option['text']}")
+                    if 0 <= idx < len(question_info.options):
+                        selected_option = question_info.options[idx]
+                        handles.options[idx].click()
+                        print(f"   ✓ Selected: {selected_option.text}")
                         # Store in history
                         self.answer_history.append({
-                            "question": question_info['question'],
-                            "answer": selected_option['text'],
-                            "type": "radio"
+                            "question": question_info.question,
+                            "answer": selected_option.text,
+                            "type": "radio",
+                            "preset": choice
                         })
-                        time.sleep(0.5)
+                        self.waiter.pace('after_fill')
                         return True
             
-            elif question_info['type'] == 'checkbox':
-                choices = self.ask_gemini_for_choice(
-                    question_info['question'],
-                    question_info['options'],
+            elif question_info.type == 'checkbox':
+                choices = ask(
+                    question_info.question,
+                    question_info.options,
                     'checkbox'
                 )
                 if choices:
                     selected = []
+                    numbers = []
                     for choice in choices.split(','):
                         choice = choice.strip()
                         if choice.isdigit():
                             idx = int(choice) - 1
-                            if 0 <= idx < len(question_info['options']):
-                                selected_option = question_info['options'][idx]
-                                selected_option['element'].click()
-                                selected.append(selected_option['text'])
-                                time.sleep(0.3)
+                            if 0 <= idx < len(question_info.options):
+                                selected_option = question_info.options[idx]
+                                handles.options[idx].click()
+                                selected.append(selected_option.text)
+                                numbers.append(choice)
+                                self.waiter.pace('after_option')
                     
                     if selected:
                         print(f"   ✓ Selected: {', '.join(selected)}")
                         # Store in history
                         self.answer_history.append({
-                            "question": question_info['question'],
+                            "question": question_info.question,
                             "answer": ", ".join(selected),
-                            "type": "checkbox"
+                            "type": "checkbox",
+                            "preset": ",".join(numbers)
                         })
                         return True
             
-            elif question_info['type'] == 'matrix':
-                print(f"   📊 Matrix with {len(question_info['rows'])} rows")
+            elif question_info.type == 'matrix':
+                print(f"   📊 Matrix with {len(question_info.rows)} rows")
                 ratings = []
-                
-                for row_idx, row in enumerate(question_info['rows'], 1):
+                presets = []
+
+                if preset_answer is not None:
+                    choices = [str(c) for c in preset_answer]
+                else:
+                    choices = self.ask_gemini_for_matrix(question_info.question, question_info.rows)
+
+                for row_idx, row in enumerate(question_info.rows, 1):
+                    presets.append(None)
                     try:
-                        rating = self.ask_gemini_for_choice(
-                            f"{question_info['question']} - {row['label']}",
-                            [],
-                            'scale'
-                        )
-                        
+                        if choices is not None:
+                            rating = choices[row_idx - 1]
+                        else:
+                            # Grid answer could not be parsed, ask for this row alone
+                            rating = self.ask_gemini_for_choice(
+                                f"{question_info.question} - {row.label}",
+                                [],
+                                'scale'
+                            )
+
                         if rating and rating.isdigit():
                             idx = int(rating) - 1
-                            if 0 <= idx < len(row['options']):
-                                row['options'][idx].click()
-                                print(f"   ✓ Row {row_idx}: {row['label'][:40]} → {rating}")
-                                ratings.append(f"{row['label']}: {rating}")
-                                time.sleep(0.3)
-                        
+                            if 0 <= idx < len(handles.rows[row_idx - 1]):
+                                handles.rows[row_idx - 1][idx].click()
+                                label = row.columns[idx]
+                                print(f"   ✓ Row {row_idx}: {row.label[:40]} → {label}")
+                                ratings.append(f"{row.label}: {label}")
+                                presets[-1] = rating
+
+                    except RetriesExhausted:
+                        raise
                     except Exception as e:
                         print(f"   ✗ Row {row_idx} error: {str(e)[:60]}")
                 
                 # Store in history
                 if ratings:
                     self.answer_history.append({
-                        "question": question_info['question'],
+                        "question": question_info.question,
                         "answer": "; ".join(ratings),
-                        "type": "matrix"
+                        "type": "matrix",
+                        "preset": presets
                     })
                 return True
             
-            elif question_info['type'] == 'dropdown':
-                choice = self.ask_gemini_for_choice(
-                    question_info['question'],
-                    question_info['options'],
+            elif question_info.type == 'dropdown':
+                choice = ask(
+                    question_info.question,
+                    question_info.options,
                     'dropdown'
                 )
                 if choice and choice.isdigit():
                     idx = int(choice) - 1
-                    if 0 <= idx < len(question_info['options']):
-                        select_elem = question_info['element'].find_element(By.CSS_SELECTOR, "select")
+                    if 0 <= idx < len(question_info.options):
+                        select_elem = handles.element.find_element(By.CSS_SELECTOR, "select")
                         from selenium.webdriver.support.select import Select
-                        Select(select_elem).select_by_index(idx)
-                        selected_text = question_info['options'][idx]['text']
+                        # position counts the "Choose" placeholder, idx does not
+                        Select(select_elem).select_by_index(question_info.options[idx].position)
+                        selected_text = question_info.options[idx].text
                         print(f"   ✓ Selected: {selected_text}")
                         # Store in history
                         self.answer_history.append({
-                            "question": question_info['question'],
+                            "question": question_info.question,
                             "answer": selected_text,
-                            "type": "dropdown"
+                            "type": "dropdown",
+                            "preset": choice
                         })
-                        time.sleep(0.5)
+                        self.waiter.pace('after_fill')
                         return True
             
-            elif question_info['type'] == 'date':
-                answer = self.ask_gemini_for_choice(
-                    question_info['question'],
+            elif question_info.type == 'date':
+                answer = ask(
+                    question_info.question,
                     [],
                     'date'
                 )
                 if answer:
-                    date_input = question_info['element'].find_element(By.CSS_SELECTOR, "input[type='date']")
-                    date_input.send_keys(answer)
+                    date_input = handles.element.find_element(By.CSS_SELECTOR, "input[type='date']")
+                    if not self.text_input.enter(date_input, answer, 'date'):
+                        print("   ✗ Value was not stored")
+                        return False
                     print(f"   ✓ Filled date: {answer}")
                     # Store in history
                     self.answer_history.append({
-                        "question": question_info['question'],
+                        "question": question_info.question,
                         "answer": answer,
-                        "type": "date"
+                        "type": "date",
+                        "preset": answer
                     })
-                    time.sleep(0.5)
+                    self.waiter.pace('after_fill')
                     return True
             
-            elif question_info['type'] == 'time':
-                answer = self.ask_gemini_for_choice(
-                    question_info['question'],
+            elif question_info.type == 'time':
+                answer = ask(
+                    question_info.question,
                     [],
                     'time'
                 )
                 if answer:
-                    time_input = question_info['element'].find_element(By.CSS_SELECTOR, "input[type='time']")
-                    time_input.send_keys(answer)
+                    time_input = handles.element.find_element(By.CSS_SELECTOR, "input[type='time']")
+                    if not self.text_input.enter(time_input, answer, 'time'):
+                        print("   ✗ Value was not stored")
+                        return False
                     print(f"   ✓ Filled time: {answer}")
                     # Store in history
                     self.answer_history.append({
-                        "question": question_info['question'],
+                        "question": question_info.question,
                         "answer": answer,
-                        "type": "time"
+                        "type": "time",
+                        "preset": answer
                     })
-                    time.sleep(0.5)
+                    self.waiter.pace('after_fill')
                     return True
             
-            elif question_info['type'] == 'number':
-                answer = self.ask_gemini_for_choice(
-                    question_info['question'],
+            elif question_info.type == 'number':
+                answer = ask(
+                    question_info.question,
                     [],
                     'number'
                 )
                 if answer:
-                    number_input = question_info['element'].find_element(By.CSS_SELECTOR, "input[type='number']")
-                    number_input.clear()
-                    number_input.send_keys(answer)
+                    number_input = handles.element.find_element(By.CSS_SELECTOR, "input[type='number']")
+                    if not self.text_input.enter(number_input, answer, 'number'):
+                        print("   ✗ Value was not stored")
+                        return False
                     print(f"   ✓ Filled number: {answer}")
                     # Store in history
                     self.answer_history.append({
-                        "question": question_info['question'],
+                        "question": question_info.question,
                         "answer": answer,
-                        "type": "number"
+                        "type": "number",
+                        "preset": answer
                     })
-                    time.sleep(0.5)
+                    self.waiter.pace('after_fill')
                     return True
             
-            elif question_info['type'] == 'tel':
-                answer = self.ask_gemini_for_choice(
-                    question_info['question'],
+            elif question_info.type == 'tel':
+                answer = ask(
+                    question_info.question,
                     [],
                     'tel'
                 )
                 if answer:
-                    tel_input = question_info['element'].find_element(By.CSS_SELECTOR, "input[type='tel']")
-                    tel_input.clear()
-                    tel_input.send_keys(answer)
+                    tel_input = handles.element.find_element(By.CSS_SELECTOR, "input[type='tel']")
+                    if not self.text_input.enter(tel_input, answer, 'tel'):
+                        print("   ✗ Value was not stored")
+                        return False
                     print(f"   ✓ Filled phone: {answer}")
                     # Store in history
                     self.answer_history.append({
-                        "question": question_info['question'],
+                        "question": question_info.question,
                         "answer": answer,
-                        "type": "tel"
+                        "type": "tel",
+                        "preset": answer
                     })
-                    time.sleep(0.5)
+                    self.waiter.pace('after_fill')
                     return True
             
+        except RetriesExhausted:
+            raise
         except Exception as e:
             print(f"   ✗ Error: {str(e)[:100]}")
             return False
@@ -559,8 +864,31 @@ Generally prefer positive ratings (4-5) unless context suggests otherwise."""
         return False
     
     def click_next_or_submit(self):
-        """Click Next or Submit button"""
+        """Click Next or Submit button (one in-page query, remembered per form)"""
+        signature = self.waiter.section_signature()
+        try:
+            with self.tracer.span("navigate"):
+                action = self.navigator.click(("next", "submit"))
+        except Exception as e:
+            print(f"\n⚠ Button script failed ({type(e).__name__}), trying XPath selectors")
+            return self.click_next_or_submit_legacy(signature)
+        
+        if action == "next":
+            print("\n➡️  Clicked Next/Continue")
+            self.waiter.wait_for_section_change(signature)
+        elif action == "submit":
+            print("\n✅ Clicked Submit")
+            self.waiter.wait_for_confirmation()
+        else:
+            print("\n⚠ Button script found no Next/Submit button, trying XPath selectors")
+            return self.click_next_or_submit_legacy(signature)
+        return action
+    
+    def click_next_or_submit_legacy(self, signature):
+        """Click Next or Submit button by trying XPath selectors one by one"""
+        from selenium.webdriver.common.by import By
         try:
+            
             # Next/Continue button selectors (various languages & variations)
             next_selectors = [
                 "//span[contains(text(), 'Next')]/..",
@@ -586,7 +914,7 @@ Generally prefer positive ratings (4-5) unless context suggests otherwise."""
                     if btn.is_displayed() and btn.is_enabled():
                         btn.click()
                         print("\n➡️  Clicked Next/Continue")
-                        time.sleep(2)
+                        self.waiter.wait_for_section_change(signature)
                         return "next"
                 except:
                     continue
@@ -621,7 +949,7 @@ Generally prefer positive ratings (4-5) unless context suggests otherwise."""
                     if btn.is_displayed() and btn.is_enabled():
                         btn.click()
                         print("\n✅ Clicked Submit")
-                        time.sleep(3)
+                        self.waiter.wait_for_confirmation()
                         return "submit"
                 except:
                     continue
@@ -633,12 +961,73 @@ Generally prefer positive ratings (4-5) unless context suggests otherwise."""
             print(f"\n⚠ Error clicking button: {e}")
             return None
     
-    def fill_form_smart(self, form_url):
-        """Fill entire form by analyzing structure"""
+    def start_job(self, answers=None, overrides=None, job_id=None):
+        """Reset per-run state so one instance (driver + model) can fill many forms"""
+        self.ready()
+        self.job_id = job_id
+        self.answer_history = []
+        self.job_answers = {normalize_text(q): a for q, a in (answers or {}).items()}
+        config = dict(self.base_config, **(overrides or {}))
+        if config != self.config:
+            self.config = config
+            self.attach_helpers()
+        else:
+            self.waiter.waited.clear()
+    
+    def job_answer_for(self, question_info):
+        """Preset answer from the current job's answer data, in fill_question's format"""
+        answer = self.job_answers.get(normalize_text(question_info.question))
+        if answer is None:
+            return None
+        
+        def option_number(value, texts):
+            value = str(value).strip()
+            if value.isdigit():
+                return value
+            normalized = [normalize_text(t) for t in texts]
+            if normalize_text(value) in normalized:
+                return str(normalized.index(normalize_text(value)) + 1)
+            return None
+        
+        option_texts = [opt.text for opt in question_info.options]
+        if question_info.type in ['radio', 'dropdown']:
+            return option_number(answer, option_texts)
+        if question_info.type == 'checkbox':
+            values = answer if isinstance(answer, list) else str(answer).split(',')
+            numbers = [option_number(v, option_texts) for v in values]
+            return ",".join(n for n in numbers if n) or None
+        if question_info.type == 'matrix':
+            rows = question_info.rows
+            if isinstance(answer, dict):
+                by_label = {normalize_text(k): v for k, v in answer.items()}
+                answer = [by_label.get(normalize_text(row.label)) for row in rows]
+            if not isinstance(answer, list) or len(answer) != len(rows):
+                return None
+            numbers = [option_number(v, row.columns) if v is not None else None for v, row in zip(answer, rows)]
+            return numbers if all(numbers) else None
+        return str(answer)
+    
+    def fill_form_smart(self, form_url, resume=True):
+        """Fill entire form by analyzing structure, returns a result summary
+
+        With a checkpoint from an interrupted run, its answers are replayed
+        without Gemini and filling continues at the first unanswered question.
+        """
+        self.ready()
+        result = {"status": "incomplete", "sections": 0}
         try:
+            if self.checkpoint is not None:
+                saved = self.checkpoint.begin(form_url, self.job_id, resume)
+                if saved:
+                    print(f"♻️  Resuming from checkpoint: {saved} saved answers, "
+                          f"stopped in section {self.checkpoint.state['section']}")
             print(f"🌐 Opening form: {form_url}")
-            self.driver.get(form_url)
-            time.sleep(self.config['wait_time'])
+            load_started = time.perf_counter()
+            with self.tracer.span("driver.get"):
+                self.driver.get(form_url)
+            self.waiter.wait_for_page_ready()
+            result["page_load_seconds"] = round(time.perf_counter() - load_started, 3)
+            print(f"   Page ready in {result['page_load_seconds']:.2f}s")
             
             section = 1
             while True:
@@ -648,25 +1037,61 @@ Generally prefer positive ratings (4-5) unless context suggests otherwise."""
                 if self.answer_history:
                     print(f"📝 Current history: {len(self.answer_history)} Q&A pairs")
                 
-                form_data = self.extract_form_structure()
+                form_data = self.load_section_structure(form_url, section)
                 
                 if not form_data:
                     print("⚠ No questions found")
                     break
                 
                 print(f"\n✓ Found {len(form_data)} questions")
+                missing = resolve_handles(self.driver, [q for q in form_data if q.handles is None])
+                if missing:
+                    print(f"⚠ {len(missing)} questions could not be located, skipping them")
+                    form_data = [q for q in form_data if q.handles is not None]
+                result["sections"] = section
+                self.section = section
                 
-                for question in form_data:
-                    self.fill_question(question)
+                if self.checkpoint is not None:
+                    saved = self.checkpoint.saved_answers(section, form_data)
+                    if saved:
+                        print(f"♻️  Replaying {len(saved)} saved answers")
+                        unfilled = {q.index for q in self.fill_presets(form_data, saved)}
+                        self.checkpoint.replayed(len(saved) - len(unfilled))
+                        if unfilled:
+                            print(f"   ↩ {len(unfilled)} saved answers not applied, answering them again")
+                        form_data = [q for q in form_data if q.index not in saved or q.index in unfilled]
+                
+                answer_mode = self.config.get('answer_mode', 'sequential')
+                self.filled = set()
+                try:
+                    with self.tracer.span("fill_section", section=section, mode=answer_mode):
+                        if answer_mode == 'batch':
+                            self.fill_section_batch(form_data)
+                        elif answer_mode == 'concurrent':
+                            self.scheduler.fill_section(form_data)
+                        else:
+                            for question in form_data:
+                                self.fill_question(question)
+                except RetriesExhausted as e:
+                    # Submitting now would send a partial form; the checkpoint keeps what was filled
+                    result["unanswered"] = [q.index for q in form_data if q.index not in self.filled]
+                    result["error"] = str(e)[:200]
+                    print(f"\n⛔ {e}")
+                    print(f"   Stopped before Next/Submit, {len(result['unanswered'])} questions unanswered")
+                    break
                 
                 action = self.click_next_or_submit()
                 
                 if action == "submit":
                     print("\n🎉 Form submitted successfully!")
+                    result["status"] = "submitted"
+                    if self.checkpoint is not None:
+                        self.checkpoint.finish()
                     break
                 elif action == "next":
                     section += 1
-                    time.sleep(1.5)
+                    if self.checkpoint is not None:
+                        self.checkpoint.advance(section)
                 else:
                     break
             
@@ -674,9 +1099,16 @@ Generally prefer positive ratings (4-5) unless context suggests otherwise."""
             
         except Exception as e:
             print(f"\n❌ Error: {e}")
+            result["status"] = "error"
+            result["error"] = str(e)[:200]
         
         finally:
-            time.sleep(5)
+            self.waiter.pace('before_close')
+            self.waiter.report()
+        
+        result["answered"] = len(self.answer_history)
+        result["waited_seconds"] = round(self.waiter.total_waited(), 3)
+        return result
     
     def close(self):
         """Close browser and show summary"""
@@ -689,12 +1121,58 @@ Generally prefer positive ratings (4-5) unless context suggests otherwise."""
                 print(f"\n{idx}. {qa['question'][:70]}...")
                 print(f"   Answer: {qa['answer'][:80]}")
         
-        self.driver.quit()
-        print("\nBrowser closed")
+        if self.local_generator is not None:
+            generator_stats = self.local_generator.stats()
+            hits = ", ".join(f"{t}: {n}" for t, n in sorted(generator_stats['hits'].items())) or "none"
+            print(f"\n⚙️  Local generator hits: {hits} ({sum(generator_stats['deferred'].values())} deferred to Gemini)")
+        
+        if self.checkpoint is not None and self.checkpoint.stats()['replayed']:
+            print(f"\n♻️  Checkpoint: {self.checkpoint.stats()['replayed']} answers replayed without Gemini")
+        
+        if self.bulk_filler is not None and self.bulk_filler.stats()['calls']:
+            bulk_stats = self.bulk_filler.stats()
+            print(f"\n⚡ Bulk fill: {bulk_stats['applied']} answers in {bulk_stats['calls']} calls, "
+                  f"{bulk_stats['failed']} retried one by one")
+        
+        if self.schema_cache is not None:
+            schema_stats = self.schema_cache.stats()
+            print(f"\n🗂  Schema cache: {schema_stats['hits']} hits, {schema_stats['misses']} misses, "
+                  f"{schema_stats['invalidated']} invalidated")
+        
+        cache_stats = self.answer_cache.stats()
+        if cache_stats:
+            print(f"\n💾 Answer cache: {cache_stats['memory_hits']} memory hits, "
+                  f"{cache_stats['disk_hits']} disk hits, {cache_stats['misses']} misses "
+                  f"(hit rate {cache_stats['hit_rate']:.0%})")
+        self.answer_cache.close()
+        self.startup.report()
+        if self.model is None:
+            # Without ready() (e.g. startup failed), release whatever the background startup produced
+            self.model, self.prompts = self.startup.settle("gemini") or (None, None)
+        if self.model is not None:
+            self.prompts.report()
+            self.model.report()
+            self.model.close()
+        self.tracer.report()
+        
+        if self.owns_driver:
+            self.driver = self.driver or self.startup.settle("chrome")
+            if self.driver is not None:
+                rss = driver_rss_mb(self.driver)
+                if rss is not None:
+                    print(f"\n🧠 Chrome memory: {rss:.0f} MB ({launch_settings(self.config)['profile']} launch profile)")
+                self.driver.quit()
+                print("\nBrowser closed")
 
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Smart Google Form Autofill V2")
+    parser.add_argument("form_url", nargs="?", help="Google Form URL (prompted if omitted)")
+    parser.add_argument("--config", default="config.json", help="Path to config.json")
+    parser.add_argument("--fresh", action="store_true", help="Ignore a saved checkpoint and start over")
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("🤖 SMART GOOGLE FORM AUTOFILL V2")
     print("=" * 60)
@@ -704,16 +1182,15 @@ def main():
     print("  • No manual configuration needed")
     print("=" * 60)
     
-    form_url = input("\n📝 Enter Google Form URL: ").strip()
-    
-    if not form_url:
-        print("❌ No URL provided")
-        return
-    
-    autofill = SmartGoogleFormAutofill()
+    # Chrome and Gemini start in the background while the URL is typed in
+    autofill = SmartGoogleFormAutofill(config_file=args.config)
     
     try:
-        autofill.fill_form_smart(form_url)
+        form_url = args.form_url or input("\n📝 Enter Google Form URL: ").strip()
+        if not form_url:
+            print("❌ No URL provided")
+            return
+        autofill.fill_form_smart(form_url, resume=not args.fresh)
     finally:
         autofill.close()
 
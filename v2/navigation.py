@@ -0,0 +1,137 @@
+"""
+Next/Submit button resolution
+Finds and classifies every visible button in one in-page script and remembers
+the winning label per form and locale
+"""
+
+import json
+import os
+import threading
+
+
+# Lowercase labels per button kind (exact label beats leading word beats any whole word)
+BUTTON_LABELS = {
+    "next": ["next", "next page", "continue", "forward", "tiếp", "tiếp tục", "trang tiếp theo",
+             "suivant", "weiter", "siguiente", "avanti", "próximo", "次へ", "下一页", "다음"],
+    "submit": ["submit", "send", "gửi", "gửi phản hồi", "nộp", "finish", "done", "ok", "xác nhận",
+               "envoyer", "senden", "absenden", "enviar", "invia", "送信", "提交", "제출"],
+    "back": ["back", "previous", "quay lại", "trở lại", "trang trước", "retour", "zurück",
+             "atrás", "indietro", "戻る", "返回", "뒤로"],
+}
+
+FIND_BUTTON_SCRIPT = r"""
+var kinds = arguments[0], labels = arguments[1], memo = arguments[2];
+var page = location.origin + location.pathname.replace(/\/(viewform|formResponse)$/, "");
+var memoKey = page + "|" + (document.documentElement.lang || "");
+var preferred = memo[memoKey] || {};
+
+function norm(text) { return (text || "").replace(/\s+/g, " ").trim().toLowerCase(); }
+function visible(el) {
+    if (!el.getClientRects().length) return false;
+    var style = getComputedStyle(el);
+    return style.visibility !== "hidden" && style.display !== "none";
+}
+function enabled(el) {
+    return !el.disabled && el.getAttribute("aria-disabled") !== "true";
+}
+function classify(label) {
+    var best = null, bestScore = 0;
+    for (var kind in labels) {
+        for (var i = 0; i < labels[kind].length; i++) {
+            var word = labels[kind][i];
+            // Whole-word matches only, so "ok" does not match "Facebook"
+            var padded = " " + label + " ";
+            var score = label === word ? 3 : (padded.indexOf(" " + word + " ") === 0 ? 2 :
+                (padded.indexOf(" " + word + " ") !== -1 ? 1 : 0));
+            // "back" wins ties so "Quay lại" style buttons are never taken for next/submit
+            if (score > bestScore || (score === bestScore && score > 0 && kind === "back")) {
+                best = kind;
+                bestScore = score;
+            }
+        }
+    }
+    return {kind: best, score: bestScore};
+}
+
+var nodes = document.querySelectorAll("[role='button'], button, input[type='submit'], a");
+var winner = null;
+for (var n = 0; n < nodes.length; n++) {
+    var el = nodes[n];
+    if (!visible(el) || !enabled(el)) continue;
+    var label = norm(el.innerText || el.value || el.getAttribute("aria-label"));
+    if (!label || label.length > 40) continue;
+    var match = classify(label);
+    var rank = kinds.indexOf(match.kind);
+    if (rank === -1) continue;
+    var score = match.score + (preferred[match.kind] === label ? 10 : 0);
+    if (!winner || rank < winner.rank || (rank === winner.rank && score > winner.score)) {
+        winner = {element: el, kind: match.kind, label: label, rank: rank, score: score};
+    }
+}
+
+var result = {memoKey: memoKey};
+if (winner) {
+    result.element = winner.element;
+    result.kind = winner.kind;
+    result.label = winner.label;
+}
+return result;
+"""
+
+
+class ButtonNavigator:
+    """Clicks Next/Submit buttons found by a single in-page query"""
+
+    def __init__(self, driver, memo_path='button_memo.json'):
+        """memo_path stores the winning label per form + locale (None disables it)"""
+        self.driver = driver
+        self.memo_path = memo_path
+        self._lock = threading.Lock()
+        self.memo = self._load_memo()
+
+    def _load_memo(self):
+        if not self.memo_path or not os.path.exists(self.memo_path):
+            return {}
+        try:
+            with open(self.memo_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_memo(self):
+        if not self.memo_path:
+            return
+        tmp_path = f"{self.memo_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.memo, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.memo_path)
+
+    def find(self, kinds=("next", "submit")):
+        """Return (kind, label, element, memo_key) of the best button, kind None if nothing matched"""
+        result = self.driver.execute_script(FIND_BUTTON_SCRIPT, list(kinds), BUTTON_LABELS, self.memo)
+        return result.get('kind'), result.get('label'), result.get('element'), result['memoKey']
+
+    def click(self, kinds=("next", "submit")):
+        """Click the best matching button; returns its kind or None"""
+        kind, label, element, memo_key = self.find(kinds)
+        if kind is None:
+            return None
+        try:
+            element.click()
+        except Exception:
+            self.driver.execute_script("arguments[0].click();", element)
+
+        with self._lock:
+            entry = self.memo.setdefault(memo_key, {})
+            if entry.get(kind) != label:
+                entry[kind] = label
+                try:
+                    self._save_memo()
+                except OSError as e:
+                    print(f"   ⚠ Could not save button memo: {e}")
+        return kind
+
+
+def create_navigator(driver, config):
+    """Create ButtonNavigator from config"""
+    return ButtonNavigator(driver, config.get('button_memo_path', 'button_memo.json'))
@@ -0,0 +1,128 @@
+"""
+Prompt templates
+Constant instructions live in the model's system_instruction (sent once per model,
+not per question); each question type only sends its compact variable part
+"""
+
+import threading
+from collections import defaultdict
+
+
+SYSTEM_INSTRUCTION = """You are filling out a Google Form intelligently.
+Keep every answer realistic and consistent with the previous answers given as form context.
+Write text answers in Vietnamese if the form is in Vietnamese, else in English. Use YYYY for years.
+For rating scales generally prefer positive ratings (4-5) unless context suggests otherwise.
+Reply with the answer only, in exactly the requested format, no explanation."""
+
+TEMPLATES = {
+    "text": "{context}Question: {question}\nGive a concise answer.",
+    "radio": "{context}Question: {question}\nOptions:\n{options}\nReply with ONLY the number of the best option.",
+    "dropdown": "{context}Question: {question}\nDropdown options:\n{options}\nReply with ONLY the option number.",
+    "checkbox": "{context}Question: {question}\nOptions:\n{options}\nReply with comma-separated numbers (e.g. 1,3,4).",
+    "scale": "{context}Question: {question}\nRating scale 1-5 (5 = highest). Reply with ONLY the number.",
+    "date": "{context}Question: {question}\nDate field. Reply with ONLY a date as YYYY-MM-DD.",
+    "time": "{context}Question: {question}\nTime field. Reply with ONLY a 24-hour time as HH:MM.",
+    "number": "{context}Question: {question}\nNumeric field. Reply with ONLY the number.",
+    "tel": "{context}Question: {question}\nPhone number field. Reply with ONLY the phone number.",
+    "matrix": (
+        "{context}Question (grid): {question}\n"
+        "Columns:\n{columns}\n"
+        "Rows:\n{rows}\n"
+        "Choose one column for EACH row.\n"
+        "Reply with ONLY a JSON array of column numbers, one per row in order (e.g. [4, 5, 3])."
+    ),
+    "section": (
+        "{context}Answer ALL questions of this form section, consistent with each other.\n\n"
+        "{questions}\n\n"
+        "Reply with ONLY a JSON object mapping each question number in brackets to its answer,\n"
+        "e.g. {{\"1\": \"2\", \"2\": \"Nguyen Van A\", \"3\": [\"4\", \"5\"]}}. No markdown."
+    ),
+}
+
+# Question type -> template used by ask_gemini_for_choice
+CHOICE_TEMPLATES = {
+    "text": "text",
+    "email": "text",
+    "textarea": "text",
+    "radio": "radio",
+    "dropdown": "dropdown",
+    "checkbox": "checkbox",
+    "scale": "scale",
+    "matrix": "scale",
+    "date": "date",
+    "time": "time",
+    "number": "number",
+    "tel": "tel",
+}
+
+
+def format_options(options):
+    """Numbered option list, one per line"""
+    return "\n".join(f"{i+1}. {opt.text}" for i, opt in enumerate(options or []))
+
+
+def estimate_tokens(text):
+    """Rough token count (~4 characters per token)"""
+    return len(text) // 4 + 1
+
+
+class PromptRegistry:
+    """Renders templates and accounts input tokens per template"""
+
+    def __init__(self, inline_system=False):
+        """inline_system prepends SYSTEM_INSTRUCTION to every prompt (model without system_instruction)"""
+        self.inline_system = inline_system
+        self.usage = defaultdict(lambda: {"calls": 0, "input_tokens": 0, "estimated": 0})
+        self._lock = threading.Lock()
+
+    def render(self, name, **fields):
+        prompt = TEMPLATES[name].format(**fields)
+        if self.inline_system:
+            prompt = f"{SYSTEM_INSTRUCTION}\n\n{prompt}"
+        return prompt
+
+    def record(self, name, prompt, response=None):
+        """Count input tokens (API usage metadata when present, else an estimate)"""
+        usage = getattr(response, 'usage_metadata', None)
+        tokens = getattr(usage, 'prompt_token_count', None) if usage is not None else None
+        with self._lock:
+            entry = self.usage[name]
+            entry["calls"] += 1
+            if tokens is None:
+                tokens = estimate_tokens(prompt)
+                if not self.inline_system:
+                    tokens += estimate_tokens(SYSTEM_INSTRUCTION)
+                entry["estimated"] += 1
+            entry["input_tokens"] += tokens
+
+    def stats(self):
+        with self._lock:
+            return {name: dict(entry) for name, entry in self.usage.items()}
+
+    def report(self):
+        """Print input tokens per template"""
+        usage = self.stats()
+        if not usage:
+            return
+        total = sum(entry["input_tokens"] for entry in usage.values())
+        parts = ", ".join(
+            f"{name} {entry['input_tokens']} ({entry['calls']} calls)"
+            for name, entry in sorted(usage.items(), key=lambda item: -item[1]["input_tokens"])
+        )
+        estimated = " (estimated)" if any(entry["estimated"] for entry in usage.values()) else ""
+        print(f"\n🧾 Input tokens{estimated}: {total} total - {parts}")
+
+
+def create_model(genai, model_name):
+    """GenerativeModel with SYSTEM_INSTRUCTION, plus a matching PromptRegistry
+
+    requirements.txt pins a release with system_instruction (0.5+). Older installs
+    (e.g. 0.3.x) still work: the instruction is then prepended to each prompt instead.
+    """
+    try:
+        model = genai.GenerativeModel(model_name, system_instruction=SYSTEM_INSTRUCTION)
+        return model, PromptRegistry(inline_system=False)
+    except TypeError:
+        print("⚠ google-generativeai has no system_instruction support, sending the instruction with every "
+              "prompt (pip install -r requirements.txt to upgrade)")
+        return genai.GenerativeModel(model_name), PromptRegistry(inline_system=True)
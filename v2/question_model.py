@@ -0,0 +1,163 @@
+"""
+Compact question model
+Slotted, picklable question records with interned option strings; elements are found
+through in-page locators (listitem index, option position) when a question is filled
+"""
+
+import sys
+
+
+# Live elements for each spec: {element, options: [...], rows: [[...], ...]}, null when the item is gone
+RESOLVE_SCRIPT = r"""
+var items = document.querySelectorAll("div[role='listitem']");
+return arguments[0].map(function (spec) {
+    var item = items[spec.index - 1] || null;
+    if (!item) return null;
+    var entry = {element: item, options: [], rows: []};
+    if (spec.type === "matrix") {
+        var groups = item.querySelectorAll("div[role='radiogroup']");
+        for (var r = 0; r < spec.rows.length; r++) {
+            var group = groups[spec.rows[r]];
+            entry.rows.push(group ? Array.prototype.slice.call(group.querySelectorAll("div[role='radio']")) : []);
+        }
+    } else if (spec.options.length) {
+        var selector = spec.type === "dropdown" ? "select option" : "div[role='" + spec.type + "']";
+        var nodes = item.querySelectorAll(selector);
+        for (var o = 0; o < spec.options.length; o++) entry.options.push(nodes[spec.options[o]] || null);
+    }
+    return entry;
+});
+"""
+
+
+def intern(text):
+    """sys.intern for str, other values unchanged"""
+    return sys.intern(text) if isinstance(text, str) else text
+
+
+class Option:
+    """Choice or dropdown option: label, <option> value and position among its siblings"""
+
+    __slots__ = ("text", "value", "position")
+
+    def __init__(self, text, value=None, position=None):
+        self.text = intern(text)
+        self.value = value
+        self.position = position
+
+    def to_dict(self):
+        data = {"text": self.text, "position": self.position}
+        if self.value is not None:
+            data["value"] = self.value
+        return data
+
+
+class MatrixRow:
+    """Grid row: label, radiogroup position and column labels (tuple shared by identical rows)"""
+
+    __slots__ = ("label", "group", "columns")
+
+    def __init__(self, label, group, columns):
+        self.label = intern(label)
+        self.group = group
+        self.columns = columns
+
+    def to_dict(self):
+        return {"label": self.label, "group": self.group, "columns": list(self.columns)}
+
+
+def matrix_rows(rows):
+    """MatrixRow records from (label, group, columns) triples; identical column lists are stored once"""
+    shared = {}
+    records = []
+    for label, group, columns in rows:
+        columns = tuple(intern(column) for column in columns)
+        records.append(MatrixRow(label, group, shared.setdefault(columns, columns)))
+    return records
+
+
+class Handles:
+    """Live WebElements of one question (never serialized)"""
+
+    __slots__ = ("element", "options", "rows")
+
+    def __init__(self, element, options=(), rows=()):
+        self.element = element
+        self.options = list(options)
+        self.rows = [list(row) for row in rows]
+
+
+class Question:
+    """One form question without live elements; handles are bound when it is filled"""
+
+    __slots__ = ("index", "question", "type", "options", "rows", "handles")
+
+    def __init__(self, index, question, question_type, options=(), rows=()):
+        self.index = index
+        self.question = question
+        self.type = intern(question_type)
+        self.options = tuple(options)
+        self.rows = tuple(rows)
+        self.handles = None
+
+    @classmethod
+    def from_dict(cls, data):
+        """Question from to_dict() output"""
+        rows = matrix_rows((row['label'], row.get('group'), row['columns']) for row in data.get('rows', []))
+        return cls(
+            data['index'],
+            data['question'],
+            data['type'],
+            options=[Option(opt['text'], opt.get('value'), opt.get('position')) for opt in data.get('options', [])],
+            rows=rows,
+        )
+
+    def to_dict(self):
+        """JSON-ready dict (no handles)"""
+        data = {"index": self.index, "question": self.question, "type": self.type}
+        if self.options:
+            data["options"] = [opt.to_dict() for opt in self.options]
+        if self.rows:
+            data["rows"] = [row.to_dict() for row in self.rows]
+        return data
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        restored = Question.from_dict(state)
+        for name in self.__slots__:
+            setattr(self, name, getattr(restored, name))
+
+    def locator(self):
+        """Spec for RESOLVE_SCRIPT"""
+        return {
+            "index": self.index,
+            "type": self.type,
+            "options": [opt.position for opt in self.options],
+            "rows": [row.group for row in self.rows],
+        }
+
+    def bind(self, element, options=(), rows=()):
+        """Attach live elements found in the page"""
+        self.handles = Handles(element, options, rows)
+        return self.handles
+
+    def __repr__(self):
+        return f"Question({self.index}, {self.type}, {self.question[:40]!r})"
+
+
+def resolve_handles(driver, questions):
+    """Bind the live elements of every question with one execute_script call; returns the unresolved ones"""
+    questions = list(questions)
+    if not questions:
+        return []
+    found = driver.execute_script(RESOLVE_SCRIPT, [q.locator() for q in questions])
+    missing = []
+    for question, entry in zip(questions, found):
+        if entry is None:
+            question.handles = None
+            missing.append(question)
+        else:
+            question.bind(entry['element'], entry['options'], entry['rows'])
+    return missing
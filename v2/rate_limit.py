@@ -0,0 +1,299 @@
+"""
+Gemini rate limiting and retries
+Token buckets for requests and tokens per minute, shared by threads and (through a
+SQLite file) by worker processes, plus classified retries with jittered backoff
+"""
+
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from prompts import estimate_tokens
+
+
+RATE_LIMITED_NAMES = {"ResourceExhausted", "TooManyRequests"}
+TRANSIENT_NAMES = {"ServiceUnavailable", "InternalServerError", "DeadlineExceeded", "GatewayTimeout",
+                   "BadGateway", "Aborted", "RetryError"}
+FATAL_NAMES = {"InvalidArgument", "PermissionDenied", "Unauthenticated", "NotFound", "FailedPrecondition",
+               "BlockedPromptException", "StopCandidateException"}
+TRANSIENT_CODES = {408, 500, 502, 503, 504}
+FATAL_CODES = {400, 401, 403, 404}
+
+RETRY_HINT = re.compile(r"retry in ([\d.]+)\s*s|retry_delay\s*\{\s*seconds:\s*(\d+)", re.IGNORECASE)
+
+
+class RetriesExhausted(Exception):
+    """Gemini still failed (rate limited or transient) after the last retry"""
+
+    def __init__(self, kind, attempts, error):
+        super().__init__(f"Gemini {kind.replace('_', ' ')} after {attempts} retries: {error}")
+        self.kind = kind
+        self.attempts = attempts
+
+
+def _status_code(error):
+    code = getattr(error, 'code', None)
+    if code is None or callable(code):
+        return None
+    try:
+        return int(code)
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_error(error):
+    """'rate_limited' (429 / quota), 'transient' (5xx, timeouts, connection) or 'fatal'"""
+    name = type(error).__name__
+    code = _status_code(error)
+    message = str(error).lower()
+    if name in RATE_LIMITED_NAMES or code == 429 or "429" in message or "quota" in message or "rate limit" in message:
+        return "rate_limited"
+    if name in FATAL_NAMES or code in FATAL_CODES:
+        return "fatal"
+    if name in TRANSIENT_NAMES or code in TRANSIENT_CODES or isinstance(error, (ConnectionError, TimeoutError)):
+        return "transient"
+    return "fatal"
+
+
+def retry_after(error):
+    """Server-suggested delay in seconds from the error message, if any"""
+    match = RETRY_HINT.search(str(error))
+    if not match:
+        return None
+    return float(match.group(1) or match.group(2))
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute buckets (None disables a limit)
+
+    With state_path the buckets live in a SQLite row, so every process using the
+    same file draws from the same quota.
+    """
+
+    def __init__(self, requests_per_minute=None, tokens_per_minute=None, state_path=None, name='gemini'):
+        self.rpm = requests_per_minute
+        self.tpm = tokens_per_minute
+        self.name = name
+        self.throttled_seconds = 0.0
+        self._lock = threading.Lock()
+        self._state = {"requests": float(self.rpm or 0), "tokens": float(self.tpm or 0),
+                       "updated": time.time(), "blocked_until": 0.0}
+        self._conn = None
+        if state_path and (self.rpm or self.tpm):
+            directory = os.path.dirname(os.path.abspath(state_path))
+            os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(state_path, timeout=30, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                " name TEXT PRIMARY KEY,"
+                " requests REAL NOT NULL,"
+                " tokens REAL NOT NULL,"
+                " updated REAL NOT NULL,"
+                " blocked_until REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO buckets VALUES (?, ?, ?, ?, ?)",
+                (name, self._state["requests"], self._state["tokens"], self._state["updated"], 0.0)
+            )
+
+    @property
+    def enabled(self):
+        return bool(self.rpm or self.tpm)
+
+    def _transact(self, update):
+        """Run update(state, now) on the refilled shared state and store the result"""
+        with self._lock:
+            now = time.time()
+            if self._conn is None:
+                self._refill(self._state, now)
+                return update(self._state, now)
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT requests, tokens, updated, blocked_until FROM buckets WHERE name = ?", (self.name,)
+                ).fetchone()
+                state = dict(zip(("requests", "tokens", "updated", "blocked_until"), row))
+                self._refill(state, now)
+                result = update(state, now)
+                self._conn.execute(
+                    "UPDATE buckets SET requests = ?, tokens = ?, updated = ?, blocked_until = ? WHERE name = ?",
+                    (state["requests"], state["tokens"], state["updated"], state["blocked_until"], self.name)
+                )
+                self._conn.execute("COMMIT")
+                return result
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _refill(self, state, now):
+        elapsed = max(0.0, now - state["updated"])
+        if self.rpm:
+            state["requests"] = min(float(self.rpm), state["requests"] + elapsed * self.rpm / 60)
+        if self.tpm:
+            state["tokens"] = min(float(self.tpm), state["tokens"] + elapsed * self.tpm / 60)
+        state["updated"] = now
+
+    def acquire(self, tokens=0):
+        """Block until one request and `tokens` tokens are available; returns seconds waited"""
+        if not self.enabled:
+            return 0.0
+        need = min(tokens, self.tpm) if self.tpm else 0
+
+        def take(state, now):
+            if now < state["blocked_until"]:
+                return state["blocked_until"] - now
+            waits = []
+            if self.rpm and state["requests"] < 1:
+                waits.append((1 - state["requests"]) * 60 / self.rpm)
+            if self.tpm and state["tokens"] < need:
+                waits.append((need - state["tokens"]) * 60 / self.tpm)
+            if waits:
+                return max(waits)
+            state["requests"] -= 1 if self.rpm else 0
+            state["tokens"] -= need
+            return 0.0
+
+        started = time.perf_counter()
+        while True:
+            wait = self._transact(take)
+            if not wait:
+                break
+            # Re-check at least every 2s: other processes may return tokens or lift a block
+            time.sleep(min(wait, 2.0))
+        waited = time.perf_counter() - started
+        with self._lock:
+            self.throttled_seconds += waited
+        return waited
+
+    def settle(self, reserved, actual):
+        """Return (or charge) the difference between reserved and actually used tokens"""
+        if not self.tpm:
+            return
+
+        def adjust(state, now):
+            state["tokens"] = min(float(self.tpm), state["tokens"] + reserved - actual)
+
+        self._transact(adjust)
+
+    def block_for(self, seconds):
+        """Pause every user of this quota for `seconds` (after a 429)"""
+        if not self.enabled:
+            return
+
+        def block(state, now):
+            state["blocked_until"] = max(state["blocked_until"], now + seconds)
+
+        self._transact(block)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class RateLimitedModel:
+    """GenerativeModel wrapper: waits for quota, retries classified errors with jittered backoff"""
+
+    def __init__(self, model, limiter, max_retries=5, base_delay=1.0, max_delay=60.0, output_tokens=200):
+        """output_tokens is reserved per call on top of the prompt, corrected from usage metadata"""
+        self.model = model
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.output_tokens = output_tokens
+        self.counters = Counter()
+        self.backoff_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if name == 'model':
+            raise AttributeError(name)
+        return getattr(self.model, name)
+
+    def _count(self, key, seconds=0.0):
+        with self._lock:
+            self.counters[key] += 1
+            self.backoff_seconds += seconds
+
+    def generate_content(self, prompt, **kwargs):
+        """Same as GenerativeModel.generate_content, with rate limiting and retries"""
+        reserved = estimate_tokens(prompt) + self.output_tokens
+        attempt = 0
+        while True:
+            self.limiter.acquire(reserved)
+            self._count("calls")
+            try:
+                response = self.model.generate_content(prompt, **kwargs)
+            except Exception as e:
+                self.limiter.settle(reserved, 0)
+                kind = classify_error(e)
+                self._count(kind)
+                if kind == "fatal":
+                    raise
+                if attempt >= self.max_retries:
+                    self._count("exhausted")
+                    raise RetriesExhausted(kind, attempt, e) from e
+                ceiling = min(self.max_delay, self.base_delay * 2 ** attempt)
+                delay = random.uniform(ceiling / 2, ceiling)
+                if kind == "rate_limited":
+                    delay = max(delay, retry_after(e) or 0)
+                attempt += 1
+                print(f"   ⏳ Gemini {kind.replace('_', ' ')} ({type(e).__name__}), "
+                      f"retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                if kind == "rate_limited" and self.limiter.enabled:
+                    # Everyone sharing the quota backs off, the wait is counted as throttled time
+                    self.limiter.block_for(delay)
+                    self._count("retries")
+                else:
+                    time.sleep(delay)
+                    self._count("retries", delay)
+                continue
+
+            usage = getattr(response, 'usage_metadata', None) if not kwargs.get('stream') else None
+            total = getattr(usage, 'total_token_count', None) if usage is not None else None
+            if total:
+                self.limiter.settle(reserved, total)
+            return response
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self.counters)
+            stats["backoff_seconds"] = round(self.backoff_seconds, 3)
+        stats["throttled_seconds"] = round(self.limiter.throttled_seconds, 3)
+        return stats
+
+    def report(self):
+        """Print retries and time spent throttled"""
+        stats = self.stats()
+        if not any(stats.get(key) for key in ("retries", "fatal", "exhausted")) and not stats["throttled_seconds"]:
+            return
+        print(f"\n🚦 Gemini: {stats.get('calls', 0)} calls, {stats.get('retries', 0)} retries "
+              f"({stats.get('rate_limited', 0)} rate limited, {stats.get('transient', 0)} transient, "
+              f"{stats.get('fatal', 0)} fatal, {stats.get('exhausted', 0)} gave up), throttled {stats['throttled_seconds']:.1f}s, "
+              f"backoff {stats['backoff_seconds']:.1f}s")
+
+    def close(self):
+        self.limiter.close()
+
+
+def create_rate_limited_model(model, config):
+    """Wrap model with the limits and retry policy from config"""
+    rate_config = config.get('rate_limit', {})
+    limiter = RateLimiter(
+        requests_per_minute=rate_config.get('requests_per_minute'),
+        tokens_per_minute=rate_config.get('tokens_per_minute'),
+        state_path=rate_config.get('shared_state'),
+    )
+    return RateLimitedModel(
+        model,
+        limiter,
+        max_retries=rate_config.get('max_retries', 5),
+        base_delay=rate_config.get('base_delay', 1.0),
+        max_delay=rate_config.get('max_delay', 60.0),
+        output_tokens=rate_config.get('output_tokens', 200),
+    )
@@ -0,0 +1,96 @@
+"""
+Dependency-aware answer scheduler
+Context-free questions are sent to Gemini concurrently while the context-dependent
+chain proceeds; answers are still applied to the DOM in form order
+"""
+
+import asyncio
+import contextvars
+import functools
+from rate_limit import RetriesExhausted
+
+
+# Types whose answer does not depend on earlier answers
+DEFAULT_CONTEXT_FREE_TYPES = ["email", "tel", "date", "time", "number"]
+
+
+class AnswerScheduler:
+    """Runs one form section with bounded concurrent Gemini requests"""
+
+    def __init__(self, autofill, max_concurrency=4, context_free_types=None):
+        """Wrap a SmartGoogleFormAutofill instance"""
+        self.autofill = autofill
+        self.max_concurrency = max(1, max_concurrency)
+        self.context_free_types = set(context_free_types or DEFAULT_CONTEXT_FREE_TYPES)
+
+    def is_context_free(self, question_info):
+        return question_info.type in self.context_free_types
+
+    async def _run_blocking(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        # Run in a copy of the current context so tracing spans open here count the call's commands
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(None, functools.partial(context.run, func, *args, **kwargs))
+
+    async def _ask_context_free(self, semaphore, question_info):
+        async with semaphore:
+            return await self._run_blocking(
+                self.autofill.ask_gemini_for_choice,
+                question_info.question,
+                question_info.options,
+                question_info.type,
+                use_context=False
+            )
+
+    async def run_section(self, form_data):
+        """Issue context-free requests up front, then walk the form in order"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        pending = {
+            question.index: asyncio.ensure_future(self._ask_context_free(semaphore, question))
+            for question in form_data
+            if self.is_context_free(question)
+            and self.autofill.job_answer_for(question) is None
+            and self.autofill.local_answer_for(question, count=False) is None
+        }
+        if pending:
+            print(f"\n⚡ {len(pending)} context-free questions requested concurrently")
+
+        try:
+            for question in form_data:
+                task = pending.get(question.index)
+                if task is None:
+                    # Context-dependent: ask with the history built so far, then fill
+                    await self._run_blocking(self.autofill.fill_question, question)
+                    continue
+
+                try:
+                    answer = await task
+                except RetriesExhausted:
+                    raise
+                except Exception as e:
+                    print(f"   ⚠ Concurrent request failed: {e}")
+                    answer = None
+                if answer is not None and await self._run_blocking(self.autofill.fill_question, question, answer):
+                    continue
+                await self._run_blocking(self.autofill.fill_question, question)
+        finally:
+            for task in pending.values():
+                task.cancel()
+            await asyncio.gather(*pending.values(), return_exceptions=True)
+
+    def fill_section(self, form_data):
+        """Blocking entry point used by fill_form_smart"""
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self.run_section(form_data))
+        finally:
+            loop.close()
+
+
+def create_scheduler(autofill, config):
+    """Create AnswerScheduler from config"""
+    return AnswerScheduler(
+        autofill,
+        max_concurrency=config.get('max_concurrent_requests', 4),
+        context_free_types=config.get('context_free_types', DEFAULT_CONTEXT_FREE_TYPES),
+    )
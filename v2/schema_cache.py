@@ -0,0 +1,114 @@
+"""
+Form schema cache
+Persists extracted sections (Question records: text, type, options, matrix rows and
+locators) per form URL and section, validated by an in-page DOM fingerprint
+"""
+
+import hashlib
+import json
+import os
+from form_extractor import extract_form_structure_script
+from question_model import Question
+
+
+# Bumped when the stored question format changes; older files count as misses
+SCHEMA_VERSION = 2
+
+
+# Hash of listitem titles and option labels, computed in the page (FNV-1a, two seeds)
+FINGERPRINT_JS = r"""
+function formFingerprint() {
+    var parts = [];
+    var items = document.querySelectorAll("div[role='listitem']");
+    for (var i = 0; i < items.length; i++) {
+        var title = items[i].querySelector(".M7eMe");
+        parts.push(title ? title.textContent : "");
+        var fields = items[i].querySelectorAll(
+            "div[role='radiogroup'], div[role='radio'], div[role='checkbox'], select, option, input, textarea");
+        for (var f = 0; f < fields.length; f++) {
+            var el = fields[f];
+            parts.push((el.getAttribute("role") || el.tagName) + ":" +
+                (el.getAttribute("data-value") || el.getAttribute("aria-label") ||
+                 el.getAttribute("type") || el.textContent || ""));
+        }
+    }
+    var text = parts.join("␟");
+    function fnv(seed) {
+        var h = seed >>> 0;
+        for (var k = 0; k < text.length; k++) {
+            h ^= text.charCodeAt(k);
+            h = Math.imul(h, 16777619) >>> 0;
+        }
+        return ("0000000" + h.toString(16)).slice(-8);
+    }
+    return items.length + "-" + fnv(2166136261) + fnv(33554467);
+}
+"""
+
+FINGERPRINT_SCRIPT = FINGERPRINT_JS + "return formFingerprint();"
+
+
+class SchemaCache:
+    """Disk cache of section schemas keyed by form URL and section number"""
+
+    def __init__(self, directory='schema_cache'):
+        """Create cache directory if needed"""
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.counters = {"hits": 0, "misses": 0, "invalidated": 0}
+
+    def _path(self, form_url, section):
+        key = hashlib.sha1(f"{form_url}#{section}".encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _read(self, form_url, section):
+        try:
+            with open(self._path(form_url, section), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, form_url, section, schema):
+        path = self._path(form_url, section)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(schema, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def load_section(self, driver, form_url, section):
+        """Return the section's Question list, from cache when the DOM fingerprint still matches"""
+        cached = self._read(form_url, section)
+        if cached and cached.get('version') != SCHEMA_VERSION:
+            cached = None
+        fingerprint = driver.execute_script(FINGERPRINT_SCRIPT)
+
+        if cached and cached['fingerprint'] == fingerprint:
+            self.counters["hits"] += 1
+            print(f"⚡ Form schema cache hit ({len(cached['questions'])} questions)")
+            return [Question.from_dict(q) for q in cached['questions']]
+
+        if cached:
+            self.counters["invalidated"] += 1
+            print("🔄 Form changed since last run, re-analyzing")
+        else:
+            self.counters["misses"] += 1
+
+        form_data = extract_form_structure_script(driver)
+        if form_data:
+            self._write(form_url, section, {
+                "version": SCHEMA_VERSION,
+                "fingerprint": fingerprint,
+                "questions": [q.to_dict() for q in form_data],
+            })
+        return form_data
+
+    def stats(self):
+        return dict(self.counters)
+
+
+def create_schema_cache(config):
+    """Create SchemaCache from config (None when disabled)"""
+    schema_config = config.get('schema_cache', {})
+    if not schema_config.get('enabled', False):
+        return None
+    return SchemaCache(schema_config.get('directory', 'schema_cache'))
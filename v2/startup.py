@@ -0,0 +1,104 @@
+"""
+Startup phases
+Runs slow startup work (Chrome launch, Gemini client import) on background threads
+while config and job are loaded, and reports how long each phase took
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+# Taken when main.py imports this module first, i.e. right after interpreter start
+PROCESS_STARTED = time.perf_counter()
+
+
+class _Task:
+    """One background phase: its thread, result or error"""
+
+    __slots__ = ("thread", "value", "error")
+
+    def __init__(self):
+        self.thread = None
+        self.value = None
+        self.error = None
+
+
+class Startup:
+    """Timed startup phases, foreground (with blocks) or background (threads joined on demand)"""
+
+    def __init__(self):
+        self.phases = []  # (name, seconds, background)
+        self.waited = 0.0
+        self.milestones = {}
+        self._tasks = {}
+        self._lock = threading.Lock()
+
+    def _add(self, name, seconds, background):
+        with self._lock:
+            self.phases.append((name, seconds, background))
+
+    @contextmanager
+    def phase(self, name):
+        """Time a foreground phase"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add(name, time.perf_counter() - started, False)
+
+    def background(self, name, function, *args):
+        """Start function(*args) as phase `name`; collect its return value with result(name)"""
+        task = _Task()
+
+        def run():
+            started = time.perf_counter()
+            try:
+                task.value = function(*args)
+            except BaseException as e:
+                task.error = e
+            finally:
+                self._add(name, time.perf_counter() - started, True)
+
+        self._tasks[name] = task
+        task.thread = threading.Thread(target=run, name=f"startup-{name}", daemon=True)
+        task.thread.start()
+
+    def result(self, name):
+        """Wait for background phase `name`; returns its value or re-raises its error"""
+        task = self._tasks[name]
+        if task.thread.is_alive():
+            started = time.perf_counter()
+            task.thread.join()
+            self.waited += time.perf_counter() - started
+        if task.error is not None:
+            raise task.error
+        return task.value
+
+    def settle(self, name):
+        """Like result(name), but None when the phase failed or was never started (for cleanup)"""
+        if name not in self._tasks:
+            return None
+        try:
+            return self.result(name)
+        except Exception:
+            return None
+
+    def mark(self, name):
+        """Record a milestone (seconds since process start), first call wins"""
+        with self._lock:
+            self.milestones.setdefault(name, time.perf_counter() - PROCESS_STARTED)
+
+    def report(self):
+        """Print phase timings and milestones"""
+        with self._lock:
+            phases = list(self.phases)
+            milestones = dict(self.milestones)
+        if not phases:
+            return
+        parts = ", ".join(
+            f"{name} {seconds:.2f}s{' (background)' if background else ''}" for name, seconds, background in phases
+        )
+        print(f"\n🚀 Startup: {parts}; waited {self.waited:.2f}s for background work")
+        for name, seconds in sorted(milestones.items(), key=lambda item: item[1]):
+            print(f"   ⏱  {name} after {seconds:.2f}s")
+
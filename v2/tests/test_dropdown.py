@@ -0,0 +1,105 @@
+"""
+Dropdown filling
+The "Choose" placeholder is not one of the question's options, so the answer number
+must be mapped to the <option> position before selecting it
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import SmartGoogleFormAutofill  # noqa: E402
+from question_model import Handles, Option, Question  # noqa: E402
+
+
+class FakeOption:
+    """<option> as seen by selenium's Select"""
+
+    tag_name = "option"
+
+    def __init__(self, select, position, text):
+        self.select = select
+        self.position = position
+        self.text = text
+
+    def get_attribute(self, name):
+        return str(self.position) if name == "index" else None
+
+    def get_dom_attribute(self, name):
+        return None
+
+    def is_enabled(self):
+        return True
+
+    def is_selected(self):
+        return self.select.selected == self.position
+
+    def click(self):
+        self.select.selected = self.position
+
+
+class FakeSelect:
+    """<select> with a placeholder first option"""
+
+    tag_name = "select"
+
+    def __init__(self, texts):
+        self.selected = 0
+        self.options = [FakeOption(self, position, text) for position, text in enumerate(texts)]
+
+    def get_dom_attribute(self, name):
+        return None
+
+    def get_attribute(self, name):
+        return None
+
+    def find_elements(self, by, value):
+        return list(self.options)
+
+
+class FakeItem:
+    """Question listitem holding the <select>"""
+
+    def __init__(self, select):
+        self.select = select
+
+    def find_element(self, by, value):
+        return self.select
+
+
+class FakeWaiter:
+    def pace(self, name):
+        pass
+
+
+class DropdownTest(unittest.TestCase):
+    def setUp(self):
+        self.autofill = SmartGoogleFormAutofill.__new__(SmartGoogleFormAutofill)
+        self.autofill.answer_history = []
+        self.autofill.waiter = FakeWaiter()
+        self.select = FakeSelect(["Choose", "Hanoi", "Ho Chi Minh City", "Da Nang"])
+        self.question = Question(1, "City", "dropdown", options=[
+            Option("Hanoi", "Hanoi", 1),
+            Option("Ho Chi Minh City", "Ho Chi Minh City", 2),
+            Option("Da Nang", "Da Nang", 3),
+        ])
+        self.question.handles = Handles(FakeItem(self.select), self.select.options[1:])
+
+    def test_first_option_skips_placeholder(self):
+        self.assertTrue(self.autofill._fill_question(self.question, "1"))
+        self.assertEqual(self.select.options[self.select.selected].text, "Hanoi")
+        self.assertEqual(self.autofill.answer_history[-1]["answer"], "Hanoi")
+
+    def test_last_option(self):
+        self.assertTrue(self.autofill._fill_question(self.question, "3"))
+        self.assertEqual(self.select.options[self.select.selected].text, "Da Nang")
+
+    def test_out_of_range_answer_selects_nothing(self):
+        self.assertFalse(self.autofill._fill_question(self.question, "4"))
+        self.assertEqual(self.select.selected, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()